@@ -25,7 +25,9 @@ from tarantool.error import (
 
 from tarantool.schema import (
     Schema,
-    SchemaError
+    SchemaCache,
+    SchemaError,
+    SchemaRegistry,
 )
 
 from tarantool.utils import (
@@ -41,9 +43,17 @@ from tarantool.msgpack_ext.types.interval import (
     Interval,
 )
 
+from tarantool.msgpack_ext.types.uuid import (
+    RawUUID,
+)
+
+from tarantool.msgpack_ext.registry import ExtTypeRegistry
+
 from tarantool.connection_pool import ConnectionPool, Mode
 
-from tarantool.types import BoxError
+from tarantool.sharded_pool import ShardedConnectionPool
+
+from tarantool.types import BoxError, CompiledOps, Packed
 
 try:
     from tarantool.version import __version__
@@ -142,4 +152,6 @@ def connectmesh(addrs=({'host': 'localhost', 'port': 3301},), user=None,
 __all__ = ['connect', 'Connection', 'connectmesh', 'MeshConnection', 'Schema',
            'Error', 'DatabaseError', 'NetworkError', 'NetworkWarning',
            'SchemaError', 'dbapi', 'Datetime', 'Interval', 'IntervalAdjust',
-           'ConnectionPool', 'Mode', 'BoxError']
+           'ConnectionPool', 'ShardedConnectionPool', 'Mode', 'BoxError', 'RawUUID',
+           'ExtTypeRegistry', 'Packed', 'CompiledOps', 'SchemaCache',
+           'SchemaRegistry']
@@ -20,6 +20,7 @@ import ctypes
 import ctypes.util
 from ctypes import c_ssize_t
 from typing import Optional, Union
+from collections.abc import Mapping
 from copy import copy
 
 import msgpack
@@ -42,6 +43,7 @@ from tarantool.request import (
     RequestAuthenticate,
     RequestExecute,
     RequestProtocolVersion,
+    RequestWatchOnce,
 )
 from tarantool.space import Space
 from tarantool.const import (
@@ -73,6 +75,8 @@ from tarantool.const import (
     AUTH_TYPE_CHAP_SHA1,
     AUTH_TYPE_PAP_SHA256,
     AUTH_TYPES,
+    SCHEMA_PRELOAD_ALL,
+    SCHEMA_PRELOAD_MODES,
 )
 from tarantool.error import (
     Error,
@@ -92,9 +96,11 @@ from tarantool.error import (
     CrudModuleError,
     CrudModuleManyError,
     SchemaReloadException,
+    SchemaCacheWarning,
     warn
 )
-from tarantool.schema import Schema
+from tarantool.schema import Schema, SchemaCache
+from tarantool.types import CompiledOps, Packed
 from tarantool.utils import (
     greeting_decode,
     version_id,
@@ -106,6 +112,8 @@ from tarantool.crud import (
     CrudError,
     call_crud,
 )
+from tarantool.msgpack_ext.registry import ExtTypeRegistry
+import tarantool.msgpack_ext.uuid as ext_uuid
 
 WWSAEWOULDBLOCK = 10035
 ER_UNKNOWN_REQUEST_TYPE = 48
@@ -613,7 +621,13 @@ class Connection(ConnectionInterface):
                  auth_type=None,
                  fetch_schema=True,
                  required_protocol_version=None,
-                 required_features=None):
+                 required_features=None,
+                 raw_uuid=False,
+                 ext_types=None,
+                 varbinary_memoryview=False,
+                 schema_preload=SCHEMA_PRELOAD_ALL,
+                 schema_cache=None,
+                 schema_registry=None):
         """
         :param host: Server hostname or IP address. Use ``None`` for
             Unix sockets.
@@ -780,6 +794,14 @@ class Connection(ConnectionInterface):
             :meth:`~tarantool.Connection.update`,
             :meth:`~tarantool.Connection.select`,
             :meth:`~tarantool.Connection.space`.
+            If the server supports
+            :data:`~tarantool.const.IPROTO_FEATURE_SPACE_AND_INDEX_NAMES`
+            (Tarantool 3.0 and newer), space requests except
+            :meth:`~tarantool.Connection.space` remain available:
+            space and index names are sent as is and resolved by the
+            server, so no schema requests are made and no schema is
+            stored. Field name mappings as tuples or keys are not
+            supported in this case.
         :type fetch_schema: :obj:`bool`, optional
 
         :param required_protocol_version: Minimal protocol version that
@@ -790,6 +812,76 @@ class Connection(ConnectionInterface):
             should be supported by Tarantool server.
         :type required_features: :obj:`list` or :obj:`None`, optional
 
+        :param raw_uuid: If ``True``, unpack MessagePack UUID extension
+            type to :class:`~tarantool.RawUUID` instead of
+            :class:`uuid.UUID`. Both types are supported on encode.
+
+            If non-default
+            :paramref:`~tarantool.Connection.unpacker_factory` option is
+            used,
+            :paramref:`~tarantool.Connection.raw_uuid` option value is
+            ignored on decode until the factory explicitly uses its
+            value.
+        :type raw_uuid: :obj:`bool`, optional
+
+        :param ext_types: MessagePack extension type codecs. If
+            ``None``, a new registry with built-in codecs is created.
+            A passed registry is used as is, so it could be shared
+            between several connections. The registry is available
+            as :attr:`~tarantool.Connection.ext_types`.
+
+            If non-default
+            :paramref:`~tarantool.Connection.packer_factory` or
+            :paramref:`~tarantool.Connection.unpacker_factory` option is
+            used, :paramref:`~tarantool.Connection.ext_types` option
+            value is ignored until the factory explicitly uses its
+            value.
+        :type ext_types: :class:`~tarantool.ExtTypeRegistry` or
+            :obj:`None`, optional
+
+        :param varbinary_memoryview: If ``True``, unpack `mp_bin`_
+            values of response data tuples (and response data
+            values) to read-only :obj:`memoryview` objects
+            referencing the received packet buffer instead of
+            :obj:`bytes` copies. Nested values are unpacked as usual.
+            Large blobs could be written to a file or a socket without
+            extra copies, but each view keeps the whole packet buffer
+            alive, so copy small values that are stored for a long
+            time with :obj:`bytes`. Requires ``msgpack>=1.0.0``.
+        :type varbinary_memoryview: :obj:`bool`, optional
+
+        :param schema_preload: Schema loading mode. If ``"all"``, all
+            spaces and indexes schema is loaded with two requests on
+            connect and on each schema reload, so later space, index
+            and field lookups do not require requests to the server.
+            If ``None``, space and index schema is fetched on first
+            access with a request per space or index, which suits
+            better for servers with a lot of spaces when only a few
+            of them are used. Ignored if
+            :paramref:`~tarantool.Connection.params.fetch_schema` is
+            ``False``.
+        :type schema_preload: :obj:`str` or :obj:`None`, optional
+
+        :param schema_cache: Path to a schema cache file, see
+            :class:`~tarantool.schema.SchemaCache`. If set, the
+            connection requests the instance schema version on
+            schema load and builds the schema from the cache if it
+            has an entry for the instance UUID, the user and the
+            version.
+            Otherwise, the fetched schema is stored to the cache.
+            Used only with ``schema_preload="all"``.
+        :type schema_cache: :obj:`str` or :class:`os.PathLike` or
+            :class:`~tarantool.schema.SchemaCache` or :obj:`None`,
+            optional
+
+        :param schema_registry: Registry to share spaces and indexes
+            schema with other connections to the same instance with
+            the same user, see
+            :class:`~tarantool.schema.SchemaRegistry`.
+            Used only with ``schema_preload="all"``.
+        :type schema_registry: :class:`~tarantool.schema.SchemaRegistry`
+            or :obj:`None`, optional
+
         :raise: :exc:`~tarantool.error.ConfigurationError`,
             :meth:`~tarantool.Connection.connect` exceptions
 
@@ -804,6 +896,12 @@ class Connection(ConnectionInterface):
             raise ConfigurationError("msgpack>=1.0.0 only supports None and "
                                      + "'utf-8' encoding option values")
 
+        if schema_preload not in SCHEMA_PRELOAD_MODES:
+            raise ConfigurationError(f"Unknown schema_preload mode {schema_preload!r}")
+
+        if msgpack.version < (1, 0, 0) and varbinary_memoryview:
+            raise ConfigurationError("varbinary_memoryview option requires msgpack>=1.0.0")
+
         if os.name == 'nt':
             libc = ctypes.WinDLL(
                 ctypes.util.find_library('Ws2_32'), use_last_error=True
@@ -822,13 +920,33 @@ class Connection(ConnectionInterface):
         self.reconnect_delay = reconnect_delay
         self.reconnect_max_attempts = reconnect_max_attempts
         self.fetch_schema = fetch_schema
+        self.schema_preload = schema_preload
+        if schema_cache is not None and not isinstance(schema_cache, SchemaCache):
+            schema_cache = SchemaCache(schema_cache)
+        self.schema_cache = schema_cache
+        self.schema_registry = schema_registry
         self.schema = None
         self.schema_version = 0
+        self._schema_loading = False
         self._socket = None
         self.connected = False
         self.error = True
         self.encoding = encoding
         self.use_list = use_list
+        self.raw_uuid = raw_uuid
+        if ext_types is None:
+            ext_types = ExtTypeRegistry()
+        if raw_uuid:
+            # Do not affect other connections which share the registry.
+            ext_types = ext_types.copy()
+            ext_types.register(ext_uuid.EXT_ID, decode=ext_uuid.decode_raw)
+        self.ext_types = ext_types
+        """
+        MessagePack extension type codecs used by the connection.
+
+        :type: :class:`~tarantool.ExtTypeRegistry`
+        """
+        self.varbinary_memoryview = varbinary_memoryview
         self.call_16 = call_16
         self.connection_timeout = connection_timeout
         self.transport = transport
@@ -1111,15 +1229,18 @@ class Connection(ConnectionInterface):
         :type to_read: :obj:`int`
 
         :return: Buffer with read data
-        :rtype: :obj:`bytes`
+        :rtype: :obj:`bytearray`
 
         :meta private:
         """
 
-        buf = b""
+        # Read directly into the result buffer to avoid copying the
+        # data on each chunk.
+        buf = bytearray(to_read)
+        view = memoryview(buf)
         while to_read > 0:
             try:
-                tmp = self._socket.recv(to_read)
+                received = self._socket.recv_into(view[-to_read:], to_read)
             except OverflowError as exc:
                 self._socket.close()
                 err = socket.error(
@@ -1134,14 +1255,14 @@ class Connection(ConnectionInterface):
                 )
                 raise NetworkError(err) from exc
 
-            if len(tmp) == 0:
+            if received == 0:
                 err = socket.error(
                     errno.ECONNRESET,
                     "Lost connection to server during query"
                 )
                 raise NetworkError(err)
-            to_read -= len(tmp)
-            buf += tmp
+            to_read -= received
+        view.release()
         return buf
 
     def _read_response(self):
@@ -1200,6 +1321,13 @@ class Connection(ConnectionInterface):
                 on_push(response.data, on_push_ctx)
             response = request.response_class(self, self._read_response())
 
+        # Refresh schema proactively instead of waiting for the
+        # server to reject a request with an outdated schema version.
+        if (self.schema is not None and not self._schema_loading
+                and response.schema_version is not None
+                and response.schema_version > self.schema_version):
+            self.update_schema(response.schema_version)
+
         return response
 
     def _opt_reconnect(self):
@@ -1302,9 +1430,18 @@ class Connection(ConnectionInterface):
 
         return self._send_request_wo_reconnect(request, on_push, on_push_ctx)
 
-    def load_schema(self):
+    def load_schema(self, schema_version=None):
         """
-        Fetch space and index schema.
+        Fetch space and index schema, if
+        :paramref:`~tarantool.Connection.params.schema_preload` is
+        enabled. Otherwise, schema is fetched on first access.
+
+        If the schema is already loaded, only changed spaces are
+        rebuilt, see :meth:`~tarantool.schema.Schema.load_rows`.
+
+        :param schema_version: Current instance schema version, if
+            known from a response.
+        :type schema_version: :obj:`int`, optional
 
         :raise: :exc:`~tarantool.error.SchemaError`,
             :exc:`~tarantool.error.DatabaseError`
@@ -1312,12 +1449,102 @@ class Connection(ConnectionInterface):
         :meta private:
         """
 
-        self.schema.fetch_space_all()
-        self.schema.fetch_index_all()
+        if self.schema_preload != SCHEMA_PRELOAD_ALL:
+            return
+
+        schema_loading = self._schema_loading
+        self._schema_loading = True
+        try:
+            schema_version = self._load_schema_shared(schema_version)
+        finally:
+            self._schema_loading = schema_loading
+
+        if schema_version is not None:
+            self.schema_version = schema_version
+
+    def _load_schema_shared(self, schema_version=None):
+        """
+        Load space and index schema from the schema registry, if
+        possible.
+
+        :param schema_version: Current instance schema version. If
+            :obj:`None` and a schema cache or registry is used, it is
+            requested with a ping.
+        :type schema_version: :obj:`int`, optional
+
+        :return: Schema version of the loaded data or :obj:`None`, if
+            the schema has changed during the fetch.
+        :rtype: :obj:`int` or :obj:`None`
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        if self.schema_cache is None and self.schema_registry is None:
+            return self._load_schema_version(None)
+
+        if schema_version is None:
+            schema_version = self._send_request_wo_reconnect(RequestPing(self)).schema_version
+        if self.schema_registry is None:
+            return self._load_schema_version(schema_version)
+
+        registry = self.schema_registry
+        with registry.loading(self, schema_version):
+            shared = registry.get(self, schema_version)
+            if shared is not None:
+                self.schema.schema = shared
+                return schema_version
+
+            loaded_version = self._load_schema_version(schema_version)
+            if loaded_version is not None:
+                registry.put(self, loaded_version, self.schema.schema)
+            return loaded_version
+
+    def _load_schema_version(self, schema_version):
+        """
+        Load space and index schema from the schema cache or fetch it
+        and store to the schema cache.
+
+        :param schema_version: Current instance schema version.
+            :obj:`None`, if the schema cache is not used.
+        :type schema_version: :obj:`int` or :obj:`None`
+
+        :return: Schema version of the loaded data or :obj:`None`, if
+            the schema has changed during the fetch.
+        :rtype: :obj:`int` or :obj:`None`
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        if self.schema_cache is not None:
+            cached = self.schema_cache.load(self, schema_version)
+            if cached is not None:
+                try:
+                    self.schema.load_rows(*cached)
+                    return schema_version
+                except (LookupError, TypeError, SchemaError) as exc:
+                    warn(f"Ignoring malformed schema cache entry: {exc}", SchemaCacheWarning)
+
+        space_rows = self.schema.fetch_space_from(None)
+        index_rows = self.schema.fetch_index_from(None, None)
+        self.schema.load_rows(space_rows, index_rows)
+        if space_rows.schema_version != index_rows.schema_version:
+            return None
+
+        if self.schema_cache is not None:
+            self.schema_cache.store(self, space_rows.schema_version, space_rows, index_rows)
+        return space_rows.schema_version
 
     def update_schema(self, schema_version):
         """
         Set new schema version metainfo, reload space and index schema.
+        With ``schema_preload="all"``, only changed spaces are rebuilt.
+        Otherwise, schema is flushed and fetched again on access.
 
         :param schema_version: New schema version metainfo.
         :type schema_version: :obj:`int`
@@ -1332,7 +1559,10 @@ class Connection(ConnectionInterface):
             self.schema = Schema(self)
 
         self.schema_version = schema_version
-        self.flush_schema()
+        if self.schema_preload == SCHEMA_PRELOAD_ALL:
+            self.load_schema(schema_version)
+        else:
+            self.schema.flush()
 
     def flush_schema(self):
         """
@@ -1358,6 +1588,20 @@ class Connection(ConnectionInterface):
             raise NotSupportedError('This method is not available in '
                                     'connection opened with fetch_schema=False')
 
+    def _dml_connection_check(self):
+        """
+        Checks whether the connection could send space requests.
+        A schemaless connection sends space and index names as is if
+        the server supports
+        :data:`~tarantool.const.IPROTO_FEATURE_SPACE_AND_INDEX_NAMES`,
+        otherwise an exception is thrown like in
+        :meth:`_schemaful_connection_check`.
+
+        :raise: :exc:`~tarantool.error.NotSupportedError`
+        """
+        if not self._features[IPROTO_FEATURE_SPACE_AND_INDEX_NAMES]:
+            self._schemaful_connection_check()
+
     def call(self, func_name, *args, on_push=None, on_push_ctx=None):
         """
         Execute a CALL request: call a stored Lua function.
@@ -1365,7 +1609,8 @@ class Connection(ConnectionInterface):
         :param func_name: Stored Lua function name.
         :type func_name: :obj:`str`
 
-        :param args: Stored Lua function arguments.
+        :param args: Stored Lua function arguments. Arguments may be
+            :class:`~tarantool.Packed`.
         :type args: :obj:`tuple`
 
         :param on_push: Сallback for processing out-of-band messages.
@@ -1401,7 +1646,8 @@ class Connection(ConnectionInterface):
         :param expr: Lua expression.
         :type expr: :obj:`str`
 
-        :param args: Lua expression arguments.
+        :param args: Lua expression arguments. Arguments may be
+            :class:`~tarantool.Packed`.
         :type args: :obj:`tuple`
 
         :param on_push: Сallback for processing out-of-band messages.
@@ -1440,8 +1686,13 @@ class Connection(ConnectionInterface):
         :param space_name: Space name or space id.
         :type space_name: :obj:`str` or :obj:`int`
 
-        :param values: Tuple to be replaced.
-        :type values: :obj:`tuple` or :obj:`list`
+        :param values: Tuple to be replaced. Whole record or its fields
+            may be :class:`~tarantool.Packed`. A mapping of field
+            names to values is converted to a tuple with respect to
+            the space format, see
+            :meth:`~tarantool.schema.SchemaSpace.tuple_from_dict`.
+        :type values: :obj:`tuple` or :obj:`list` or :obj:`dict` or
+            :class:`~tarantool.Packed`
 
         :param on_push: Сallback for processing out-of-band messages.
         :type on_push: :obj:`function`, optional
@@ -1461,9 +1712,12 @@ class Connection(ConnectionInterface):
         .. _replace: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/replace/
         """
 
-        self._schemaful_connection_check()
+        self._dml_connection_check()
 
-        if isinstance(space_name, str):
+        if isinstance(values, Mapping):
+            self._schemaful_connection_check()
+            values = self.schema.get_space(space_name).tuple_from_dict(values)
+        if isinstance(space_name, str) and self.schema is not None:
             space_name = self.schema.get_space(space_name).sid
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
@@ -1539,13 +1793,77 @@ class Connection(ConnectionInterface):
         return auth_type
 
     def _ops_process(self, space, update_ops):
-        new_ops = []
-        for operation in update_ops:
-            if isinstance(operation[1], str):
-                operation = list(operation)
-                operation[1] = self.schema.get_field(space, operation[1])['id']
-            new_ops.append(operation)
-        return new_ops
+        if isinstance(update_ops, CompiledOps):
+            if self.schema is None:
+                return update_ops
+            # Space schema may have changed since compilation.
+            return update_ops.compiled_for(self.schema.get_space(space),
+                                           lambda: self.compile_ops(space, update_ops.ops))
+        if self.schema is None:
+            # Server resolves field names itself.
+            return update_ops
+        return self.schema.get_space(space).resolve_ops(update_ops)
+
+    def _check_key(self, space, index, key, exact=False):
+        """
+        Check a key with index schema locally, see
+        :meth:`~tarantool.schema.SchemaIndex.check_key`. Keys are
+        checked only if the index schema is already loaded and the
+        connection uses the default packer, since a custom one may
+        encode values differently.
+
+        :param space: Space id.
+        :type space: :obj:`int`
+
+        :param index: Index id.
+        :type index: :obj:`int`
+
+        :param key: Index key.
+        :type key: :obj:`list`
+
+        :param exact: ``True`` if the key is used for an exact match.
+        :type exact: :obj:`bool`, optional
+
+        :raise: :exc:`~tarantool.error.DatabaseError`
+        """
+
+        if self.schema is None or self._packer_factory_impl is not default_packer_factory:
+            return
+        index_schema = self.schema.find_index(space, index)
+        if index_schema is not None:
+            index_schema.check_key(key, self.encoding, self.ext_types.encoders, exact)
+
+    def compile_ops(self, space_name, op_list):
+        """
+        Prepare update operations to send them in many
+        :meth:`~tarantool.Connection.update` and
+        :meth:`~tarantool.Connection.upsert` requests: field names are
+        resolved to field ids and the operation list is encoded once.
+        Operations are compiled again on first use after the space
+        schema change.
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :param op_list: Refer to :meth:`~tarantool.Connection.update`
+            :paramref:`~tarantool.Connection.update.params.op_list`.
+        :type op_list: :obj:`tuple` or :obj:`list`
+
+        :rtype: :class:`~tarantool.CompiledOps`
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NotSupportedError`
+        """
+
+        self._dml_connection_check()
+
+        if self.schema is None:
+            space = None
+            resolved_ops = op_list
+        else:
+            space = self.schema.get_space(space_name)
+            resolved_ops = space.resolve_ops(op_list)
+        return CompiledOps(self._packer_factory().pack(resolved_ops), op_list, space)
 
     def insert(self, space_name, values, *, on_push=None, on_push_ctx=None):
         """
@@ -1556,8 +1874,13 @@ class Connection(ConnectionInterface):
         :param space_name: Space name or space id.
         :type space_name: :obj:`str` or :obj:`int`
 
-        :param values: Record to be inserted.
-        :type values: :obj:`tuple` or :obj:`list`
+        :param values: Record to be inserted. Whole record or its fields
+            may be :class:`~tarantool.Packed`. A mapping of field
+            names to values is converted to a tuple with respect to
+            the space format, see
+            :meth:`~tarantool.schema.SchemaSpace.tuple_from_dict`.
+        :type values: :obj:`tuple` or :obj:`list` or :obj:`dict` or
+            :class:`~tarantool.Packed`
 
         :param on_push: Сallback for processing out-of-band messages.
         :type on_push: :obj:`function`, optional
@@ -1577,9 +1900,12 @@ class Connection(ConnectionInterface):
         .. _insert: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/insert/
         """
 
-        self._schemaful_connection_check()
+        self._dml_connection_check()
 
-        if isinstance(space_name, str):
+        if isinstance(values, Mapping):
+            self._schemaful_connection_check()
+            values = self.schema.get_space(space_name).tuple_from_dict(values)
+        if isinstance(space_name, str) and self.schema is not None:
             space_name = self.schema.get_space(space_name).sid
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
@@ -1594,7 +1920,9 @@ class Connection(ConnectionInterface):
         :param space_name: Space name or space id.
         :type space_name: :obj:`str` or :obj:`int`
 
-        :param key: Key of a tuple to be deleted.
+        :param key: Key of a tuple to be deleted. A mapping of field
+            names to values is converted to a key, see
+            :meth:`~tarantool.schema.SchemaIndex.key_from_dict`.
 
         :param index: Index name or index id. If you're using a
             secondary index, it must be unique. Defaults to primary
@@ -1619,13 +1947,17 @@ class Connection(ConnectionInterface):
         .. _delete: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/delete/
         """
 
-        self._schemaful_connection_check()
+        self._dml_connection_check()
 
+        if isinstance(key, Mapping):
+            self._schemaful_connection_check()
+            key = self.schema.get_index(space_name, index).key_from_dict(key)
         key = wrap_key(key)
-        if isinstance(space_name, str):
+        if isinstance(space_name, str) and self.schema is not None:
             space_name = self.schema.get_space(space_name).sid
-        if isinstance(index, str):
+        if isinstance(index, str) and self.schema is not None:
             index = self.schema.get_index(space_name, index).iid
+        self._check_key(space_name, index, key, exact=True)
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
 
@@ -1651,12 +1983,15 @@ class Connection(ConnectionInterface):
         :param space_name: Space name or space id.
         :type space_name: :obj:`str` or :obj:`int`
 
-        :param tuple_value: Tuple to be upserted.
-        :type tuple_value: :obj:`tuple` or :obj:`list`
+        :param tuple_value: Tuple to be upserted. A mapping of field
+            names to values is converted to a tuple, see
+            :meth:`~tarantool.schema.SchemaSpace.tuple_from_dict`.
+        :type tuple_value: :obj:`tuple` or :obj:`list` or :obj:`dict`
 
         :param op_list: Refer to :meth:`~tarantool.Connection.update`
             :paramref:`~tarantool.Connection.update.params.op_list`.
-        :type op_list: :obj:`tuple` or :obj:`list`
+        :type op_list: :obj:`tuple` or :obj:`list` or
+            :class:`~tarantool.CompiledOps`
 
         :param index: Index name or index id. If you're using a
             secondary index, it must be unique. Defaults to primary
@@ -1681,11 +2016,14 @@ class Connection(ConnectionInterface):
         .. _upsert: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/upsert/
         """
 
-        self._schemaful_connection_check()
+        self._dml_connection_check()
 
-        if isinstance(space_name, str):
+        if isinstance(tuple_value, Mapping):
+            self._schemaful_connection_check()
+            tuple_value = self.schema.get_space(space_name).tuple_from_dict(tuple_value)
+        if isinstance(space_name, str) and self.schema is not None:
             space_name = self.schema.get_space(space_name).sid
-        if isinstance(index, str):
+        if isinstance(index, str) and self.schema is not None:
             index = self.schema.get_index(space_name, index).iid
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
@@ -1702,7 +2040,9 @@ class Connection(ConnectionInterface):
         :param space_name: Space name or space id.
         :type space_name: :obj:`str` or :obj:`int`
 
-        :param key: Key of a tuple to be updated.
+        :param key: Key of a tuple to be updated. A mapping of field
+            names to values is converted to a key, see
+            :meth:`~tarantool.schema.SchemaIndex.key_from_dict`.
 
         :param op_list: The list of operations to update individual
             fields. Each operation is a :obj:`tuple` of three (or more)
@@ -1747,7 +2087,13 @@ class Connection(ConnectionInterface):
                 # Delete two fields, starting with the second field
                 [('#', 2, 2)]
 
-        :type op_list: :obj:`tuple` or :obj:`list`
+            Field names are resolved to field ids with a cache by
+            operation fields sequence. Operations sent many times
+            may be prepared with
+            :meth:`~tarantool.Connection.compile_ops`.
+
+        :type op_list: :obj:`tuple` or :obj:`list` or
+            :class:`~tarantool.CompiledOps`
 
         :param index: Index name or index id. If you're using a
             secondary index, it must be unique. Defaults to primary
@@ -1772,13 +2118,17 @@ class Connection(ConnectionInterface):
         .. _update: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/update/
         """
 
-        self._schemaful_connection_check()
+        self._dml_connection_check()
 
+        if isinstance(key, Mapping):
+            self._schemaful_connection_check()
+            key = self.schema.get_index(space_name, index).key_from_dict(key)
         key = wrap_key(key)
-        if isinstance(space_name, str):
+        if isinstance(space_name, str) and self.schema is not None:
             space_name = self.schema.get_space(space_name).sid
-        if isinstance(index, str):
+        if isinstance(index, str) and self.schema is not None:
             index = self.schema.get_index(space_name, index).iid
+        self._check_key(space_name, index, key, exact=True)
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
 
@@ -1814,6 +2164,39 @@ class Connection(ConnectionInterface):
             return "Success"
         return finish_time - start_time
 
+    def watch_once(self, key):
+        """
+        Execute a WATCH_ONCE request: get the current value of
+        a `watch`_ notification key (like ``'box.status'``) without
+        subscribing to it. The request is lighter than calling a Lua
+        function and requires no privileges.
+
+        Requires the server to support
+        :data:`~tarantool.const.IPROTO_FEATURE_WATCH_ONCE` (Tarantool
+        3.0 and newer).
+
+        :param key: Notification key.
+        :type key: :obj:`str`
+
+        :return: Key value or ``None`` if the key is not set.
+
+        :raise: :exc:`~AssertionError`,
+            :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`,
+            :exc:`~tarantool.error.NotSupportedError`
+
+        .. _watch: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_events/
+        """
+
+        if not self._features[IPROTO_FEATURE_WATCH_ONCE]:
+            raise NotSupportedError('WATCH_ONCE request is not supported by the server')
+
+        response = self._send_request(RequestWatchOnce(self, key))
+        if not response.data:
+            return None
+        return response.data[0]
+
     def select(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None,
                on_push=None, on_push_ctx=None):
         """
@@ -1822,7 +2205,9 @@ class Connection(ConnectionInterface):
         :param space_name: Space name or space id.
         :type space_name: :obj:`str` or :obj:`int`
 
-        :param key: Key of a tuple to be selected.
+        :param key: Key of a tuple to be selected. A mapping of field
+            names to values is converted to a key, see
+            :meth:`~tarantool.schema.SchemaIndex.key_from_dict`.
         :type key: optional
 
         :param offset: Number of tuples to skip.
@@ -1962,7 +2347,11 @@ class Connection(ConnectionInterface):
         .. _select: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/select/
         """
 
-        self._schemaful_connection_check()
+        self._dml_connection_check()
+
+        if isinstance(key, Mapping):
+            self._schemaful_connection_check()
+            key = self.schema.get_index(space_name, index).key_from_dict(key)
 
         if iterator is None:
             iterator = ITERATOR_EQ
@@ -1974,10 +2363,11 @@ class Connection(ConnectionInterface):
         # tuples)
         key = wrap_key(key, select=True)
 
-        if isinstance(space_name, str):
+        if isinstance(space_name, str) and self.schema is not None:
             space_name = self.schema.get_space(space_name).sid
-        if isinstance(index, str):
+        if isinstance(index, str) and self.schema is not None:
             index = self.schema.get_index(space_name, index).iid
+        self._check_key(space_name, index, key)
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
 
@@ -2003,6 +2393,19 @@ class Connection(ConnectionInterface):
 
         return Space(self, space_name)
 
+    def pack(self, value):
+        """
+        Encode a value with connection packer to send it as
+        :class:`~tarantool.Packed` in many requests without repeated
+        encoding.
+
+        :param value: Value to encode.
+
+        :rtype: :class:`~tarantool.Packed`
+        """
+
+        return Packed(self._packer_factory().pack(value))
+
     def generate_sync(self):
         """
         Generate IPROTO_SYNC code for a request. Since the connector is
@@ -4,8 +4,12 @@ This module provides API for interaction with Tarantool servers cluster.
 # pylint: disable=too-many-lines,duplicate-code
 
 import abc
+import concurrent.futures
+import functools
 import itertools
+import math
 import queue
+import random
 import threading
 import time
 import typing
@@ -15,9 +19,15 @@ from enum import Enum
 from tarantool.connection import Connection, ConnectionInterface
 from tarantool.const import (
     CONNECTION_TIMEOUT,
+    POOL_CIRCUIT_FAILURE_THRESHOLD,
+    POOL_CIRCUIT_OPEN_TIME,
+    POOL_CONNECTIONS_PER_INSTANCE,
     POOL_INSTANCE_RECONNECT_DELAY,
     POOL_INSTANCE_RECONNECT_MAX_ATTEMPTS,
+    POOL_LATENCY_DECAY_TIME,
+    POOL_OUTLIER_LATENCY_FACTOR,
     POOL_REFRESH_DELAY,
+    SCHEMA_PRELOAD_ALL,
     SOCKET_TIMEOUT,
 )
 from tarantool.error import (
@@ -26,6 +36,9 @@ from tarantool.error import (
     PoolTolopogyWarning,
     ConfigurationError,
     NetworkError,
+    NotSupportedError,
+    PoolManyError,
+    PoolTimeoutError,
     warn
 )
 from tarantool.utils import ENCODING_DEFAULT
@@ -78,7 +91,39 @@ class Status(Enum):
     """
     Server is unhealthy: either connection is failed,
     `box.info`_ cannot be extracted, `box.info.status`_ is not
-    "running".
+    "running", or a request to the server has failed with
+    a network error since the last state probe.
+    """
+
+
+class CircuitState(Enum):
+    """
+    Pool server circuit breaker state. The circuit opens after
+    :data:`~tarantool.const.POOL_CIRCUIT_FAILURE_THRESHOLD` requests
+    in a row have failed with a network error, timeout or have been
+    answered too slow compared to other servers of the same role (see
+    :data:`~tarantool.const.POOL_OUTLIER_LATENCY_FACTOR`). The circuit
+    of the last server of its role with closed circuit is never
+    opened.
+    """
+
+    CLOSED = 1
+    """
+    Requests are sent to the server.
+    """
+
+    OPEN = 2
+    """
+    Requests are not sent to the server. After
+    :data:`~tarantool.const.POOL_CIRCUIT_OPEN_TIME` a trial request
+    is allowed.
+    """
+
+    HALF_OPEN = 3
+    """
+    A trial request is sent to the server. The circuit is closed if
+    it succeeds and is opened again otherwise or if the trial request
+    outcome is unknown.
     """
 
 
@@ -96,6 +141,74 @@ class InstanceState():
     """
     :type: :obj:`bool`, optional
     """
+    lag: typing.Optional[float] = None
+    """
+    Maximum replication lag of the server upstreams, in seconds.
+    Infinite if some upstream does not follow its source. ``None`` if
+    replication is not tracked.
+
+    :type: :obj:`float`, optional
+    """
+    vclock: typing.Optional[dict] = None
+    """
+    Server vclock: replica ID to LSN. ``None`` if replication is not
+    tracked.
+
+    :type: :obj:`dict`, optional
+    """
+    lagging: bool = False
+    """
+    ``True`` if the server is read-only and its replication lag
+    exceeds :paramref:`~tarantool.ConnectionPool.params.max_replica_lag`.
+    Lagging servers are healthy, but they are not used for
+    :attr:`~tarantool.Mode.RO` and :attr:`~tarantool.Mode.PREFER_RO`
+    requests and are the last resort for
+    :attr:`~tarantool.Mode.PREFER_RW` ones.
+
+    :type: :obj:`bool`
+    """
+
+
+def vclock_from_lua(value):
+    """
+    Convert a `box.info.vclock`_ value decoded from MessagePack to
+    a dictionary. Lua tables with sequential replica IDs are encoded
+    as arrays, missing replica IDs are encoded as ``nil`` in them.
+
+    :param value: Decoded vclock.
+    :type value: :obj:`list` or :obj:`dict`
+
+    :rtype: :obj:`dict`
+
+    .. _box.info.vclock: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_info/info/
+    """
+
+    if isinstance(value, dict):
+        return dict(value)
+    return {replica_id: lsn for replica_id, lsn in enumerate(value, start=1)
+            if lsn is not None}
+
+
+def vclock_covers(vclock, min_vclock):
+    """
+    Check whether a vclock includes all changes of another one. The
+    local changes component (replica ID 0) is not replicated and is
+    ignored, as well as components with no LSN.
+
+    :param vclock: Server vclock.
+    :type vclock: :obj:`dict` or :obj:`None`
+
+    :param min_vclock: Vclock to compare with.
+    :type min_vclock: :obj:`dict`
+
+    :rtype: :obj:`bool`
+    """
+
+    if vclock is None:
+        return False
+    return all(vclock.get(replica_id, 0) >= lsn
+               for replica_id, lsn in min_vclock.items()
+               if replica_id != 0 and lsn is not None)
 
 
 def queue_factory():
@@ -112,6 +225,7 @@ class PoolUnit():
     Class to store a Tarantool server metainfo and
     to work with it as a part of connection pool.
     """
+    # pylint: disable=too-many-instance-attributes
 
     addr: dict
     """
@@ -122,28 +236,57 @@ class PoolUnit():
 
     conn: Connection
     """
+    Connection used to process requests.
+
+    :type: :class:`~tarantool.Connection`
+    """
+
+    health_conn: Connection
+    """
+    Connection used to probe the server state. It is separate from
+    request connections, so a slow probe or reconnect does not delay
+    requests queued to the server.
+
     :type: :class:`~tarantool.Connection`
     """
 
-    input_queue: queue.Queue = field(default_factory=queue_factory)
+    extra_conns: typing.List[Connection] = field(default_factory=list)
     """
-    Channel to pass requests for the server thread.
+    Additional connections to process requests concurrently, see
+    :paramref:`~tarantool.ConnectionPool.params.connections_per_instance`.
 
-    :type: :obj:`queue.Queue`
+    :type: :obj:`list` of :class:`~tarantool.Connection`
     """
 
-    output_queue: queue.Queue = field(default_factory=queue_factory)
+    input_queue: queue.Queue = field(default_factory=queue.Queue)
     """
-    Channel to receive responses from the server thread.
+    Channel to pass requests for the server threads. ``None`` is put
+    to wake up a thread on close.
 
     :type: :obj:`queue.Queue`
     """
 
-    thread: typing.Optional[threading.Thread] = None
+    threads: typing.List[threading.Thread] = field(default_factory=list)
+    """
+    Background threads to process requests for the server, one per
+    connection.
+
+    :type: :obj:`list` of :obj:`threading.Thread`
+    """
+
+    health_thread: typing.Optional[threading.Thread] = None
+    """
+    Background thread to probe the server state.
+
+    :type: :obj:`threading.Thread`, optional
+    """
+
+    health_wakeup: threading.Event = field(default_factory=threading.Event)
     """
-    Background thread to process requests for the server.
+    Event to start the next server state probe without waiting for
+    :paramref:`~tarantool.ConnectionPool.params.refresh_delay`.
 
-    :type: :obj:`threading.Thread`
+    :type: :obj:`threading.Event`
     """
 
     state: InstanceState = field(default_factory=InstanceState)
@@ -161,6 +304,187 @@ class PoolUnit():
     :type: :obj:`bool`
     """
 
+    in_flight: int = 0
+    """
+    Number of requests sent to the server and not yet responded.
+
+    :type: :obj:`int`
+    """
+
+    latency: typing.Optional[float] = None
+    """
+    Peak-sensitive exponentially weighted moving average of the server
+    response time (including queueing in the pool), in seconds.
+    ``None`` if there were no responses yet. A response slower than
+    the average replaces it, faster ones are averaged with weight
+    growing with the time since the previous response (see
+    :data:`~tarantool.const.POOL_LATENCY_DECAY_TIME`).
+
+    :type: :obj:`float`, optional
+    """
+
+    latency_time: typing.Optional[float] = None
+    """
+    Time of the last :attr:`latency` update, a :func:`time.monotonic`
+    value.
+
+    :type: :obj:`float`, optional
+    """
+
+    stats_lock: threading.Lock = field(default_factory=threading.Lock)
+    """
+    Lock to update request statistics from caller threads.
+
+    :type: :obj:`threading.Lock`
+    """
+
+    circuit: CircuitState = CircuitState.CLOSED
+    """
+    Server circuit breaker state.
+
+    :type: :class:`~tarantool.connection_pool.CircuitState`
+    """
+
+    failures: int = 0
+    """
+    Number of requests failed in a row.
+
+    :type: :obj:`int`
+    """
+
+    circuit_open_time: typing.Optional[float] = None
+    """
+    Time of the last circuit opening, a :func:`time.monotonic` value.
+
+    :type: :obj:`float`, optional
+    """
+
+    def request_started(self):
+        """
+        Account a request sent to the server. A request sent with
+        open circuit is a trial one.
+        """
+
+        with self.stats_lock:
+            self.in_flight += 1
+            if self.circuit == CircuitState.OPEN:
+                self.circuit = CircuitState.HALF_OPEN
+
+    def request_finished(self, latency):
+        """
+        Account a response received from the server.
+
+        :param latency: Request response time, in seconds.
+        :type latency: :obj:`float`
+        """
+
+        now = time.monotonic()
+        with self.stats_lock:
+            self.in_flight -= 1
+            if self.latency is None or latency > self.latency:
+                self.latency = latency
+            else:
+                weight = math.exp(-(now - self.latency_time) / POOL_LATENCY_DECAY_TIME)
+                self.latency = self.latency * weight + latency * (1 - weight)
+            self.latency_time = now
+
+    def request_cancelled(self, now):
+        """
+        Account a request cancelled before it was sent to the server.
+        If it was a trial request, open the circuit again.
+
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
+        """
+
+        with self.stats_lock:
+            self.in_flight -= 1
+        self.request_abandoned(now)
+
+    def request_abandoned(self, now):
+        """
+        Account a request which outcome is unknown, like a response
+        discarded by a hedged request. If it was a trial request, open
+        the circuit again, so another trial request is allowed after
+        :data:`~tarantool.const.POOL_CIRCUIT_OPEN_TIME`.
+
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
+        """
+
+        with self.stats_lock:
+            if self.circuit == CircuitState.HALF_OPEN:
+                self.circuit = CircuitState.OPEN
+                self.circuit_open_time = now
+
+    def request_succeeded(self):
+        """
+        Account a successful request, close the circuit.
+        """
+
+        with self.stats_lock:
+            self.failures = 0
+            self.circuit = CircuitState.CLOSED
+
+    def request_failed(self, now, may_open=True):
+        """
+        Account a failed request, open the circuit if the failure
+        threshold is reached or a trial request has failed.
+
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
+
+        :param may_open: If ``False``, the circuit is kept closed: the
+            server is the last one able to serve its requests.
+        :type may_open: :obj:`bool`, optional
+        """
+
+        with self.stats_lock:
+            self.failures += 1
+            if (self.circuit != CircuitState.CLOSED
+                    or self.failures >= POOL_CIRCUIT_FAILURE_THRESHOLD):
+                if may_open:
+                    self.circuit = CircuitState.OPEN
+                    self.circuit_open_time = now
+                else:
+                    self.circuit = CircuitState.CLOSED
+
+    def circuit_allows(self, now):
+        """
+        Check whether a request could be sent to the server: the
+        circuit is closed or has been open for long enough to send
+        a trial request.
+
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
+
+        :rtype: :obj:`bool`
+        """
+
+        circuit = self.circuit
+        if circuit == CircuitState.CLOSED:
+            return True
+        if circuit == CircuitState.OPEN:
+            return now - self.circuit_open_time >= POOL_CIRCUIT_OPEN_TIME
+        return False
+
+    def current_latency(self, now):
+        """
+        Get the response time average decayed with the time passed
+        since the last response, so a server that was slow once is
+        tried again after a while.
+
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
+
+        :rtype: :obj:`float`
+        """
+
+        latency = self.latency
+        if latency is None:
+            return 0.0
+        return latency * math.exp(-(now - self.latency_time) / POOL_LATENCY_DECAY_TIME)
+
 
 # Based on https://realpython.com/python-interface/
 class StrategyInterface(metaclass=abc.ABCMeta):
@@ -222,6 +546,7 @@ class RoundRobinStrategy(StrategyInterface):
         self.any_iter = None
         self.rw_iter = None
         self.ro_iter = None
+        self.lagging_iter = None
         self.pool = pool
         self.rebuild_needed = True
 
@@ -234,6 +559,7 @@ class RoundRobinStrategy(StrategyInterface):
         any_pool = []
         rw_pool = []
         ro_pool = []
+        lagging_pool = []
 
         for key in self.pool:
             state = self.pool[key].state
@@ -245,23 +571,18 @@ class RoundRobinStrategy(StrategyInterface):
 
             if state.read_only is False:
                 rw_pool.append(key)
+            elif state.lagging:
+                lagging_pool.append(key)
             else:
                 ro_pool.append(key)
 
-        if len(any_pool) > 0:
-            self.any_iter = itertools.cycle(any_pool)
-        else:
-            self.any_iter = None
-
-        if len(rw_pool) > 0:
-            self.rw_iter = itertools.cycle(rw_pool)
-        else:
-            self.rw_iter = None
+        def cycle(keys):
+            return itertools.cycle(keys) if len(keys) > 0 else None
 
-        if len(ro_pool) > 0:
-            self.ro_iter = itertools.cycle(ro_pool)
-        else:
-            self.ro_iter = None
+        self.any_iter = cycle(any_pool)
+        self.rw_iter = cycle(rw_pool)
+        self.ro_iter = cycle(ro_pool)
+        self.lagging_iter = cycle(lagging_pool)
 
         self.rebuild_needed = False
 
@@ -276,7 +597,8 @@ class RoundRobinStrategy(StrategyInterface):
 
     def _getnext_by_mode(self, *iters, err_msg="Can't find healthy instance in pool"):
         """
-        Get server from prioritized list of iterators.
+        Get server from prioritized list of iterators. Servers with
+        open circuit are skipped.
 
         :param iters: list of iterators
         :type iters: :obj:`list`
@@ -290,9 +612,15 @@ class RoundRobinStrategy(StrategyInterface):
 
         :meta private:
         """
+        now = time.monotonic()
         for itr in iters:
-            if itr is not None:
-                return next(itr)
+            if itr is None:
+                continue
+            # Each iterator cycles over at most len(self.pool) servers.
+            for _ in range(len(self.pool)):
+                key = next(itr)
+                if self.pool[key].circuit_allows(now):
+                    return key
         raise PoolTolopogyError(err_msg)
 
     def getnext(self, mode):
@@ -321,11 +649,182 @@ class RoundRobinStrategy(StrategyInterface):
         if mode == Mode.PREFER_RO:
             return self._getnext_by_mode(self.ro_iter, self.rw_iter)
         if mode == Mode.PREFER_RW:
-            return self._getnext_by_mode(self.rw_iter, self.ro_iter)
+            return self._getnext_by_mode(self.rw_iter, self.ro_iter, self.lagging_iter)
+
+        raise ValueError(f"Unexpected mode {mode}")
+
+
+class PowerOfTwoChoicesStrategy(StrategyInterface):
+    """
+    Base class for load-aware strategies: two random servers are
+    picked among the ones suitable for a request mode and the one
+    with lower :meth:`cost` is used. Comparing two random candidates
+    instead of all servers is nearly as good for balancing and avoids
+    sending every request to the same least loaded server.
+    """
+    # pylint: disable=bad-option-value,no-self-use,super-init-not-called
+
+    def __init__(self, pool):
+        """
+        :type: :obj:`list` of
+            :class:`~tarantool.connection_pool.PoolUnit` objects
+        """
+
+        self.pool = pool
+        self.any_keys = []
+        self.rw_keys = []
+        self.ro_keys = []
+        self.lagging_keys = []
+        self.rebuild_needed = True
+        self.random = random.Random()
+
+    def build(self):
+        """
+        Initialize (or re-initialize) lists of servers to choose from
+        based on `box.info.ro`_ state.
+        """
+
+        any_keys = []
+        rw_keys = []
+        ro_keys = []
+        lagging_keys = []
+
+        for key, unit in self.pool.items():
+            if unit.state.status == Status.UNHEALTHY:
+                continue
+
+            any_keys.append(key)
+
+            if unit.state.read_only is False:
+                rw_keys.append(key)
+            elif unit.state.lagging:
+                lagging_keys.append(key)
+            else:
+                ro_keys.append(key)
+
+        self.any_keys = any_keys
+        self.rw_keys = rw_keys
+        self.ro_keys = ro_keys
+        self.lagging_keys = lagging_keys
+        self.rebuild_needed = False
+
+    def update(self):
+        """
+        Set flag to re-initialize lists of servers on next
+        :meth:`~tarantool.connection_pool.PowerOfTwoChoicesStrategy.getnext`
+        call.
+        """
+
+        self.rebuild_needed = True
+
+    def cost(self, unit, now):
+        """
+        Get server cost, lower is better.
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
+
+        :rtype: :obj:`float` or :obj:`tuple`
+        """
+
+        raise NotImplementedError
+
+    def _choose(self, *key_lists, err_msg="Can't find healthy instance in pool"):
+        """
+        Choose a server from the first list with servers which circuit
+        allows requests.
+
+        :param key_lists: Prioritized lists of server keys.
+        :type key_lists: :obj:`list`
+
+        :param err_msg: Error message to raise in case of error.
+        :type err_msg: :obj:`str`
+
+        :rtype: :obj:`str`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        now = time.monotonic()
+        for keys in key_lists:
+            if len(keys) > 1:
+                first, second = self.random.sample(keys, 2)
+                first_allowed = self.pool[first].circuit_allows(now)
+                second_allowed = self.pool[second].circuit_allows(now)
+                if first_allowed and second_allowed:
+                    if self.cost(self.pool[second], now) < self.cost(self.pool[first], now):
+                        return second
+                    return first
+                if first_allowed:
+                    return first
+                if second_allowed:
+                    return second
+
+            available = [key for key in keys if self.pool[key].circuit_allows(now)]
+            if available:
+                return self.random.choice(available)
+        raise PoolTolopogyError(err_msg)
+
+    def getnext(self, mode):
+        """
+        Get server based on the request mode.
+
+        :param mode: Request mode
+        :type mode: :class:`~tarantool.Mode`
+
+        :rtype: :obj:`str`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+        """
+
+        if self.rebuild_needed:
+            self.build()
+
+        if mode == Mode.ANY:
+            return self._choose(self.any_keys)
+        if mode == Mode.RW:
+            return self._choose(self.rw_keys,
+                                err_msg="Can't find healthy rw instance in pool")
+        if mode == Mode.RO:
+            return self._choose(self.ro_keys,
+                                err_msg="Can't find healthy ro instance in pool")
+        if mode == Mode.PREFER_RO:
+            return self._choose(self.ro_keys, self.rw_keys)
+        if mode == Mode.PREFER_RW:
+            return self._choose(self.rw_keys, self.ro_keys, self.lagging_keys)
 
         raise ValueError(f"Unexpected mode {mode}")
 
 
+class LeastLoadedStrategy(PowerOfTwoChoicesStrategy):
+    """
+    Choose the server with fewer requests in flight out of two random
+    ones. Ties are broken by response time average.
+    """
+
+    def cost(self, unit, now):
+        return (unit.in_flight, unit.current_latency(now))
+
+
+class LatencyStrategy(PowerOfTwoChoicesStrategy):
+    """
+    Choose the server with lower expected response time out of two
+    random ones: response time average multiplied by number of requests
+    in flight plus one. The average reacts to slow responses at once,
+    so a server stalled by a GC pause or compaction stops receiving
+    requests until it recovers, and decays with time, so the server
+    is tried again later.
+    """
+
+    def cost(self, unit, now):
+        return unit.current_latency(now) * (unit.in_flight + 1)
+
+
 @dataclass
 class PoolTask():
     """
@@ -353,31 +852,117 @@ class PoolTask():
     :type: :obj:`dict`
     """
 
+    output_queue: queue.Queue = field(default_factory=queue_factory)
+    """
+    Channel to receive the task response from the server thread.
 
-class ConnectionPool(ConnectionInterface):
+    :type: :obj:`queue.Queue`
     """
-    Represents the pool of connections to a cluster of Tarantool
-    servers.
 
-    To work with :class:`~tarantool.connection_pool.ConnectionPool`,
-    `box.info`_ must be callable for the user on each server.
+    key: typing.Optional[str] = None
+    """
+    Pool server key. If set, the server thread puts
+    ``(key, response)`` pair to the output queue, so a queue could be
+    shared by tasks sent to different servers.
+
+    :type: :obj:`str`, optional
+    """
+
+    future: typing.Optional[concurrent.futures.Future] = None
+    """
+    Future to set the task response to instead of the output queue.
+    The request is not sent if the future is cancelled before
+    the server thread takes the task.
+
+    :type: :class:`concurrent.futures.Future`, optional
+    """
 
-    :class:`~tarantool.ConnectionPool` is best suited to work with
-    a single replicaset. Its API is the same as a single server
-    :class:`~tarantool.Connection`, but requests support ``mode``
-    parameter (a :class:`tarantool.Mode` value) to choose between
-    read-write and read-only pool instances:
+
+def gather(futures, timeout=None, return_exceptions=False):
+    """
+    Wait for futures returned by
+    :meth:`~tarantool.ConnectionPool.submit` and get their results.
 
     .. code-block:: python
 
-        >>> resp = conn.select('demo', 'AAAA', mode=tarantool.Mode.PREFER_RO)
-        >>> resp
-        - ['AAAA', 'Alpha']
+        >>> futures = [pool.submit('select', 'demo', key, mode=tarantool.Mode.RO)
+        ...            for key in keys]
+        >>> responses = tarantool.connection_pool.gather(futures, timeout=1)
+
+    :param futures: Futures to wait for.
+    :type futures: :obj:`list` of :class:`concurrent.futures.Future`
+
+    :param timeout: Time to wait for all futures, in seconds. ``None``
+        means no limit.
+    :type timeout: :obj:`float`, optional
+
+    :param return_exceptions: If ``True``, exceptions are returned in
+        the results list instead of raising the first one. Cancelled
+        futures result in :exc:`concurrent.futures.CancelledError`.
+    :type return_exceptions: :obj:`bool`, optional
+
+    :return: Results in the order of ``futures``.
+    :rtype: :obj:`list`
+
+    :raise: :exc:`~tarantool.error.PoolTimeoutError`,
+        :class:`~tarantool.ConnectionPool` request exceptions
     """
-    # pylint: disable=too-many-public-methods,duplicate-code,bad-option-value,no-self-use
 
-    def __init__(self,
-                 addrs,
+    futures = list(futures)
+    _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    if not_done:
+        raise PoolTimeoutError(f"{len(not_done)} of {len(futures)} requests have not "
+                               f"completed in {timeout} seconds")
+
+    results = []
+    for future in futures:
+        if future.cancelled():
+            exc = concurrent.futures.CancelledError()
+        else:
+            exc = future.exception()
+        if exc is None:
+            results.append(future.result())
+        elif return_exceptions:
+            results.append(exc)
+        else:
+            raise exc
+    return results
+
+
+SUBMIT_METHODS = ConnectionInterface.__abstractmethods__ - {'connect', 'close', 'is_closed'}
+"""
+:class:`~tarantool.Connection` request methods which could be used
+with :meth:`~tarantool.ConnectionPool.submit`.
+
+:meta private:
+"""
+
+
+class ConnectionPool(ConnectionInterface):
+    """
+    Represents the pool of connections to a cluster of Tarantool
+    servers.
+
+    To work with :class:`~tarantool.connection_pool.ConnectionPool`,
+    `box.info`_ must be callable for the user on each server.
+
+    :class:`~tarantool.ConnectionPool` is best suited to work with
+    a single replicaset. Its API is the same as a single server
+    :class:`~tarantool.Connection`, but requests support ``mode``
+    parameter (a :class:`tarantool.Mode` value) to choose between
+    read-write and read-only pool instances:
+
+    .. code-block:: python
+
+        >>> resp = conn.select('demo', 'AAAA', mode=tarantool.Mode.PREFER_RO)
+        >>> resp
+        - ['AAAA', 'Alpha']
+    """
+    # pylint: disable=too-many-public-methods,too-many-instance-attributes,duplicate-code
+    # pylint: disable=bad-option-value,no-self-use
+
+    def __init__(self,
+                 addrs,
                  user=None,
                  password=None,
                  socket_timeout=SOCKET_TIMEOUT,
@@ -389,7 +974,14 @@ class ConnectionPool(ConnectionInterface):
                  connection_timeout=CONNECTION_TIMEOUT,
                  strategy_class=RoundRobinStrategy,
                  refresh_delay=POOL_REFRESH_DELAY,
-                 fetch_schema=True):
+                 fetch_schema=True,
+                 schema_preload=SCHEMA_PRELOAD_ALL,
+                 schema_cache=None,
+                 schema_registry=None,
+                 connections_per_instance=POOL_CONNECTIONS_PER_INSTANCE,
+                 connect_quorum=None,
+                 hedge_delay=None,
+                 max_replica_lag=None):
         """
         :param addrs: List of dictionaries describing server addresses:
 
@@ -442,262 +1034,943 @@ class ConnectionPool(ConnectionInterface):
             manually after initialization.
         :type connect_now: :obj:`bool`, optional
 
-        :param encoding: Refer to
-            :paramref:`~tarantool.Connection.params.encoding`.
-            The value is used for each connection in the pool.
+        :param encoding: Refer to
+            :paramref:`~tarantool.Connection.params.encoding`.
+            The value is used for each connection in the pool.
+
+        :param call_16: Refer to
+            :paramref:`~tarantool.Connection.params.call_16`.
+            The value is used for each connection in the pool.
+
+        :param connection_timeout: Refer to
+            :paramref:`~tarantool.Connection.params.connection_timeout`.
+            The value is used for each connection in the pool.
+
+        :param strategy_class: Strategy for choosing a server based on a
+            request mode. Defaults to the round-robin strategy.
+            Load-aware strategies are
+            :class:`~tarantool.connection_pool.LeastLoadedStrategy` and
+            :class:`~tarantool.connection_pool.LatencyStrategy`.
+        :type strategy_class: :class:`~tarantool.connection_pool.StrategyInterface`,
+            optional
+
+        :param refresh_delay: Time between pool server
+            `box.info.ro`_ status background refreshes, in seconds.
+            All servers are probed concurrently, each with a separate
+            connection. A server is also probed right after a request
+            to it fails with a network error.
+        :type connection_timeout: :obj:`float`, optional
+
+        :param fetch_schema: Refer to
+            :paramref:`~tarantool.Connection.params.fetch_schema`.
+
+        :param schema_preload: Refer to
+            :paramref:`~tarantool.Connection.params.schema_preload`.
+
+        :param schema_cache: Refer to
+            :paramref:`~tarantool.Connection.params.schema_cache`.
+
+        :param schema_registry: Refer to
+            :paramref:`~tarantool.Connection.params.schema_registry`.
+            The registry is shared by all pool connections, so use it
+            only if all pool instances have the same schema.
+
+        :param connections_per_instance: Number of connections (and
+            background threads) to each pool server. Requests to
+            a server are processed concurrently by its connections,
+            so set it to the number of application threads expected
+            to send requests to the same server simultaneously.
+        :type connections_per_instance: :obj:`int`, optional
+
+        :param connect_quorum: Condition to return from
+            :meth:`~tarantool.ConnectionPool.connect`. Servers are
+            connected to and probed concurrently, and the method
+            returns as soon as the quorum is ready, while the rest of
+            servers are connected to in the background. A
+            :class:`~tarantool.Mode` value waits for a healthy server
+            suitable for requests in this mode (for example,
+            ``Mode.RW`` waits for at least one RW server), an
+            :obj:`int` value waits for that number of healthy servers.
+            If ``None``, waits for all servers to be probed. In any
+            case, the method returns once all servers are probed even
+            if the quorum is not ready.
+        :type connect_quorum: :class:`~tarantool.Mode` or :obj:`int`,
+            optional
+
+        :param hedge_delay: Enable hedging for ``Mode.RO`` and
+            ``Mode.PREFER_RO`` selects: if a server has not responded
+            in ``hedge_delay`` seconds, the same request is sent to
+            another server and the first successful response wins,
+            the other one is discarded. Set it to the response time
+            percentile of the pool servers (like p95) to cut the tail
+            latency at the cost of a small share of extra requests.
+            If ``None``, requests are not hedged.
+        :type hedge_delay: :obj:`float`, optional
+
+        :param max_replica_lag: Enable replication tracking: server
+            states are probed with `box.info`_ to get replication lag
+            and vclock, and read-only servers which replication lag
+            exceeds ``max_replica_lag`` seconds are not used for
+            :attr:`~tarantool.Mode.RO` and
+            :attr:`~tarantool.Mode.PREFER_RO` requests until they catch
+            up. Tracked vclocks are used to route requests with
+            ``min_vclock`` (see
+            :meth:`~tarantool.ConnectionPool.vclock_token`). If
+            ``None``, replication is not tracked.
+        :type max_replica_lag: :obj:`float`, optional
+
+        :raise: :exc:`~tarantool.error.ConfigurationError`,
+            :class:`~tarantool.Connection` exceptions
+
+        .. _box.info.ro:
+        .. _box.info.status:
+        .. _box.info: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_info/
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        if not isinstance(addrs, list) or len(addrs) == 0:
+            raise ConfigurationError("addrs must be non-empty list")
+
+        if not isinstance(connections_per_instance, int) or connections_per_instance < 1:
+            raise ConfigurationError("connections_per_instance must be a positive integer")
+
+        if not (connect_quorum is None or isinstance(connect_quorum, Mode)
+                or (isinstance(connect_quorum, int) and not isinstance(connect_quorum, bool)
+                    and connect_quorum > 0)):
+            raise ConfigurationError("connect_quorum must be None, a Mode value "
+                                     "or a positive integer")
+
+        if hedge_delay is not None and (not isinstance(hedge_delay, (int, float))
+                                        or hedge_delay < 0):
+            raise ConfigurationError("hedge_delay must be None or a non-negative number")
+
+        if max_replica_lag is not None and (not isinstance(max_replica_lag, (int, float))
+                                            or max_replica_lag < 0):
+            raise ConfigurationError("max_replica_lag must be None or a non-negative number")
+
+        # Prepare addresses for usage.
+        new_addrs = []
+        for addr in addrs:
+            new_addr, msg = prepare_address(addr)
+            if not new_addr:
+                raise ConfigurationError(msg)
+            new_addrs.append(new_addr)
+        self.addrs = new_addrs
+
+        # Create connections
+        self.pool = {}
+        self.refresh_delay = refresh_delay
+        self.connect_quorum = connect_quorum
+        self.hedge_delay = hedge_delay
+        self.max_replica_lag = max_replica_lag
+        self.strategy = strategy_class(self.pool)
+        self._connect_cond = threading.Condition()
+        self._connect_errors = {}
+
+        def make_conn(addr, fetch_schema):
+            return Connection(
+                host=addr['host'],
+                port=addr['port'],
+                user=user,
+                password=password,
+                socket_timeout=socket_timeout,
+                reconnect_max_attempts=reconnect_max_attempts,
+                reconnect_delay=reconnect_delay,
+                connect_now=False,  # Connect in ConnectionPool.connect()
+                encoding=encoding,
+                call_16=call_16,
+                connection_timeout=connection_timeout,
+                transport=addr['transport'],
+                ssl_key_file=addr['ssl_key_file'],
+                ssl_cert_file=addr['ssl_cert_file'],
+                ssl_ca_file=addr['ssl_ca_file'],
+                ssl_ciphers=addr['ssl_ciphers'],
+                ssl_password=addr['ssl_password'],
+                ssl_password_file=addr['ssl_password_file'],
+                auth_type=addr['auth_type'],
+                fetch_schema=fetch_schema,
+                schema_preload=schema_preload,
+                schema_cache=schema_cache,
+                schema_registry=schema_registry)
+
+        for addr in self.addrs:
+            key = self._make_key(addr)
+            conns = [make_conn(addr, fetch_schema) for _ in range(connections_per_instance)]
+            self.pool[key] = PoolUnit(addr=addr, conn=conns[0], extra_conns=conns[1:],
+                                      health_conn=make_conn(addr, False))
+
+        if connect_now:
+            self.connect()
+
+    def __del__(self):
+        self.close()
+
+    def _make_key(self, addr):
+        """
+        Make a unique key for a server based on its address.
+
+        :param addr: `{"host": host, "port": port}` dictionary.
+        :type addr: :obj:`dict`
+
+        :rtype: :obj:`str`
+
+        :meta private:
+        """
+
+        return f"{addr['host']}:{addr['port']}"
+
+    def _get_new_state(self, unit):
+        """
+        Get new pool server state. The state is fetched with
+        a `box.status`_ WATCH_ONCE request if the server supports it,
+        so only ``is_ro`` and ``status`` values are transferred,
+        and with `box.info`_ call otherwise or if replication is
+        tracked.
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :rtype: :class:`~tarantool.connection_pool.InstanceState`
+
+        :meta private:
+
+        .. _box.status: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_events/system_events/
+        """
+
+        conn = unit.health_conn
+
+        if conn.is_closed():
+            try:
+                conn.connect()
+            except NetworkError as exc:
+                msg = (f"Failed to connect to {unit.addr['host']}:{unit.addr['port']}, "
+                       f"reason: {repr(exc)}")
+                warn(msg, ClusterConnectWarning)
+                return InstanceState(Status.UNHEALTHY)
+
+        source, ro_key = 'box.status', 'is_ro'
+        try:
+            try:
+                if self.max_replica_lag is not None:
+                    raise NotSupportedError('box.status has no replication info')
+                info = conn.watch_once(source)
+            except NotSupportedError:
+                source, ro_key = 'box.info', 'ro'
+                data = conn.call(source).data
+                info = data[0] if data else None
+        except NetworkError as exc:
+            msg = (f"Failed to get {source} for {unit.addr['host']}:{unit.addr['port']}, "
+                   f"reason: {repr(exc)}")
+            warn(msg, PoolTolopogyWarning)
+            return InstanceState(Status.UNHEALTHY)
+
+        try:
+            read_only = info[ro_key]
+            status = info['status']
+        except (TypeError, KeyError) as exc:
+            msg = (f"Incorrect {source} response from {unit.addr['host']}:{unit.addr['port']}"
+                   f"reason: {repr(exc)}")
+            warn(msg, PoolTolopogyWarning)
+            return InstanceState(Status.UNHEALTHY)
+
+        if status != 'running':
+            msg = f"{unit.addr['host']}:{unit.addr['port']} instance status is not 'running'"
+            warn(msg, PoolTolopogyWarning)
+            return InstanceState(Status.UNHEALTHY)
+
+        lag, vclock, lagging = None, None, False
+        if self.max_replica_lag is not None:
+            lag, vclock = self._get_replication_state(info)
+            lagging = bool(read_only) and lag > self.max_replica_lag
+            if lagging:
+                msg = (f"{unit.addr['host']}:{unit.addr['port']} replication lag {lag} "
+                       f"exceeds max_replica_lag")
+                warn(msg, PoolTolopogyWarning)
+
+        return InstanceState(Status.HEALTHY, read_only, lag, vclock, lagging)
+
+    @staticmethod
+    def _get_replication_state(info):
+        """
+        Extract replication lag and vclock from `box.info`_.
+
+        :param info: `box.info`_ value.
+        :type info: :obj:`dict`
+
+        :return: Maximum upstream lag (infinite if some upstream does
+            not follow its source) and vclock.
+        :rtype: :obj:`tuple`
+
+        :meta private:
+        """
+
+        replication = info.get('replication') or {}
+        if isinstance(replication, list):
+            replication = dict(enumerate(replication, start=1))
+
+        lag = 0.0
+        for replica in replication.values():
+            upstream = replica.get('upstream') if isinstance(replica, dict) else None
+            if upstream is None:
+                continue
+            if upstream.get('status') != 'follow':
+                lag = math.inf
+            else:
+                lag = max(lag, upstream.get('lag', 0.0))
+
+        return lag, vclock_from_lua(info.get('vclock') or {})
+
+    def _refresh_state(self, key):
+        """
+        Refresh pool server state.
+
+        :param key: Result of
+            :meth:`~tarantool.connection_pool._make_key`.
+        :type key: :obj:`str`
+
+        :meta private:
+        """
+
+        unit = self.pool[key]
+
+        state = self._get_new_state(unit)
+        if state != unit.state:
+            unit.state = state
+            self.strategy.update()
+
+    def close(self):
+        """
+        Stop request processing, close each connection in the pool.
+        Futures of submitted requests which are not sent yet are
+        cancelled, pending synchronous requests fail with
+        :exc:`~tarantool.error.NetworkError`.
+        """
+        for unit in self.pool.values():
+            unit.request_processing_enabled = False
+            unit.health_wakeup.set()
+            for _ in unit.threads:
+                unit.input_queue.put(None)
+            for thread in unit.threads:
+                thread.join()
+            if unit.health_thread is not None:
+                unit.health_thread.join()
+            self._drop_queued_tasks(unit)
+
+            for conn in [unit.conn, unit.health_conn] + unit.extra_conns:
+                if not conn.is_closed():
+                    conn.close()
+
+    @staticmethod
+    def _drop_queued_tasks(unit):
+        """
+        Complete tasks left in the server input queue after its threads
+        have stopped, so nobody waits for them forever.
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :meta private:
+        """
+
+        while True:
+            try:
+                task = unit.input_queue.get_nowait()
+            except queue.Empty:
+                return
+            if task is None:
+                continue
+
+            if task.future is not None:
+                # cancel() alone does not wake up concurrent.futures.wait().
+                task.future.cancel()
+                task.future.set_running_or_notify_cancel()
+                continue
+            exc = NetworkError('Connection pool is closed')
+            if task.key is None:
+                task.output_queue.put(exc)
+            else:
+                task.output_queue.put((task.key, exc))
+
+    def is_closed(self):
+        """
+        Returns ``False`` if at least one connection is not closed and
+        is ready to process requests. Otherwise, returns ``True``.
+
+        :rtype: :obj:`bool`
+        """
+
+        return all(unit.request_processing_enabled is False for unit in self.pool.values())
+
+    def _request_process_loop(self, unit, conn):
+        """
+        Request process background loop for a pool server connection.
+        Started in a separate thread, one thread per connection. The
+        thread blocks on the input queue until a request arrives, so
+        an idle pool does not consume CPU.
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :param conn: Connection to process requests with.
+        :type conn: :class:`~tarantool.Connection`
+        """
+
+        while unit.request_processing_enabled:
+            task = unit.input_queue.get()
+            if task is None:
+                continue
+            if task.future is not None and not task.future.set_running_or_notify_cancel():
+                continue
+
+            method = getattr(Connection, task.method_name)
+            try:
+                if conn.is_closed():
+                    conn.connect()
+                resp = method(conn, *task.args, **task.kwargs)
+            except Exception as exc:  # pylint: disable=bad-option-value,broad-exception-caught,broad-except
+                resp = exc
+
+            if task.future is not None:
+                if isinstance(resp, Exception):
+                    task.future.set_exception(resp)
+                else:
+                    task.future.set_result(resp)
+            elif task.key is None:
+                task.output_queue.put(resp)
+            else:
+                task.output_queue.put((task.key, resp))
+
+    def _health_check_loop(self, key, unit):
+        """
+        Server state probe background loop. Started in a separate
+        thread, one thread per server, so servers are probed
+        concurrently and independently of request processing.
+
+        :param key: Result of
+            :meth:`~tarantool.connection_pool._make_key`.
+        :type key: :obj:`str`
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :meta private:
+        """
+
+        try:
+            self._connect_unit(key, unit)
+        except Exception as exc:  # pylint: disable=bad-option-value,broad-exception-caught,broad-except
+            error = exc
+        else:
+            error = None
+        with self._connect_cond:
+            self._connect_errors[key] = error
+            self._connect_cond.notify_all()
+
+        while unit.request_processing_enabled:
+            unit.health_wakeup.wait(self.refresh_delay)
+            unit.health_wakeup.clear()
+
+            if not unit.request_processing_enabled:
+                break
+
+            try:
+                self._refresh_state(key)
+            except Exception as exc:  # pylint: disable=bad-option-value,broad-exception-caught,broad-except
+                msg = (f"Failed to refresh {unit.addr['host']}:{unit.addr['port']} state, "
+                       f"reason: {repr(exc)}")
+                warn(msg, PoolTolopogyWarning)
+                if unit.state.status != Status.UNHEALTHY:
+                    unit.state = InstanceState(Status.UNHEALTHY)
+                    self.strategy.update()
+
+    def _connect_unit(self, key, unit):
+        """
+        Fetch the initial pool server state and connect to the server
+        if it is healthy.
+
+        :param key: Result of
+            :meth:`~tarantool.connection_pool._make_key`.
+        :type key: :obj:`str`
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :raise: :class:`~tarantool.Connection` exceptions
+
+        :meta private:
+        """
+
+        self._refresh_state(key)
+        if unit.state.status != Status.HEALTHY or not unit.conn.is_closed():
+            return
+
+        try:
+            unit.conn.connect()
+        except NetworkError as exc:
+            msg = (f"Failed to connect to {unit.addr['host']}:{unit.addr['port']}, "
+                   f"reason: {repr(exc)}")
+            warn(msg, ClusterConnectWarning)
+            self._mark_unhealthy(unit)
+
+    def _mark_unhealthy(self, unit):
+        """
+        Exclude a pool server from requests processing until the next
+        successful state probe and start the probe.
+
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :meta private:
+        """
+
+        if unit.state.status != Status.UNHEALTHY:
+            unit.state = InstanceState(Status.UNHEALTHY)
+            self.strategy.update()
+        unit.health_wakeup.set()
+
+    def connect(self):
+        """
+        Create a connection to each address specified on
+        initialization and start background process threads for them.
+        There is no need to call this method explicitly until you have
+        set ``connect_now=False`` on initialization.
+
+        Servers are connected to concurrently, the method returns when
+        :paramref:`~tarantool.ConnectionPool.params.connect_quorum` is
+        ready or all servers are probed. If some connections have
+        failed to connect successfully or provide `box.info`_ status
+        (including the case when all of them have failed), no
+        exceptions are raised. Attempts to reconnect and refresh the
+        info would be processed in the background.
+
+        :raise: :class:`~tarantool.Connection` exceptions other than
+            :exc:`~tarantool.error.NetworkError` raised on connecting
+            to servers probed before the method returns
+        """
+
+        with self._connect_cond:
+            self._connect_errors = {}
+
+        for key, unit in self.pool.items():
+            # Additional connections are established on the first
+            # request processed with them.
+            unit.threads = [
+                threading.Thread(target=self._request_process_loop, args=(unit, conn), daemon=True)
+                for conn in [unit.conn] + unit.extra_conns
+            ]
+            unit.health_wakeup.clear()
+            unit.health_thread = threading.Thread(target=self._health_check_loop,
+                                                  args=(key, unit), daemon=True)
+            unit.request_processing_enabled = True
+            for thread in unit.threads:
+                thread.start()
+            unit.health_thread.start()
+
+        with self._connect_cond:
+            self._connect_cond.wait_for(self._connect_quorum_ready)
+            errors = [exc for exc in self._connect_errors.values() if exc is not None]
+        if errors:
+            raise errors[0]
+
+    def _connect_quorum_ready(self):
+        """
+        Check whether :meth:`~tarantool.ConnectionPool.connect` could
+        return: all servers are probed or
+        :paramref:`~tarantool.ConnectionPool.params.connect_quorum`
+        is ready among the probed ones.
+
+        :rtype: :obj:`bool`
+
+        :meta private:
+        """
+
+        if len(self._connect_errors) == len(self.pool):
+            return True
+
+        quorum = self.connect_quorum
+        if quorum is None:
+            return False
+
+        states = [self.pool[key].state for key in self._connect_errors]
+        healthy = [state for state in states if state.status == Status.HEALTHY]
+        if quorum == Mode.RW:
+            return any(state.read_only is False for state in healthy)
+        if quorum == Mode.RO:
+            return any(state.read_only is True for state in healthy)
+        if isinstance(quorum, Mode):
+            return len(healthy) > 0
+        return len(healthy) >= quorum
+
+    def _send(self, mode, method_name, *args, **kwargs):
+        """
+        Request wrapper. Choose a pool server based on mode and send
+        a request with arguments.
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
+
+        :param method_name: :class:`~tarantool.Connection`
+            method name.
+        :type method_name: :obj:`str`
+
+        :param args: Method args.
+        :type args: :obj:`tuple`
+
+        :param kwargs: Method kwargs.
+        :type kwargs: :obj:`dict`
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~AssertionError`,
+            :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+
+        :meta private:
+        """
+
+        return self._send_to(self.strategy.getnext(mode), method_name, *args, **kwargs)
+
+    def _send_to(self, key, method_name, *args, **kwargs):
+        """
+        Request wrapper. Send a request with arguments to the pool
+        server.
+
+        :param key: Result of
+            :meth:`~tarantool.connection_pool._make_key`.
+        :type key: :obj:`str`
+
+        :param method_name: :class:`~tarantool.Connection`
+            method name.
+        :type method_name: :obj:`str`
+
+        :param args: Method args.
+        :type args: :obj:`tuple`
+
+        :param kwargs: Method kwargs.
+        :type kwargs: :obj:`dict`
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :meth:`~tarantool.ConnectionPool._send` exceptions
+
+        :meta private:
+        """
+
+        unit = self.pool[key]
+        task = PoolTask(method_name=method_name, args=args, kwargs=kwargs)
+
+        unit.request_started()
+        start = time.monotonic()
+        unit.input_queue.put(task)
+        resp = task.output_queue.get()
+        self._request_finished(unit, time.monotonic() - start, resp)
+
+        if isinstance(resp, Exception):
+            raise resp
+
+        return resp
+
+    def submit(self, method_name, *args, mode=None, **kwargs):
+        """
+        Send a request to the pool server without waiting for the
+        response. A single thread could keep many pool servers busy
+        with submitted requests, use
+        :func:`~tarantool.connection_pool.gather` to wait for them.
 
-        :param call_16: Refer to
-            :paramref:`~tarantool.Connection.params.call_16`.
-            The value is used for each connection in the pool.
+        .. code-block:: python
 
-        :param connection_timeout: Refer to
-            :paramref:`~tarantool.Connection.params.connection_timeout`.
-            The value is used for each connection in the pool.
+            >>> future = pool.submit('select', 'demo', 'AAAA', mode=tarantool.Mode.RO)
+            >>> future.result()
+            - ['AAAA', 'Alpha']
 
-        :param strategy_class: Strategy for choosing a server based on a
-            request mode. Defaults to the round-robin strategy.
-        :type strategy_class: :class:`~tarantool.connection_pool.StrategyInterface`,
-            optional
+        Requests are not hedged (see
+        :paramref:`~tarantool.ConnectionPool.params.hedge_delay`).
+        A request is not sent if its future is cancelled before a pool
+        server thread takes it.
 
-        :param refresh_delay: Minimal time between pool server
-            `box.info.ro`_ status background refreshes, in seconds.
-        :type connection_timeout: :obj:`float`, optional
+        :param method_name: Request method name, like ``'select'`` or
+            ``'call'``. Refer to the corresponding
+            :class:`~tarantool.ConnectionPool` method.
+        :type method_name: :obj:`str`
 
-        :param fetch_schema: Refer to
-            :paramref:`~tarantool.Connection.params.fetch_schema`.
+        :param args: Method args.
 
-        :raise: :exc:`~tarantool.error.ConfigurationError`,
-            :class:`~tarantool.Connection` exceptions
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
 
-        .. _box.info.ro:
-        .. _box.info.status:
-        .. _box.info: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_info/
+        :param kwargs: Method kwargs.
+
+        :return: Future of the method result.
+        :rtype: :class:`concurrent.futures.Future`
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.PoolTolopogyError`
         """
-        # pylint: disable=too-many-arguments,too-many-locals
 
-        if not isinstance(addrs, list) or len(addrs) == 0:
-            raise ConfigurationError("addrs must be non-empty list")
+        if mode is None:
+            raise ValueError("Please, specify 'mode' keyword argument")
+        if method_name not in SUBMIT_METHODS:
+            raise ValueError(f"Unsupported method {method_name}")
 
-        # Prepare addresses for usage.
-        new_addrs = []
-        for addr in addrs:
-            new_addr, msg = prepare_address(addr)
-            if not new_addr:
-                raise ConfigurationError(msg)
-            new_addrs.append(new_addr)
-        self.addrs = new_addrs
+        key = self.strategy.getnext(mode)
+        unit = self.pool[key]
 
-        # Create connections
-        self.pool = {}
-        self.refresh_delay = refresh_delay
-        self.strategy = strategy_class(self.pool)
+        future = concurrent.futures.Future()
+        start = time.monotonic()
 
-        for addr in self.addrs:
-            key = self._make_key(addr)
-            self.pool[key] = PoolUnit(
-                addr=addr,
-                conn=Connection(
-                    host=addr['host'],
-                    port=addr['port'],
-                    user=user,
-                    password=password,
-                    socket_timeout=socket_timeout,
-                    reconnect_max_attempts=reconnect_max_attempts,
-                    reconnect_delay=reconnect_delay,
-                    connect_now=False,  # Connect in ConnectionPool.connect()
-                    encoding=encoding,
-                    call_16=call_16,
-                    connection_timeout=connection_timeout,
-                    transport=addr['transport'],
-                    ssl_key_file=addr['ssl_key_file'],
-                    ssl_cert_file=addr['ssl_cert_file'],
-                    ssl_ca_file=addr['ssl_ca_file'],
-                    ssl_ciphers=addr['ssl_ciphers'],
-                    ssl_password=addr['ssl_password'],
-                    ssl_password_file=addr['ssl_password_file'],
-                    auth_type=addr['auth_type'],
-                    fetch_schema=fetch_schema)
-            )
+        def done(future):
+            if future.cancelled():
+                unit.request_cancelled(time.monotonic())
+                return
+            self._request_finished(unit, time.monotonic() - start,
+                                   future.exception() or future.result())
 
-        if connect_now:
-            self.connect()
+        future.add_done_callback(done)
 
-    def __del__(self):
-        self.close()
+        unit.request_started()
+        unit.input_queue.put(PoolTask(method_name=method_name, args=args, kwargs=kwargs,
+                                      future=future))
+        return future
 
-    def _make_key(self, addr):
+    def _request_finished(self, unit, latency, resp):
         """
-        Make a unique key for a server based on its address.
+        Account a pool server response: update response time
+        statistics and the server circuit breaker state. Network
+        errors, timeouts and outlier responses (see
+        :meth:`~tarantool.ConnectionPool._is_outlier`) are failures.
+        A network error also marks the server unhealthy until the next
+        state probe.
 
-        :param addr: `{"host": host, "port": port}` dictionary.
-        :type addr: :obj:`dict`
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
 
-        :rtype: :obj:`str`
+        :param latency: Request response time, in seconds.
+        :type latency: :obj:`float`
+
+        :param resp: Response or exception.
+        :type resp: :class:`~tarantool.response.Response` or
+            :exc:`Exception`
 
         :meta private:
         """
 
-        return f"{addr['host']}:{addr['port']}"
+        now = time.monotonic()
+        failed = (isinstance(resp, (NetworkError, PoolTimeoutError))
+                  or self._is_outlier(unit, latency, now))
 
-    def _get_new_state(self, unit):
+        unit.request_finished(latency)
+        if failed:
+            unit.request_failed(now, may_open=any(
+                other.circuit == CircuitState.CLOSED for other in self._peers(unit)))
+        else:
+            unit.request_succeeded()
+
+        if isinstance(resp, NetworkError):
+            self._mark_unhealthy(unit)
+
+    def _peers(self, unit):
         """
-        Get new pool server state.
+        Get healthy pool servers other than the server which have the
+        same role, so they serve the same kind of requests.
 
         :param unit: Server metainfo.
         :type unit: :class:`~tarantool.connection_pool.PoolUnit`
 
-        :rtype: :class:`~tarantool.connection_pool.InstanceState`
+        :rtype: :obj:`list` of
+            :class:`~tarantool.connection_pool.PoolUnit`
 
         :meta private:
         """
 
-        conn = unit.conn
-
-        if conn.is_closed():
-            try:
-                conn.connect()
-            except NetworkError as exc:
-                msg = (f"Failed to connect to {unit.addr['host']}:{unit.addr['port']}, "
-                       f"reason: {repr(exc)}")
-                warn(msg, ClusterConnectWarning)
-                return InstanceState(Status.UNHEALTHY)
+        return [other for other in self.pool.values()
+                if other is not unit and other.state.status == Status.HEALTHY
+                and other.state.read_only == unit.state.read_only]
 
-        try:
-            resp = conn.call('box.info')
-        except NetworkError as exc:
-            msg = (f"Failed to get box.info for {unit.addr['host']}:{unit.addr['port']}, "
-                   f"reason: {repr(exc)}")
-            warn(msg, PoolTolopogyWarning)
-            return InstanceState(Status.UNHEALTHY)
+    def _is_outlier(self, unit, latency, now):
+        """
+        Check whether a response is more than
+        :data:`~tarantool.const.POOL_OUTLIER_LATENCY_FACTOR` times
+        slower than the median of response time averages of the server
+        peers (see :meth:`~tarantool.ConnectionPool._peers`). Only
+        peers which have responded in the last
+        :data:`~tarantool.const.POOL_LATENCY_DECAY_TIME` are taken
+        into account, and at least two of them are required for the
+        median to be representative.
 
-        try:
-            read_only = resp.data[0]['ro']
-        except (IndexError, KeyError) as exc:
-            msg = (f"Incorrect box.info response from {unit.addr['host']}:{unit.addr['port']}"
-                   f"reason: {repr(exc)}")
-            warn(msg, PoolTolopogyWarning)
-            return InstanceState(Status.UNHEALTHY)
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
 
-        try:
-            status = resp.data[0]['status']
+        :param latency: Request response time, in seconds.
+        :type latency: :obj:`float`
 
-            if status != 'running':
-                msg = f"{unit.addr['host']}:{unit.addr['port']} instance status is not 'running'"
-                warn(msg, PoolTolopogyWarning)
-                return InstanceState(Status.UNHEALTHY)
-        except (IndexError, KeyError) as exc:
-            msg = (f"Incorrect box.info response from {unit.addr['host']}:{unit.addr['port']}"
-                   f"reason: {repr(exc)}")
-            warn(msg, PoolTolopogyWarning)
-            return InstanceState(Status.UNHEALTHY)
+        :param now: Current :func:`time.monotonic` value.
+        :type now: :obj:`float`
 
-        return InstanceState(Status.HEALTHY, read_only)
+        :rtype: :obj:`bool`
 
-    def _refresh_state(self, key):
+        :meta private:
         """
-        Refresh pool server state.
 
-        :param key: Result of
-            :meth:`~tarantool.connection_pool._make_key`.
-        :type key: :obj:`str`
+        # Averages are not decayed: an idle server is not faster.
+        peers = sorted(other.latency for other in self._peers(unit)
+                       if other.latency_time is not None
+                       and now - other.latency_time <= POOL_LATENCY_DECAY_TIME)
+        if len(peers) < 2:
+            return False
+        return latency > peers[len(peers) // 2] * POOL_OUTLIER_LATENCY_FACTOR
 
-        :meta private:
+    def _send_hedged(self, mode, method_name, *args, **kwargs):
         """
+        Request wrapper for idempotent requests. Choose a pool server
+        based on mode and send a request with arguments. If the server
+        has not responded in
+        :paramref:`~tarantool.ConnectionPool.params.hedge_delay`,
+        send the same request to another server and return the first
+        successful response.
 
-        unit = self.pool[key]
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
 
-        state = self._get_new_state(unit)
-        if state != unit.state:
-            unit.state = state
-            self.strategy.update()
+        :param method_name: :class:`~tarantool.Connection`
+            method name.
+        :type method_name: :obj:`str`
 
-    def close(self):
-        """
-        Stop request processing, close each connection in the pool.
-        """
-        for unit in self.pool.values():
-            unit.request_processing_enabled = False
-            unit.thread.join()
+        :param args: Method args.
+        :type args: :obj:`tuple`
 
-            if not unit.conn.is_closed():
-                unit.conn.close()
+        :param kwargs: Method kwargs.
+        :type kwargs: :obj:`dict`
 
-    def is_closed(self):
-        """
-        Returns ``False`` if at least one connection is not closed and
-        is ready to process requests. Otherwise, returns ``True``.
+        :rtype: :class:`~tarantool.response.Response`
 
-        :rtype: :obj:`bool`
+        :raise: :meth:`~tarantool.ConnectionPool._send` exceptions
+
+        :meta private:
         """
 
-        return all(unit.request_processing_enabled is False for unit in self.pool.values())
+        # Unbounded, so a thread which lost the race does not block
+        # on putting a discarded response.
+        output_queue = queue.Queue()
+        start = time.monotonic()
 
-    def _request_process_loop(self, key, unit, last_refresh):
-        """
-        Request process background loop for a pool server. Started in
-        a separate thread, one thread per server.
+        def send(key):
+            unit = self.pool[key]
+            unit.request_started()
+            unit.input_queue.put(PoolTask(method_name=method_name, args=args, kwargs=kwargs,
+                                          output_queue=output_queue, key=key))
 
-        :param key: Result of
-            :meth:`~tarantool.connection_pool._make_key`.
-        :type key: :obj:`str`
+        first_key = self.strategy.getnext(mode)
+        send(first_key)
+        pending = {first_key}
 
-        :param unit: Server metainfo.
-        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+        try:
+            key, resp = output_queue.get(timeout=self.hedge_delay)
+        except queue.Empty:
+            # Strategies may return the same server several times
+            # in a row, try to find another one.
+            for _ in range(len(self.pool)):
+                second_key = self.strategy.getnext(mode)
+                if second_key != first_key:
+                    send(second_key)
+                    pending.add(second_key)
+                    break
+            key, resp = output_queue.get()
+
+        error = None
+        while True:
+            pending.remove(key)
+            self._request_finished(self.pool[key], time.monotonic() - start, resp)
+
+            if not isinstance(resp, Exception):
+                break
+
+            if error is None:
+                error = resp
+            if not pending:
+                raise error
+            key, resp = output_queue.get()
+
+        # Responses which lost the race are discarded, account
+        # the servers as responded now. The response status is unknown,
+        # so the circuit breaker state is left to other requests.
+        now = time.monotonic()
+        for key in pending:
+            self.pool[key].request_finished(now - start)
+            self.pool[key].request_abandoned(now)
+
+        return resp
 
-        :param last_refresh: Time of last metainfo refresh.
-        :type last_refresh: :obj:`float`
+    def _keys_by_mode(self, mode, keys=None):
         """
+        Get all healthy pool servers suitable for the request mode.
 
-        while unit.request_processing_enabled:
-            if not unit.input_queue.empty():
-                task = unit.input_queue.get()
-                method = getattr(Connection, task.method_name)
-                try:
-                    resp = method(unit.conn, *task.args, **task.kwargs)
-                except Exception as exc:  # pylint: disable=bad-option-value,broad-exception-caught,broad-except
-                    unit.output_queue.put(exc)
-                else:
-                    unit.output_queue.put(resp)
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
 
-            now = time.time()
+        :param keys: Servers to choose from. If ``None``, all pool
+            servers are used.
+        :type keys: :obj:`list` of :obj:`str`, optional
 
-            if now - last_refresh > self.refresh_delay:
-                self._refresh_state(key)
-                last_refresh = time.time()
+        :rtype: :obj:`list` of :obj:`str`
 
-    def connect(self):
-        """
-        Create a connection to each address specified on
-        initialization and start background process threads for them.
-        There is no need to call this method explicitly until you have
-        set ``connect_now=False`` on initialization.
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
 
-        If some connections have failed to connect successfully or
-        provide `box.info`_ status (including the case when all of them
-        have failed), no exceptions are raised. Attempts to reconnect
-        and refresh the info would be processed in the background.
+        :meta private:
         """
 
-        for key, unit in self.pool.items():
-            self._refresh_state(key)
-            last_refresh = time.time()
-
-            unit.thread = threading.Thread(
-                target=self._request_process_loop,
-                args=(key, unit, last_refresh),
-                daemon=True,
-            )
-            unit.request_processing_enabled = True
-            unit.thread.start()
+        any_keys = []
+        rw_keys = []
+        ro_keys = []
+        lagging_keys = []
+        for key in self.pool if keys is None else keys:
+            unit = self.pool[key]
+            if unit.state.status == Status.UNHEALTHY:
+                continue
+            any_keys.append(key)
+            if unit.state.read_only is False:
+                rw_keys.append(key)
+            elif unit.state.lagging:
+                lagging_keys.append(key)
+            else:
+                ro_keys.append(key)
 
-    def _send(self, mode, method_name, *args, **kwargs):
+        err_msg = "Can't find healthy instance in pool"
+        if mode == Mode.ANY:
+            chosen = any_keys
+        elif mode == Mode.RW:
+            chosen = rw_keys
+            err_msg = "Can't find healthy rw instance in pool"
+        elif mode == Mode.RO:
+            chosen = ro_keys
+            err_msg = "Can't find healthy ro instance in pool"
+        elif mode == Mode.PREFER_RO:
+            chosen = ro_keys or rw_keys
+        elif mode == Mode.PREFER_RW:
+            chosen = rw_keys or ro_keys or lagging_keys
+        else:
+            raise ValueError(f"Unexpected mode {mode}")
+
+        if not chosen:
+            raise PoolTolopogyError(err_msg)
+        return chosen
+
+    def _send_all(self, mode, timeout, method_name, *args, **kwargs):
         """
-        Request wrapper. Choose a pool server based on mode and send
-        a request with arguments.
+        Request wrapper. Send a request with arguments to all pool
+        servers suitable for the mode concurrently and gather the
+        responses.
 
-        :param mode: Request mode.
+        :param mode: Request mode. ``Mode.PREFER_RW`` and
+            ``Mode.PREFER_RO`` choose all RW (RO) servers if there are
+            any, and all RO (RW) servers otherwise.
         :type mode: :class:`~tarantool.Mode`
 
+        :param timeout: Time to wait for all responses, in seconds.
+            ``None`` means no limit.
+        :type timeout: :obj:`float` or :obj:`None`
+
         :param method_name: :class:`~tarantool.Connection`
             method name.
         :type method_name: :obj:`str`
@@ -708,31 +1981,44 @@ class ConnectionPool(ConnectionInterface):
         :param kwargs: Method kwargs.
         :type kwargs: :obj:`dict`
 
-        :rtype: :class:`~tarantool.response.Response`
+        :return: Response or exception for each server, by
+            :meth:`~tarantool.connection_pool._make_key` key. Servers
+            which have not responded in time have
+            :exc:`~tarantool.error.PoolTimeoutError`.
+        :rtype: :obj:`dict`
 
-        :raise: :exc:`~AssertionError`,
-            :exc:`~tarantool.error.DatabaseError`,
-            :exc:`~tarantool.error.SchemaError`,
-            :exc:`~tarantool.error.NetworkError`,
-            :exc:`~tarantool.error.SslError`
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
 
         :meta private:
         """
 
-        key = self.strategy.getnext(mode)
-        unit = self.pool[key]
-
-        task = PoolTask(method_name=method_name, args=args, kwargs=kwargs)
-
-        unit.input_queue.put(task)
-        resp = unit.output_queue.get()
+        tasks = {}
+        start = time.monotonic()
+        for key in self._keys_by_mode(mode):
+            unit = self.pool[key]
+            task = PoolTask(method_name=method_name, args=args, kwargs=kwargs)
+            unit.request_started()
+            unit.input_queue.put(task)
+            tasks[key] = task
 
-        if isinstance(resp, Exception):
-            raise resp
+        results = {}
+        for key, task in tasks.items():
+            unit = self.pool[key]
+            try:
+                if timeout is None:
+                    resp = task.output_queue.get()
+                else:
+                    resp = task.output_queue.get(
+                        timeout=max(start + timeout - time.monotonic(), 0))
+            except queue.Empty:
+                resp = PoolTimeoutError(f"{key} has not responded in {timeout} seconds")
+            self._request_finished(unit, time.monotonic() - start, resp)
+            results[key] = resp
 
-        return resp
+        return results
 
-    def call(self, func_name, *args, mode=None, on_push=None, on_push_ctx=None):
+    def call(self, func_name, *args, mode=None, on_push=None, on_push_ctx=None,
+             min_vclock=None):
         """
         Execute a CALL request on the pool server: call a stored Lua
         function. Refer to :meth:`~tarantool.Connection.call`.
@@ -746,6 +2032,9 @@ class ConnectionPool(ConnectionInterface):
         :param mode: Request mode.
         :type mode: :class:`~tarantool.Mode`
 
+        :param min_vclock: Refer to
+            :paramref:`~tarantool.ConnectionPool.select.params.min_vclock`.
+
         :param on_push: Refer to
             :paramref:`~tarantool.Connection.call.params.on_push`.
 
@@ -761,9 +2050,13 @@ class ConnectionPool(ConnectionInterface):
         if mode is None:
             raise ValueError("Please, specify 'mode' keyword argument")
 
+        if min_vclock is not None:
+            return self._send_to(self._caught_up_key(mode, min_vclock), 'call', func_name,
+                                 *args, on_push=on_push, on_push_ctx=on_push_ctx)
+
         return self._send(mode, 'call', func_name, *args, on_push=on_push, on_push_ctx=on_push_ctx)
 
-    def eval(self, expr, *args, mode=None, on_push=None, on_push_ctx=None):
+    def eval(self, expr, *args, mode=None, on_push=None, on_push_ctx=None, min_vclock=None):
         """
         Execute an EVAL request on the pool server: evaluate a Lua
         expression. Refer to :meth:`~tarantool.Connection.eval`.
@@ -777,6 +2070,9 @@ class ConnectionPool(ConnectionInterface):
         :param mode: Request mode.
         :type mode: :class:`~tarantool.Mode`
 
+        :param min_vclock: Refer to
+            :paramref:`~tarantool.ConnectionPool.select.params.min_vclock`.
+
         :param on_push: Refer to
             :paramref:`~tarantool.Connection.eval.params.on_push`.
 
@@ -792,8 +2088,173 @@ class ConnectionPool(ConnectionInterface):
         if mode is None:
             raise ValueError("Please, specify 'mode' keyword argument")
 
+        if min_vclock is not None:
+            return self._send_to(self._caught_up_key(mode, min_vclock), 'eval', expr,
+                                 *args, on_push=on_push, on_push_ctx=on_push_ctx)
+
         return self._send(mode, 'eval', expr, *args, on_push=on_push, on_push_ctx=on_push_ctx)
 
+    def vclock_token(self, *, mode=Mode.RW):
+        """
+        Get a read-your-writes token: the vclock of the server which
+        processes writes. Pass it as ``min_vclock`` to later reads, so
+        they are routed only to servers which have replicated the
+        writes made before the token was taken.
+
+        .. code-block:: python
+
+            >>> pool.insert('demo', ['AAAA', 'Alpha'])
+            >>> token = pool.vclock_token()
+            >>> pool.select('demo', 'AAAA', mode=tarantool.Mode.PREFER_RO, min_vclock=token)
+            - ['AAAA', 'Alpha']
+
+        Replica vclocks are known only if
+        :paramref:`~tarantool.ConnectionPool.params.max_replica_lag`
+        is set and are updated on state probes, so reads right after
+        a write usually go to a read-write server. Tokens are reliable
+        if there is a single read-write server in the pool.
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`, optional
+
+        :return: Vclock: replica ID to LSN.
+        :rtype: :obj:`dict`
+
+        :raise: :meth:`~tarantool.ConnectionPool.eval` exceptions
+        """
+
+        return vclock_from_lua(self._send(mode, 'eval', 'return box.info.vclock').data[0])
+
+    def _caught_up_key(self, mode, min_vclock):
+        """
+        Choose a pool server suitable for the request mode which has
+        replicated all changes of a vclock. Read-write servers are
+        considered up to date. If there is no such server, a
+        read-write server is chosen.
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
+
+        :param min_vclock: Refer to
+            :paramref:`~tarantool.ConnectionPool.select.params.min_vclock`.
+        :type min_vclock: :obj:`dict`
+
+        :rtype: :obj:`str`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        try:
+            keys = self._keys_by_mode(mode)
+        except PoolTolopogyError:
+            keys = []
+
+        now = time.monotonic()
+        caught_up = [key for key in keys
+                     if self.pool[key].circuit_allows(now)
+                     and (self.pool[key].state.read_only is False
+                          or vclock_covers(self.pool[key].state.vclock, min_vclock))]
+        if caught_up:
+            return random.choice(caught_up)
+        return self.strategy.getnext(Mode.RW)
+
+    def call_all(self, func_name, *args, mode=Mode.ANY, timeout=None):
+        """
+        Execute a CALL request on each pool server suitable for the
+        mode concurrently: call a stored Lua function on all of them.
+        Refer to :meth:`~tarantool.Connection.call`.
+
+        .. code-block:: python
+
+            >>> results = pool.call_all('box.stat', mode=tarantool.Mode.RO, timeout=1)
+            >>> for key, resp in results.items():
+            ...     if isinstance(resp, Exception):
+            ...         print(key, 'failed:', resp)
+            ...     else:
+            ...         print(key, resp[0]['SELECT'])
+
+        :param func_name: Refer to
+            :paramref:`~tarantool.Connection.call.params.func_name`.
+
+        :param args: Refer to
+            :paramref:`~tarantool.Connection.call.params.args`.
+
+        :param mode: Request mode. ``Mode.PREFER_RW`` and
+            ``Mode.PREFER_RO`` choose all RW (RO) servers if there are
+            any, and all RO (RW) servers otherwise.
+        :type mode: :class:`~tarantool.Mode`, optional
+
+        :param timeout: Time to wait for all responses, in seconds.
+            Servers which have not responded in time get
+            :exc:`~tarantool.error.PoolTimeoutError` result, their
+            requests are not cancelled. ``None`` means no limit.
+        :type timeout: :obj:`float`, optional
+
+        :return: :class:`~tarantool.response.Response` or
+            :meth:`~tarantool.Connection.call` exception for each
+            server, by ``"host:port"`` key.
+        :rtype: :obj:`dict`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+        """
+
+        return self._send_all(mode, timeout, 'call', func_name, *args)
+
+    def map_reduce(self, func_name, *args, reducer, initializer=None, mode=Mode.ANY,
+                   timeout=None):
+        """
+        Execute a CALL request on each pool server suitable for the
+        mode concurrently (see :meth:`~tarantool.ConnectionPool.call_all`)
+        and reduce the responses with :func:`functools.reduce`.
+
+        .. code-block:: python
+
+            >>> pool.map_reduce('get_count', 'users',
+            ...                 reducer=lambda acc, resp: acc + resp[0],
+            ...                 initializer=0, mode=tarantool.Mode.RO)
+            1024
+
+        :param func_name: Refer to
+            :paramref:`~tarantool.Connection.call.params.func_name`.
+
+        :param args: Refer to
+            :paramref:`~tarantool.Connection.call.params.args`.
+
+        :param reducer: Function of an accumulated value and
+            a server response.
+        :type reducer: callable[[:obj:`object`,
+            :class:`~tarantool.response.Response`], :obj:`object`]
+
+        :param initializer: Initial accumulated value. If ``None``,
+            the first response is used.
+        :type initializer: :obj:`object`, optional
+
+        :param mode: Refer to
+            :paramref:`~tarantool.ConnectionPool.call_all.params.mode`.
+
+        :param timeout: Refer to
+            :paramref:`~tarantool.ConnectionPool.call_all.params.timeout`.
+
+        :return: Reduced value.
+
+        :raise: :exc:`~tarantool.error.PoolManyError`,
+            :exc:`~tarantool.error.PoolTolopogyError`
+        """
+
+        results = self.call_all(func_name, *args, mode=mode, timeout=timeout)
+
+        responses = {key: resp for key, resp in results.items()
+                     if not isinstance(resp, Exception)}
+        if len(responses) != len(results):
+            errors = {key: resp for key, resp in results.items() if isinstance(resp, Exception)}
+            raise PoolManyError(responses, errors)
+
+        if initializer is None:
+            return functools.reduce(reducer, responses.values())
+        return functools.reduce(reducer, responses.values(), initializer)
+
     def replace(self, space_name, values, *, mode=Mode.RW, on_push=None, on_push_ctx=None):
         """
         Execute a REPLACE request on the pool server: `replace`_ a tuple
@@ -985,7 +2446,8 @@ class ConnectionPool(ConnectionInterface):
         return self._send(mode, 'ping', notime)
 
     def select(self, space_name, key, *, offset=0, limit=0xffffffff,
-               index=0, iterator=None, mode=Mode.ANY, on_push=None, on_push_ctx=None):
+               index=0, iterator=None, mode=Mode.ANY, on_push=None, on_push_ctx=None,
+               min_vclock=None):
         """
         Execute a SELECT request on the pool server: `update`_ a tuple
         from the space. Refer to :meth:`~tarantool.Connection.select`.
@@ -1017,6 +2479,13 @@ class ConnectionPool(ConnectionInterface):
         :param on_push_ctx: Refer to
             :paramref:`~tarantool.Connection.select.params.on_push_ctx`.
 
+        :param min_vclock: Read-your-writes token returned by
+            :meth:`~tarantool.ConnectionPool.vclock_token`. If set,
+            the request is sent only to a server which has replicated
+            the token changes, or to a read-write server if there is
+            no such server.
+        :type min_vclock: :obj:`dict`, optional
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :meth:`~tarantool.Connection.select` exceptions
@@ -1024,6 +2493,16 @@ class ConnectionPool(ConnectionInterface):
         .. _select: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/select/
         """
 
+        if min_vclock is not None:
+            return self._send_to(self._caught_up_key(mode, min_vclock), 'select', space_name,
+                                 key, offset=offset, limit=limit, index=index,
+                                 iterator=iterator, on_push=on_push, on_push_ctx=on_push_ctx)
+
+        if (self.hedge_delay is not None and mode in (Mode.RO, Mode.PREFER_RO)
+                and on_push is None):
+            return self._send_hedged(mode, 'select', space_name, key, offset=offset,
+                                     limit=limit, index=index, iterator=iterator)
+
         return self._send(mode, 'select', space_name, key, offset=offset, limit=limit,
                           index=index, iterator=iterator, on_push=on_push, on_push_ctx=on_push_ctx)
 
@@ -42,7 +42,10 @@ IPROTO_ERROR = 0x52
 #
 IPROTO_VERSION = 0x54
 IPROTO_FEATURES = 0x55
+IPROTO_EVENT_KEY = 0x57
 IPROTO_AUTH_TYPE = 0x5b
+IPROTO_SPACE_NAME = 0x5e
+IPROTO_INDEX_NAME = 0x5f
 IPROTO_CHUNK = 0x80
 
 IPROTO_GREETING_SIZE = 128
@@ -64,6 +67,7 @@ REQUEST_TYPE_PING = 0x40
 REQUEST_TYPE_JOIN = 0x41
 REQUEST_TYPE_SUBSCRIBE = 0x42
 REQUEST_TYPE_ID = 0x49
+REQUEST_TYPE_WATCH_ONCE = 0x4d
 REQUEST_TYPE_ERROR = 1 << 15
 
 SPACE_SCHEMA = 272
@@ -135,11 +139,29 @@ POOL_REFRESH_DELAY = 1
 POOL_INSTANCE_RECONNECT_MAX_ATTEMPTS = 0
 # Default delay between attempts to reconnect (seconds)
 POOL_INSTANCE_RECONNECT_DELAY = 0
+# Default number of connections to each pool instance
+POOL_CONNECTIONS_PER_INSTANCE = 1
+# Time constant of pool server latency moving average (seconds)
+POOL_LATENCY_DECAY_TIME = 10
+# Number of consecutive failed requests to open pool server circuit
+POOL_CIRCUIT_FAILURE_THRESHOLD = 5
+# Time to keep pool server circuit open before a trial request (seconds)
+POOL_CIRCUIT_OPEN_TIME = 1
+# Pool server response is failed if it is this times slower than
+# the median response time average of other servers of the same role
+# which have responded recently
+POOL_OUTLIER_LATENCY_FACTOR = 10
+# Time to wait for vshard storages bucket map responses (seconds)
+POOL_BUCKETS_REFRESH_TIMEOUT = 5
+# Minimal interval between bucket map refreshes for a bucket which
+# was not found on any storage on the previous refresh (seconds)
+POOL_BUCKETS_MISSING_DELAY = 1
 
 # Tarantool master 970ea48 protocol version is 6
 CONNECTOR_IPROTO_VERSION = 6
 # List of connector-supported features
-CONNECTOR_FEATURES = [IPROTO_FEATURE_ERROR_EXTENSION]
+CONNECTOR_FEATURES = [IPROTO_FEATURE_ERROR_EXTENSION, IPROTO_FEATURE_SPACE_AND_INDEX_NAMES,
+                      IPROTO_FEATURE_WATCH_ONCE]
 
 # Authenticate with CHAP-SHA1 (Tarantool CE and EE)
 AUTH_TYPE_CHAP_SHA1 = "chap-sha1"
@@ -147,3 +169,8 @@ AUTH_TYPE_CHAP_SHA1 = "chap-sha1"
 AUTH_TYPE_PAP_SHA256 = "pap-sha256"
 # List of supported auth types.
 AUTH_TYPES = [AUTH_TYPE_CHAP_SHA1, AUTH_TYPE_PAP_SHA256]
+
+# Load all spaces and indexes schema on connect and schema reload
+SCHEMA_PRELOAD_ALL = "all"
+# List of supported schema preload modes.
+SCHEMA_PRELOAD_MODES = [SCHEMA_PRELOAD_ALL, None]
@@ -208,6 +208,12 @@ class SchemaError(DatabaseError):
         return str(self.value)
 
 
+class SchemaCacheWarning(UserWarning):
+    """
+    Warning related to schema cache file.
+    """
+
+
 class SchemaReloadException(DatabaseError):
     """
     Error related to outdated space and index schema.
@@ -325,6 +331,39 @@ class PoolTolopogyError(DatabaseError):
     """
 
 
+class PoolTimeoutError(DatabaseError):
+    """
+    Exception raised if a pool server has not responded to a request
+    in time.
+    """
+
+
+class PoolManyError(DatabaseError):
+    """
+    Exception raised if a request sent to several pool servers has
+    failed on some of them.
+    """
+
+    def __init__(self, results, errors):
+        """
+        Sets fields with results and errors.
+
+        :param results: Successful responses by pool server key.
+        :type results: :obj:`dict`
+
+        :param errors: Exceptions by pool server key.
+        :type errors: :obj:`dict`
+        """
+
+        exc_msg = (f"Request failed on {len(errors)} of {len(results) + len(errors)} "
+                   "instances, see errors")
+        super().__init__(0, exc_msg)
+        # Sets dict of tarantool.response.Response objects.
+        self.results = results
+        # Sets dict of exceptions.
+        self.errors = errors
+
+
 class CrudModuleError(DatabaseError):
     """
     Exception raised for errors that are related to
@@ -28,6 +28,7 @@ from tarantool.const import (
     DEFAULT_SSL_PASSWORD,
     DEFAULT_SSL_PASSWORD_FILE,
     CLUSTER_DISCOVERY_DELAY,
+    SCHEMA_PRELOAD_ALL,
 )
 
 from tarantool.request import (
@@ -290,7 +291,10 @@ class MeshConnection(Connection):
                  strategy_class=RoundRobinStrategy,
                  cluster_discovery_function=None,
                  cluster_discovery_delay=CLUSTER_DISCOVERY_DELAY,
-                 fetch_schema=True):
+                 fetch_schema=True,
+                 schema_preload=SCHEMA_PRELOAD_ALL,
+                 schema_cache=None,
+                 schema_registry=None):
         """
         :param host: Refer to
             :paramref:`~tarantool.Connection.params.host`.
@@ -435,6 +439,15 @@ class MeshConnection(Connection):
         :param fetch_schema: Refer to
             :paramref:`~tarantool.Connection.params.fetch_schema`.
 
+        :param schema_preload: Refer to
+            :paramref:`~tarantool.Connection.params.schema_preload`.
+
+        :param schema_cache: Refer to
+            :paramref:`~tarantool.Connection.params.schema_cache`.
+
+        :param schema_registry: Refer to
+            :paramref:`~tarantool.Connection.params.schema_registry`.
+
         :raises: :exc:`~tarantool.error.ConfigurationError`,
             :class:`~tarantool.Connection` exceptions,
             :class:`~tarantool.MeshConnection.connect` exceptions
@@ -501,7 +514,10 @@ class MeshConnection(Connection):
             ssl_password=addr['ssl_password'],
             ssl_password_file=addr['ssl_password_file'],
             auth_type=addr['auth_type'],
-            fetch_schema=fetch_schema)
+            fetch_schema=fetch_schema,
+            schema_preload=schema_preload,
+            schema_cache=schema_cache,
+            schema_registry=schema_registry)
 
     def connect(self):
         """
@@ -40,7 +40,7 @@ List of the field IDs:
 .. _datetime.interval: https://www.tarantool.io/en/doc/latest/dev_guide/internals/msgpack_extensions/#the-interval-type
 """
 
-import msgpack
+from struct import Struct, error as struct_error
 
 from tarantool.error import MsgpackError
 
@@ -51,6 +51,100 @@ EXT_ID = 6
 `datetime.interval`_ type id.
 """
 
+FIELD_NAMES = tuple(id_map.values())
+"""
+Interval field names in the field id order.
+
+:meta private:
+"""
+
+ADJUST_FIELD_ID = 8
+
+ADJUST_BY_VALUE = {adjust.value: adjust for adjust in Adjust}
+
+MP_UINT_FORMATS = (
+    (0xff, 0xcc, Struct('>B')),
+    (0xffff, 0xcd, Struct('>H')),
+    (0xffffffff, 0xce, Struct('>I')),
+    (0xffffffffffffffff, 0xcf, Struct('>Q')),
+)
+
+MP_INT_FORMATS = (
+    (-0x80, 0xd0, Struct('>b')),
+    (-0x8000, 0xd1, Struct('>h')),
+    (-0x80000000, 0xd2, Struct('>i')),
+    (-0x8000000000000000, 0xd3, Struct('>q')),
+)
+
+MP_INT_DECODERS = {
+    code: packer for _, code, packer in MP_UINT_FORMATS + MP_INT_FORMATS
+}
+
+
+def pack_int(value, buf):
+    """
+    Append MessagePack integer to the buffer. The most compact
+    representation is used, same as in the msgpack module.
+
+    :param value: Integer to pack.
+    :type value: :obj:`int`
+
+    :param buf: Output buffer.
+    :type buf: :obj:`bytearray`
+
+    :raise: :exc:`OverflowError`
+
+    :meta private:
+    """
+
+    if -0x20 <= value <= 0x7f:
+        # positive and negative fixint
+        buf.append(value & 0xff)
+        return
+
+    formats = MP_UINT_FORMATS if value > 0 else MP_INT_FORMATS
+    for limit, code, packer in formats:
+        if (value <= limit) if value > 0 else (value >= limit):
+            buf.append(code)
+            buf += packer.pack(value)
+            return
+
+    raise OverflowError("Integer value out of range")
+
+
+def unpack_int(data, cursor):
+    """
+    Parse MessagePack integer.
+
+    :param data: MessagePack binary data.
+    :type data: :obj:`bytes`
+
+    :param cursor: Index of the first byte to parse.
+    :type cursor: :obj:`int`
+
+    :return: First value: parsed integer, second value: new cursor
+        position.
+    :rtype: first value: :obj:`int`, second value: :obj:`int`
+
+    :raise: :exc:`MsgpackError`
+
+    :meta private:
+    """
+
+    code = data[cursor]
+    cursor += 1
+
+    if code <= 0x7f:
+        return code, cursor
+    if code >= 0xe0:
+        return code - 0x100, cursor
+
+    packer = MP_INT_DECODERS.get(code)
+    if packer is None:
+        raise MsgpackError(f'Unexpected interval value type 0x{code:02x}')
+
+    return packer.unpack_from(data, cursor)[0], cursor + packer.size
+
 
 def encode(obj, _):
     """
@@ -61,36 +155,41 @@ def encode(obj, _):
 
     :return: Encoded interval.
     :rtype: :obj:`bytes`
+
+    :raise: :exc:`OverflowError`
     """
 
-    buf = bytes()
+    buf = bytearray(1)
 
     count = 0
-    for field_id, field_name in id_map.items():
+    for field_id, field_name in enumerate(FIELD_NAMES):
         value = getattr(obj, field_name)
 
-        if field_name == 'adjust':
+        if field_id == ADJUST_FIELD_ID:
             value = value.value
 
         if value != 0:
-            buf = buf + msgpack.packb(field_id) + msgpack.packb(value)
+            # Field ids are positive fixint.
+            buf.append(field_id)
+            pack_int(value, buf)
             count = count + 1
 
-    buf = msgpack.packb(count) + buf
+    # There are less than 16 fields, so count is positive fixint.
+    buf[0] = count
 
-    return buf
+    return bytes(buf)
 
 
-def decode(data, unpacker):
+def decode(data, _):
     """
     Decode an interval object.
 
+    The payload is parsed in a single pass without an intermediate
+    msgpack unpacker.
+
     :param obj: Interval to decode.
     :type obj: :obj:`bytes`
 
-    :param unpacker: msgpack unpacker to decode fields.
-    :type unpacker: :class:`msgpack.Unpacker`
-
     :return: Decoded interval.
     :rtype: :class:`tarantool.Interval`
 
@@ -98,39 +197,32 @@ def decode(data, unpacker):
     """
 
     # If MessagePack data does not contain a field value, it is zero.
-    # If built not from MessagePack data, set argument values later.
-    kwargs = {
-        'year': 0,
-        'month': 0,
-        'week': 0,
-        'day': 0,
-        'hour': 0,
-        'minute': 0,
-        'sec': 0,
-        'nsec': 0,
-        'adjust': Adjust(0),
-    }
+    values = [0, 0, 0, 0, 0, 0, 0, 0]
+    adjust = Adjust.EXCESS
 
     if len(data) != 0:
-        # Unpacker object is the only way to parse
-        # a sequence of values in Python msgpack module.
-        unpacker.feed(data)
-        field_count = unpacker.unpack()
-        for _ in range(field_count):
-            field_id = unpacker.unpack()
-            value = unpacker.unpack()
-
-            if field_id not in id_map:
-                raise MsgpackError(f'Unknown interval field id {field_id}')
-
-            field_name = id_map[field_id]
-
-            if field_name == 'adjust':
-                try:
-                    value = Adjust(value)
-                except ValueError as exc:
-                    raise MsgpackError(exc) from exc
-
-            kwargs[id_map[field_id]] = value
-
-    return Interval(**kwargs)
+        try:
+            field_count, cursor = unpack_int(data, 0)
+            for _ in range(field_count):
+                field_id, cursor = unpack_int(data, cursor)
+                value, cursor = unpack_int(data, cursor)
+
+                if field_id == ADJUST_FIELD_ID:
+                    adjust = ADJUST_BY_VALUE.get(value)
+                    if adjust is None:
+                        raise MsgpackError(f'{value} is not a valid Adjust')
+                elif 0 <= field_id < ADJUST_FIELD_ID:
+                    values[field_id] = value
+                else:
+                    raise MsgpackError(f'Unknown interval field id {field_id}')
+        except (IndexError, struct_error) as exc:
+            raise MsgpackError('Unexpected end of interval payload') from exc
+
+    # Interval fields are plain attributes, so the object could be
+    # filled without building kwargs for the constructor.
+    interval = Interval.__new__(Interval)
+    (interval.year, interval.month, interval.week, interval.day,
+     interval.hour, interval.minute, interval.sec, interval.nsec) = values
+    interval.adjust = adjust
+
+    return interval
@@ -12,6 +12,7 @@ from msgpack import ExtType
 from tarantool.types import BoxError
 from tarantool.msgpack_ext.types.datetime import Datetime
 from tarantool.msgpack_ext.types.interval import Interval
+from tarantool.msgpack_ext.types.uuid import RawUUID
 
 import tarantool.msgpack_ext.decimal as ext_decimal
 import tarantool.msgpack_ext.uuid as ext_uuid
@@ -22,31 +23,43 @@ import tarantool.msgpack_ext.interval as ext_interval
 encoders = [
     {'type': Decimal, 'ext': ext_decimal},
     {'type': UUID, 'ext': ext_uuid},
+    {'type': RawUUID, 'ext': ext_uuid},
     {'type': BoxError, 'ext': ext_error},
     {'type': Datetime, 'ext': ext_datetime},
     {'type': Interval, 'ext': ext_interval},
 ]
 
 
-def default(obj, packer=None):
+def default(obj, packer=None, ext_encoders=None):
     """
     :class:`msgpack.Packer` encoder.
 
     :param obj: Object to encode.
     :type obj: :class:`decimal.Decimal` or :class:`uuid.UUID` or
-         or :class:`tarantool.BoxError` or :class:`tarantool.Datetime`
-         or :class:`tarantool.Interval`
+         :class:`tarantool.RawUUID` or :class:`tarantool.BoxError` or
+         :class:`tarantool.Datetime` or :class:`tarantool.Interval`
 
     :param packer: msgpack packer to work with common types
         (like dictionary in extended error payload)
     :type packer: :class:`msgpack.Packer`, optional
 
+    :param ext_encoders: Python type to ``(ext_id, encode)`` dispatch
+        table, see :attr:`tarantool.ExtTypeRegistry.encoders`.
+        Defaults to module ``encoders``.
+    :type ext_encoders: :obj:`dict`, optional
+
     :return: Encoded value.
     :rtype: :class:`msgpack.ExtType`
 
     :raise: :exc:`~TypeError`
     """
 
+    if ext_encoders is not None:
+        codec = ext_encoders[type(obj)]
+        if codec is not None:
+            return ExtType(codec[0], codec[1](obj, packer))
+        raise TypeError(f"Unknown type: {repr(obj)}")
+
     for encoder in encoders:
         if isinstance(obj, encoder['type']):
             return ExtType(encoder['ext'].EXT_ID, encoder['ext'].encode(obj, packer))
@@ -0,0 +1,176 @@
+"""
+Tarantool `extension`_ types codec registry.
+
+.. _extension: https://www.tarantool.io/en/doc/latest/dev_guide/internals/msgpack_extensions/
+"""
+
+from msgpack import ExtType
+
+from tarantool.msgpack_ext.packer import encoders as default_encoders
+from tarantool.msgpack_ext.unpacker import decoders as default_decoders
+
+
+class EncoderTable(dict):
+    """
+    Python type to ``(ext_id, encode)`` dispatch table. Subclasses of
+    registered types are resolved with :func:`issubclass` on first
+    lookup and cached, types without encoder are mapped to ``None``.
+
+    :meta private:
+    """
+
+    def __init__(self, entries):
+        """
+        :param entries: Prioritized list of
+            ``(python_type, ext_id, encode)`` entries.
+        :type entries: :obj:`list`
+        """
+
+        super().__init__()
+        self.entries = entries
+        for python_type, ext_id, encode in reversed(entries):
+            self[python_type] = (ext_id, encode)
+
+    def __missing__(self, obj_type):
+        for python_type, ext_id, encode in self.entries:
+            if issubclass(obj_type, python_type):
+                codec = (ext_id, encode)
+                break
+        else:
+            codec = None
+
+        self[obj_type] = codec
+        return codec
+
+
+def passthrough_decoder(ext_id):
+    """
+    Build a decoder which leaves extension type value as is.
+
+    :param ext_id: MessagePack extension type code.
+    :type ext_id: :obj:`int`
+
+    :rtype: :obj:`function`
+
+    :meta private:
+    """
+
+    def decode(data, _):
+        return ExtType(ext_id, data)
+
+    return decode
+
+
+class ExtTypeRegistry():
+    """
+    Set of MessagePack extension type codecs used by a connection.
+
+    Each :class:`~tarantool.Connection` has its own registry
+    (see :attr:`~tarantool.Connection.ext_types`) initialized with
+    built-in codecs, so codecs could be replaced or disabled without
+    affecting other connections:
+
+    .. code-block:: python
+
+        >>> conn = tarantool.Connection(host, port)
+        >>> # Leave datetime values as msgpack.ExtType for passthrough.
+        >>> conn.ext_types.disable(tarantool.msgpack_ext.datetime.EXT_ID)
+        >>> # Use application-specific decimal type.
+        >>> conn.ext_types.register(tarantool.msgpack_ext.decimal.EXT_ID,
+        ...                         python_type=MyDecimal,
+        ...                         encode=my_decimal_encode,
+        ...                         decode=my_decimal_decode)
+
+    Codecs follow built-in codecs signatures: ``encode(obj, packer)``
+    returns extension type payload :obj:`bytes`,
+    ``decode(data, unpacker)`` returns Python object.
+
+    The registry is compiled into dispatch tables on each change, so
+    lookups in requests and responses cost a single dictionary access.
+    """
+
+    def __init__(self):
+        self._decoders = dict(default_decoders)
+        self._encoders = [(encoder['type'], encoder['ext'].EXT_ID, encoder['ext'].encode)
+                          for encoder in default_encoders]
+        self._compile()
+
+    def _compile(self):
+        """
+        Rebuild dispatch tables. New tables are built instead of
+        updating existing ones, so packers and unpackers that are in
+        use always see a consistent state.
+
+        :meta private:
+        """
+
+        self.decoders = dict(self._decoders)
+        self.encoders = EncoderTable(list(self._encoders))
+
+    def register(self, ext_id, *, python_type=None, encode=None, decode=None):
+        """
+        Register a codec for an extension type. Replaces the existing
+        decoder for ``ext_id`` and the existing encoder for
+        ``python_type``. Encoders for other Python types with the same
+        ``ext_id`` are kept.
+
+        :param ext_id: MessagePack extension type code.
+        :type ext_id: :obj:`int`
+
+        :param python_type: Python type to encode with ``encode``.
+            Registered types have priority over previously registered
+            ones for subclass lookup.
+        :type python_type: :obj:`type`, optional
+
+        :param encode: Encode function.
+        :type encode: callable[[:obj:`object`, :class:`msgpack.Packer`], :obj:`bytes`],
+            optional
+
+        :param decode: Decode function.
+        :type decode: callable[[:obj:`bytes`, :class:`msgpack.Unpacker`], :obj:`object`],
+            optional
+
+        :raise: :exc:`ValueError`
+        """
+
+        if (python_type is None) != (encode is None):
+            raise ValueError('python_type and encode should be both set or unset')
+        if python_type is None and decode is None:
+            raise ValueError('Nothing to register')
+
+        if python_type is not None:
+            self._encoders = [entry for entry in self._encoders if entry[0] is not python_type]
+            self._encoders.insert(0, (python_type, ext_id, encode))
+        if decode is not None:
+            self._decoders[ext_id] = decode
+
+        self._compile()
+
+    def disable(self, ext_id):
+        """
+        Disable codecs for an extension type: values are decoded to
+        :class:`msgpack.ExtType` as is and encoders of Python types
+        for ``ext_id`` are removed. :class:`msgpack.ExtType` values
+        are packed as is, so data could be forwarded back to Tarantool.
+
+        :param ext_id: MessagePack extension type code.
+        :type ext_id: :obj:`int`
+        """
+
+        self._encoders = [entry for entry in self._encoders if entry[1] != ext_id]
+        self._decoders[ext_id] = passthrough_decoder(ext_id)
+
+        self._compile()
+
+    def copy(self):
+        """
+        Copy the registry.
+
+        :rtype: :class:`~tarantool.ExtTypeRegistry`
+        """
+
+        new = ExtTypeRegistry.__new__(ExtTypeRegistry)
+        new._decoders = dict(self._decoders)  # pylint: disable=protected-access
+        new._encoders = list(self._encoders)  # pylint: disable=protected-access
+        new._compile()  # pylint: disable=protected-access
+        return new
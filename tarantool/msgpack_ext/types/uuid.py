@@ -0,0 +1,100 @@
+"""
+Tarantool `uuid`_ extension type implementation module.
+
+.. _uuid: https://www.tarantool.io/en/doc/latest/dev_guide/internals/msgpack_extensions/#the-uuid-type
+"""
+
+from uuid import UUID
+
+
+class RawUUID():
+    """
+    Class representing Tarantool `uuid`_ value as raw 16 bytes.
+
+    It is returned instead of :class:`uuid.UUID` if a connection is
+    opened with :paramref:`~tarantool.Connection.params.raw_uuid`.
+    The object is cheap to build and hash, so it suits well for using
+    UUIDs as opaque dictionary keys or forwarding them back to
+    Tarantool. :class:`uuid.UUID` object is built only on
+    :attr:`~tarantool.RawUUID.uuid` access.
+
+    .. code-block:: python
+
+        >>> value = tarantool.RawUUID(b'\\xae\\x28\\xd4\\xf6\\x07\\x6c\\x49\\xdd'
+        ...                           b'\\x82\\x27\\x7f\\x9f\\xae\\x95\\x92\\xd0')
+        >>> value.uuid
+        UUID('ae28d4f6-076c-49dd-8227-7f9fae9592d0')
+
+    The class is not a :obj:`bytes` subclass: msgpack packs
+    :obj:`bytes` subclasses as `mp_bin`_, and the value would lose its
+    MP_UUID type on encode.
+
+    .. _mp_bin: https://github.com/msgpack/msgpack/blob/master/spec.md#bin-format-family
+    """
+
+    __slots__ = ('_bytes', '_uuid')
+
+    def __init__(self, data):
+        """
+        :param data: UUID 16 bytes in big-endian order.
+        :type data: :obj:`bytes`
+
+        :raise: :exc:`ValueError`
+        """
+
+        if len(data) != 16:
+            raise ValueError('bytes is not a 16-char string')
+
+        self._bytes = bytes(data)
+        self._uuid = None
+
+    @property
+    def bytes(self):
+        """
+        UUID 16 bytes in big-endian order, same as
+        :attr:`uuid.UUID.bytes`.
+
+        :type: :obj:`bytes`
+        """
+
+        return self._bytes
+
+    @property
+    def uuid(self):
+        """
+        UUID object. It is built on first access.
+
+        :type: :class:`uuid.UUID`
+        """
+
+        if self._uuid is None:
+            self._uuid = UUID(bytes=self._bytes)
+        return self._uuid
+
+    def __bytes__(self):
+        return self._bytes
+
+    def __eq__(self, other):
+        """
+        Compare raw UUID bytes. Comparison with :class:`uuid.UUID` is
+        supported.
+
+        :param other: Second operand.
+        :type other: :class:`~tarantool.RawUUID` or :class:`uuid.UUID`
+
+        :rtype: :obj:`bool`
+        """
+
+        if isinstance(other, (RawUUID, UUID)):
+            return self._bytes == other.bytes
+        return NotImplemented
+
+    def __hash__(self):
+        # Consistent with uuid.UUID hash since objects are comparable.
+        return hash(int.from_bytes(self._bytes, 'big'))
+
+    def __repr__(self):
+        return f"tarantool.RawUUID('{self.uuid}')"
+
+    def __str__(self):
+        return str(self.uuid)
@@ -20,7 +20,7 @@ decoders = {
 }
 
 
-def ext_hook(code, data, unpacker=None):
+def ext_hook(code, data, unpacker=None, ext_decoders=None):
     """
     :class:`msgpack.Unpacker` decoder.
 
@@ -34,14 +34,22 @@ def ext_hook(code, data, unpacker=None):
         (like dictionary in extended error payload)
     :type unpacker: :class:`msgpack.Unpacker`, optional
 
+    :param ext_decoders: Extension type code to decoder mapping, see
+        :attr:`tarantool.ExtTypeRegistry.decoders`. Defaults to module
+        ``decoders``.
+    :type ext_decoders: :obj:`dict`, optional
+
     :return: Decoded value.
     :rtype: :class:`decimal.Decimal` or :class:`uuid.UUID` or
-         or :class:`tarantool.BoxError` or :class:`tarantool.Datetime`
-         or :class:`tarantool.Interval`
+         :class:`tarantool.RawUUID` or :class:`tarantool.BoxError` or
+         :class:`tarantool.Datetime` or :class:`tarantool.Interval`
 
     :raise: :exc:`NotImplementedError`
     """
 
-    if code in decoders:
-        return decoders[code](data, unpacker)
+    if ext_decoders is None:
+        ext_decoders = decoders
+
+    if code in ext_decoders:
+        return ext_decoders[code](data, unpacker)
     raise NotImplementedError(f"Unknown msgpack extension type code {code}")
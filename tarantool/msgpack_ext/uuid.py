@@ -15,6 +15,8 @@ The UUID MessagePack representation looks like this:
 
 from uuid import UUID
 
+from tarantool.msgpack_ext.types.uuid import RawUUID
+
 EXT_ID = 2
 """
 `uuid`_ type id.
@@ -26,7 +28,7 @@ def encode(obj, _):
     Encode an UUID object.
 
     :param obj: UUID to encode.
-    :type obj: :obj:`uuid.UUID`
+    :type obj: :obj:`uuid.UUID` or :class:`tarantool.RawUUID`
 
     :return: Encoded UUID.
     :rtype: :obj:`bytes`
@@ -47,3 +49,17 @@ def decode(data, _):
     """
 
     return UUID(bytes=data)
+
+
+def decode_raw(data, _):
+    """
+    Decode an UUID object without building :class:`uuid.UUID`.
+
+    :param data: UUID to decode.
+    :type data: :obj:`bytes`
+
+    :return: Decoded UUID.
+    :rtype: :class:`tarantool.RawUUID`
+    """
+
+    return RawUUID(data)
@@ -13,6 +13,8 @@ from tarantool.const import (
     IPROTO_SYNC,
     IPROTO_SPACE_ID,
     IPROTO_INDEX_ID,
+    IPROTO_SPACE_NAME,
+    IPROTO_INDEX_NAME,
     IPROTO_LIMIT,
     IPROTO_OFFSET,
     IPROTO_KEY,
@@ -27,6 +29,7 @@ from tarantool.const import (
     IPROTO_SQL_BIND,
     IPROTO_VERSION,
     IPROTO_FEATURES,
+    IPROTO_EVENT_KEY,
     REQUEST_TYPE_OK,
     REQUEST_TYPE_PING,
     REQUEST_TYPE_SELECT,
@@ -41,6 +44,7 @@ from tarantool.const import (
     REQUEST_TYPE_EVAL,
     REQUEST_TYPE_AUTHENTICATE,
     REQUEST_TYPE_ID,
+    REQUEST_TYPE_WATCH_ONCE,
     AUTH_TYPE_CHAP_SHA1,
     AUTH_TYPE_PAP_SHA256,
 )
@@ -49,6 +53,7 @@ from tarantool.response import (
     ResponseExecute,
     ResponseProtocolVersion,
 )
+from tarantool.types import Packed
 from tarantool.utils import (
     strxor,
 )
@@ -107,17 +112,51 @@ def packer_factory(conn):
     else:
         packer_kwargs['use_bin_type'] = True
 
+    ext_encoders = conn.ext_types.encoders
+
     # We need configured packer to work with error extension
     # type payload, but module do not provide access to self
     # inside extension type packers.
     def default(obj):
         packer_no_ext = msgpack.Packer(**packer_kwargs)
-        return packer_default(obj, packer_no_ext)
+        return packer_default(obj, packer_no_ext, ext_encoders)
     packer_kwargs['default'] = default
 
     return msgpack.Packer(**packer_kwargs)
 
 
+def space_index_fields(space_no, index_no=None):
+    """
+    Build request body fields to identify a space and an index. Names
+    are sent as IPROTO_SPACE_NAME and IPROTO_INDEX_NAME, the server
+    should support IPROTO_FEATURE_SPACE_AND_INDEX_NAMES to resolve
+    them.
+
+    :param space_no: Space id or name.
+    :type space_no: :obj:`int` or :obj:`str`
+
+    :param index_no: Index id or name. If ``None``, index field is
+        omitted.
+    :type index_no: :obj:`int` or :obj:`str`, optional
+
+    :rtype: :obj:`dict`
+
+    :meta private:
+    """
+
+    if isinstance(space_no, str):
+        fields = {IPROTO_SPACE_NAME: space_no}
+    else:
+        fields = {IPROTO_SPACE_ID: space_no}
+
+    if isinstance(index_no, str):
+        fields[IPROTO_INDEX_NAME] = index_no
+    elif index_no is not None:
+        fields[IPROTO_INDEX_ID] = index_no
+
+    return fields
+
+
 class Request():
     """
     Represents a single request to the server in compliance with the
@@ -151,6 +190,29 @@ class Request():
 
         return self.packer.pack(src)
 
+    def _dumps_spliced(self, body, key):
+        """
+        Encode request body map. If ``body[key]`` is a
+        :class:`~tarantool.Packed` or a sequence with
+        :class:`~tarantool.Packed` items, their data is spliced into
+        the body as is.
+        """
+
+        value = body[key]
+        if isinstance(value, Packed):
+            packed_value = value.data
+        elif isinstance(value, (list, tuple)) and any(isinstance(item, Packed) for item in value):
+            packed_value = self.packer.pack_array_header(len(value)) + b''.join(
+                item.data if isinstance(item, Packed) else self._dumps(item) for item in value)
+        else:
+            return self._dumps(body)
+
+        parts = [self.packer.pack_map_header(len(body))]
+        for field, field_value in body.items():
+            parts.append(self._dumps(field))
+            parts.append(packed_value if field == key else self._dumps(field_value))
+        return b''.join(parts)
+
     def __bytes__(self):
         return self.header(len(self._body)) + self._body
 
@@ -203,20 +265,22 @@ class RequestInsert(Request):
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param space_no: Space id.
-        :type space_no: :obj:`int`
+        :param space_no: Space id or name.
+        :type space_no: :obj:`int` or :obj:`str`
 
         :param values: Record to be inserted.
-        :type values: :obj:`tuple` or :obj:`list`
+        :type values: :obj:`tuple` or :obj:`list` or
+            :class:`~tarantool.Packed`
 
         :raise: :exc:`~AssertionError`
         """
 
         super().__init__(conn)
-        assert isinstance(values, (tuple, list))
+        assert isinstance(values, (tuple, list, Packed))
 
-        request_body = self._dumps({IPROTO_SPACE_ID: space_no,
-                                    IPROTO_TUPLE: values})
+        fields = space_index_fields(space_no)
+        fields[IPROTO_TUPLE] = values
+        request_body = self._dumps_spliced(fields, IPROTO_TUPLE)
 
         self._body = request_body
 
@@ -321,20 +385,22 @@ class RequestReplace(Request):
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param space_no: Space id.
-        :type space_no: :obj:`int`
+        :param space_no: Space id or name.
+        :type space_no: :obj:`int` or :obj:`str`
 
         :param values: Record to be replaced.
-        :type values: :obj:`tuple` or :obj:`list`
+        :type values: :obj:`tuple` or :obj:`list` or
+            :class:`~tarantool.Packed`
 
         :raise: :exc:`~AssertionError`
         """
 
         super().__init__(conn)
-        assert isinstance(values, (tuple, list))
+        assert isinstance(values, (tuple, list, Packed))
 
-        request_body = self._dumps({IPROTO_SPACE_ID: space_no,
-                                    IPROTO_TUPLE: values})
+        fields = space_index_fields(space_no)
+        fields[IPROTO_TUPLE] = values
+        request_body = self._dumps_spliced(fields, IPROTO_TUPLE)
 
         self._body = request_body
 
@@ -351,11 +417,11 @@ class RequestDelete(Request):
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param space_no: Space id.
-        :type space_no: :obj:`int`
+        :param space_no: Space id or name.
+        :type space_no: :obj:`int` or :obj:`str`
 
-        :param index_no: Index id.
-        :type index_no: :obj:`int`
+        :param index_no: Index id or name.
+        :type index_no: :obj:`int` or :obj:`str`
 
         :param key: Key of a tuple to be deleted.
         :type key: :obj:`list`
@@ -365,9 +431,9 @@ class RequestDelete(Request):
 
         super().__init__(conn)
 
-        request_body = self._dumps({IPROTO_SPACE_ID: space_no,
-                                    IPROTO_INDEX_ID: index_no,
-                                    IPROTO_KEY: key})
+        fields = space_index_fields(space_no, index_no)
+        fields[IPROTO_KEY] = key
+        request_body = self._dumps(fields)
 
         self._body = request_body
 
@@ -384,11 +450,11 @@ class RequestSelect(Request):
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param space_no: Space id.
-        :type space_no: :obj:`int`
+        :param space_no: Space id or name.
+        :type space_no: :obj:`int` or :obj:`str`
 
-        :param index_no: Index id.
-        :type index_no: :obj:`int`
+        :param index_no: Index id or name.
+        :type index_no: :obj:`int` or :obj:`str`
 
         :param key: Key of a tuple to be selected.
         :type key: :obj:`list`
@@ -408,12 +474,12 @@ class RequestSelect(Request):
         # pylint: disable=too-many-arguments
 
         super().__init__(conn)
-        request_body = self._dumps({IPROTO_SPACE_ID: space_no,
-                                    IPROTO_INDEX_ID: index_no,
-                                    IPROTO_OFFSET: offset,
-                                    IPROTO_LIMIT: limit,
-                                    IPROTO_ITERATOR: iterator,
-                                    IPROTO_KEY: key})
+        fields = space_index_fields(space_no, index_no)
+        fields.update({IPROTO_OFFSET: offset,
+                       IPROTO_LIMIT: limit,
+                       IPROTO_ITERATOR: iterator,
+                       IPROTO_KEY: key})
+        request_body = self._dumps(fields)
 
         self._body = request_body
 
@@ -430,11 +496,11 @@ class RequestUpdate(Request):
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param space_no: Space id.
-        :type space_no: :obj:`int`
+        :param space_no: Space id or name.
+        :type space_no: :obj:`int` or :obj:`str`
 
-        :param index_no: Index id.
-        :type index_no: :obj:`int`
+        :param index_no: Index id or name.
+        :type index_no: :obj:`int` or :obj:`str`
 
         :param key: Key of a tuple to be updated.
         :type key: :obj:`list`
@@ -442,7 +508,8 @@ class RequestUpdate(Request):
         :param op_list: The list of operations to update individual
             fields, refer to
             :paramref:`~tarantool.Connection.update.params.op_list`.
-        :type op_list: :obj:`tuple` or :obj:`list`
+        :type op_list: :obj:`tuple` or :obj:`list` or
+            :class:`~tarantool.CompiledOps`
 
         :raise: :exc:`~AssertionError`
         """
@@ -450,10 +517,10 @@ class RequestUpdate(Request):
 
         super().__init__(conn)
 
-        request_body = self._dumps({IPROTO_SPACE_ID: space_no,
-                                    IPROTO_INDEX_ID: index_no,
-                                    IPROTO_KEY: key,
-                                    IPROTO_TUPLE: op_list})
+        fields = space_index_fields(space_no, index_no)
+        fields.update({IPROTO_KEY: key,
+                       IPROTO_TUPLE: op_list})
+        request_body = self._dumps_spliced(fields, IPROTO_TUPLE)
 
         self._body = request_body
 
@@ -488,8 +555,8 @@ class RequestCall(Request):
         super().__init__(conn)
         assert isinstance(args, (list, tuple))
 
-        request_body = self._dumps({IPROTO_FUNCTION_NAME: name,
-                                    IPROTO_TUPLE: args})
+        request_body = self._dumps_spliced({IPROTO_FUNCTION_NAME: name,
+                                            IPROTO_TUPLE: args}, IPROTO_TUPLE)
 
         self._body = request_body
 
@@ -518,8 +585,8 @@ class RequestEval(Request):
         super().__init__(conn)
         assert isinstance(args, (list, tuple))
 
-        request_body = self._dumps({IPROTO_EXPR: name,
-                                    IPROTO_TUPLE: args})
+        request_body = self._dumps_spliced({IPROTO_EXPR: name,
+                                            IPROTO_TUPLE: args}, IPROTO_TUPLE)
 
         self._body = request_body
 
@@ -541,6 +608,30 @@ class RequestPing(Request):
         self._body = b''
 
 
+class RequestWatchOnce(Request):
+    """
+    Represents WATCH_ONCE request.
+    """
+
+    request_type = REQUEST_TYPE_WATCH_ONCE
+
+    def __init__(self, conn, key):
+        """
+        :param conn: Request sender.
+        :type conn: :class:`~tarantool.Connection`
+
+        :param key: Notification key.
+        :type key: :obj:`str`
+
+        :raise: :exc:`~AssertionError`
+        """
+
+        super().__init__(conn)
+        assert isinstance(key, str)
+
+        self._body = self._dumps({IPROTO_EVENT_KEY: key})
+
+
 class RequestUpsert(Request):
     """
     Represents UPSERT request.
@@ -553,11 +644,11 @@ class RequestUpsert(Request):
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param space_no: Space id.
-        :type space_no: :obj:`int`
+        :param space_no: Space id or name.
+        :type space_no: :obj:`int` or :obj:`str`
 
-        :param index_no: Index id.
-        :type index_no: :obj:`int`
+        :param index_no: Index id or name.
+        :type index_no: :obj:`int` or :obj:`str`
 
         :param tuple_value: Tuple to be upserted.
         :type tuple_value: :obj:`tuple` or :obj:`list`
@@ -565,7 +656,8 @@ class RequestUpsert(Request):
         :param op_list: The list of operations to update individual
             fields, refer to
             :paramref:`~tarantool.Connection.update.params.op_list`.
-        :type op_list: :obj:`tuple` or :obj:`list`
+        :type op_list: :obj:`tuple` or :obj:`list` or
+            :class:`~tarantool.CompiledOps`
 
         :raise: :exc:`~AssertionError`
         """
@@ -573,10 +665,10 @@ class RequestUpsert(Request):
 
         super().__init__(conn)
 
-        request_body = self._dumps({IPROTO_SPACE_ID: space_no,
-                                    IPROTO_INDEX_ID: index_no,
-                                    IPROTO_TUPLE: tuple_value,
-                                    IPROTO_OPS: op_list})
+        fields = space_index_fields(space_no, index_no)
+        fields.update({IPROTO_TUPLE: tuple_value,
+                       IPROTO_OPS: op_list})
+        request_body = self._dumps_spliced(fields, IPROTO_OPS)
 
         self._body = request_body
 
@@ -33,6 +33,13 @@ from tarantool.schema import to_unicode
 
 from tarantool.msgpack_ext.unpacker import ext_hook as unpacker_ext_hook
 
+MP_FIXARRAY = 0x90
+MP_FIXARRAY_MAX = 0x9f
+MP_ARRAY_16 = 0xdc
+MP_ARRAY_32 = 0xdd
+MP_BIN_8 = 0xc4
+MP_BIN_32 = 0xc6
+
 
 def unpacker_factory(conn):
     """
@@ -76,17 +83,95 @@ def unpacker_factory(conn):
     if msgpack.version >= (1, 0, 0):
         unpacker_kwargs['strict_map_key'] = False
 
+    ext_decoders = conn.ext_types.decoders
+
     # We need configured unpacker to work with error extension
     # type payload, but module do not provide access to self
     # inside extension type unpackers.
     def ext_hook(code, data):
         unpacker_no_ext = msgpack.Unpacker(**unpacker_kwargs)
-        return unpacker_ext_hook(code, data, unpacker_no_ext)
+        return unpacker_ext_hook(code, data, unpacker_no_ext, ext_decoders)
     unpacker_kwargs['ext_hook'] = ext_hook
 
     return msgpack.Unpacker(**unpacker_kwargs)
 
 
+def unpack_varbinary_memoryview(unpacker, view):
+    """
+    Unpack the next value. `mp_bin`_ value is returned as a slice of
+    the packet buffer view instead of a :obj:`bytes` copy.
+
+    :param unpacker: Unpacker fed with the whole packet.
+    :type unpacker: :class:`msgpack.Unpacker`
+
+    :param view: Read-only view of the packet.
+    :type view: :obj:`memoryview`
+
+    :meta private:
+
+    .. _mp_bin: https://github.com/msgpack/msgpack/blob/master/spec.md#bin-format-family
+    """
+
+    pos = unpacker.tell()
+    code = view[pos]
+    if MP_BIN_8 <= code <= MP_BIN_32:
+        start = pos + 1 + (1 << (code - MP_BIN_8))
+        size = int.from_bytes(view[pos + 1:start], 'big')
+        unpacker.skip()
+        return view[start:start + size]
+    return unpacker.unpack()
+
+
+def _is_mp_array(code):
+    return MP_FIXARRAY <= code <= MP_FIXARRAY_MAX or code in (MP_ARRAY_16, MP_ARRAY_32)
+
+
+def unpack_body_varbinary_memoryview(unpacker, view, use_list):
+    """
+    Unpack response body. `mp_bin`_ data values and `mp_bin`_ fields
+    of data tuples are returned as slices of the packet buffer view.
+
+    :param unpacker: Unpacker fed with the whole packet, positioned
+        at the body.
+    :type unpacker: :class:`msgpack.Unpacker`
+
+    :param view: Read-only view of the packet.
+    :type view: :obj:`memoryview`
+
+    :param use_list: Refer to
+        :paramref:`~tarantool.Connection.params.use_list`.
+    :type use_list: :obj:`bool`
+
+    :rtype: :obj:`dict`
+
+    :raise: :exc:`msgpack.OutOfData`
+
+    :meta private:
+
+    .. _mp_bin: https://github.com/msgpack/msgpack/blob/master/spec.md#bin-format-family
+    """
+
+    seq_type = list if use_list else tuple
+
+    body = {}
+    for _ in range(unpacker.read_map_header()):
+        key = unpacker.unpack()
+        if key != IPROTO_DATA or not _is_mp_array(view[unpacker.tell()]):
+            body[key] = unpacker.unpack()
+            continue
+
+        data = []
+        for _ in range(unpacker.read_array_header()):
+            if _is_mp_array(view[unpacker.tell()]):
+                data.append(seq_type([unpack_varbinary_memoryview(unpacker, view)
+                                      for _ in range(unpacker.read_array_header())]))
+            else:
+                data.append(unpack_varbinary_memoryview(unpacker, view))
+        body[key] = seq_type(data)
+
+    return body
+
+
 class Response(Sequence):
     """
     Represents a single response from the server in compliance with the
@@ -123,7 +208,11 @@ class Response(Sequence):
         self._body = {}
         self._schema_version = header.get(IPROTO_SCHEMA_ID, None)
         try:
-            self._body = unpacker.unpack()
+            if self._code < REQUEST_TYPE_ERROR and conn.varbinary_memoryview:
+                self._body = unpack_body_varbinary_memoryview(
+                    unpacker, memoryview(response).toreadonly(), conn.use_list)
+            else:
+                self._body = unpacker.unpack()
         except msgpack.OutOfData:
             pass
 
@@ -2,10 +2,22 @@
 Schema types definitions. For internal use only, there is no API to use
 pre-build schema objects.
 """
+# pylint: disable=too-many-lines
+
+import contextlib
+import copy
+import os
+import tempfile
+import threading
+
+import msgpack
 
 from tarantool.error import (
     SchemaError,
-    DatabaseError
+    SchemaCacheWarning,
+    DatabaseError,
+    MsgpackError,
+    warn,
 )
 from tarantool.const import (
     INDEX_SPACE_NAME,
@@ -17,6 +29,9 @@ from tarantool.const import (
     SPACE_SPACE,
     SPACE_INDEX
 )
+import tarantool.msgpack_ext.decimal as ext_decimal
+import tarantool.msgpack_ext.uuid as ext_uuid
+import tarantool.msgpack_ext.datetime as ext_datetime
 
 MAX_RECURSION_DEPTH = 32
 """
@@ -24,6 +39,92 @@ Max possible known schema depth is 4 if foreign keys are used (since
 Tarantool 2.10), but there are no restrictions in protocol.
 """
 
+MAX_OPS_CACHE_SIZE = 1024
+"""
+Max number of update operation shapes cached per space.
+"""
+
+_MISSING = object()
+
+ER_KEY_PART_TYPE = 18
+ER_EXACT_MATCH = 19
+ER_KEY_PART_COUNT = 31
+
+
+def _is_unsigned(value, _encoding, _encoders):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _is_integer(value, _encoding, _encoders):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_double(value, _encoding, _encoders):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_boolean(value, _encoding, _encoders):
+    return isinstance(value, bool)
+
+
+def _is_string(value, encoding, _encoders):
+    if encoding is None:
+        return isinstance(value, (str, bytes))
+    return isinstance(value, str)
+
+
+def _is_varbinary(value, _encoding, _encoders):
+    return isinstance(value, (bytes, bytearray, memoryview))
+
+
+def _ext_check(ext_id, plain_check=None):
+    """
+    Build a key part check for a type encoded as MessagePack extension.
+    A value passes if the connection encodes its type to ``ext_id``
+    or it is :class:`msgpack.ExtType` with ``ext_id`` code.
+
+    :param ext_id: MessagePack extension type code.
+    :type ext_id: :obj:`int`
+
+    :param plain_check: Check for values of the part type that are
+        not encoded as extension.
+    :type plain_check: :obj:`function`, optional
+
+    :rtype: :obj:`function`
+    """
+
+    def check(value, encoding, encoders):
+        if plain_check is not None and plain_check(value, encoding, encoders):
+            return True
+        if isinstance(value, msgpack.ExtType):
+            return value.code == ext_id
+        codec = encoders[type(value)]
+        return codec is not None and codec[0] == ext_id
+
+    return check
+
+
+KEY_PART_CHECKS = {
+    'unsigned': _is_unsigned,
+    'num': _is_unsigned,
+    'integer': _is_integer,
+    'number': _ext_check(ext_decimal.EXT_ID, _is_double),
+    'double': _is_double,
+    'boolean': _is_boolean,
+    'string': _is_string,
+    'str': _is_string,
+    'varbinary': _is_varbinary,
+    'decimal': _ext_check(ext_decimal.EXT_ID),
+    'uuid': _ext_check(ext_uuid.EXT_ID),
+    'datetime': _ext_check(ext_datetime.EXT_ID),
+}
+"""
+Local checks of key values by index part type. Each check is called
+with a value, connection encoding and connection extension type
+encoders table. Types that are not listed (like ``scalar`` or
+``any``) are not checked.
+"""
+
 
 def to_unicode(string):
     """
@@ -87,7 +188,7 @@ class SchemaIndex():
     """
     Contains schema for a space index.
     """
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self, index_row, space):
         """
@@ -100,11 +201,13 @@ class SchemaIndex():
         :raise: :exc:`~tarantool.error.SchemaError`
         """
 
+        self.row = index_row
         self.iid = index_row[1]
         self.name = to_unicode(index_row[2])
         self.index = index_row[3]
         self.unique = index_row[4]
         self.parts = []
+        self.nullable_parts = []
         try:
             parts_raw = to_unicode_recursive(index_row[5], MAX_RECURSION_DEPTH)
         except RecursionError as exc:
@@ -114,6 +217,8 @@ class SchemaIndex():
             for val in parts_raw:
                 if isinstance(val, dict):
                     self.parts.append((val['field'], val['type']))
+                    if val.get('is_nullable', False):
+                        self.nullable_parts.append(len(self.parts) - 1)
                 else:
                     self.parts.append((val[0], val[1]))
         else:
@@ -126,6 +231,139 @@ class SchemaIndex():
         self.space.indexes[self.iid] = self
         if self.name:
             self.space.indexes[self.name] = self
+        # Tuple encoder validates index parts.
+        self.space._tuple_encoder = None  # pylint: disable=protected-access
+        self._part_names = None
+        self._key_check = None
+
+    def key_from_dict(self, values):
+        """
+        Build index key from a field name to value mapping. Mapping
+        fields should be a prefix of index parts.
+
+        :param values: Key field values by field name.
+        :type values: :class:`collections.abc.Mapping`
+
+        :rtype: :obj:`list`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+        """
+
+        names = self._part_names
+        if names is None:
+            names = self._part_names = self._compile_part_names()
+
+        key = []
+        for name in names:
+            try:
+                key.append(values[name])
+            except KeyError:
+                break
+
+        if len(key) != len(values):
+            errmsg = (f"Key fields {sorted(map(str, values))} are not a prefix of index "
+                      f"'{self.name}' parts {names} in space '{self.space.name}'")
+            raise SchemaError(errmsg)
+        return key
+
+    def _compile_part_names(self):
+        """
+        Get space format field names of index parts. Names are listed
+        until the first part without a format field.
+
+        :rtype: :obj:`list`
+        """
+
+        names = []
+        for field, _ in self.parts:
+            part = self.space.format.get(field)
+            if part is None:
+                break
+            names.append(part['name'])
+        return names
+
+    def check_key(self, key, encoding, encoders, exact=False):
+        """
+        Check index key locally before sending a request: key should
+        have no more values than index parts (exactly as many for an
+        exact match in a unique index) and each value should match its
+        part type, so a bad key fails without a round trip to the
+        server. The error is the same the server would return. Values
+        of types not known to the connector (like ``scalar`` or
+        ``any`` parts) are not checked. Only TREE and HASH index keys
+        are checked: RTREE keys are flat lists of coordinates and
+        BITSET keys are bit masks, so their arity does not match index
+        parts.
+
+        The check is compiled on first use. Index schema objects are
+        rebuilt on space change, so the check is always consistent
+        with the schema version.
+
+        :param key: Index key.
+        :type key: :obj:`list`
+
+        :param encoding: Connection encoding.
+        :type encoding: :obj:`str` or :obj:`None`
+
+        :param encoders: Connection extension type encoders table, see
+            :attr:`~tarantool.ExtTypeRegistry.encoders`.
+
+        :param exact: ``True`` if the key is used for an exact match
+            (like in DELETE and UPDATE requests).
+        :type exact: :obj:`bool`, optional
+
+        :raise: :exc:`~tarantool.error.DatabaseError`
+        """
+
+        check = self._key_check
+        if check is None:
+            check = self._key_check = self._compile_key_check()
+        check(key, encoding, encoders, exact)
+
+    def _compile_key_check(self):
+        """
+        Build a function which checks index key arity and value types.
+
+        :rtype: :obj:`function`
+        """
+
+        if str(to_unicode(self.index)).lower() not in ('tree', 'hash'):
+            return lambda key, encoding, encoders, exact: None
+
+        part_count = len(self.parts)
+        part_types = [str(part_type).lower() for _, part_type in self.parts]
+        checks = [KEY_PART_CHECKS.get(part_type) for part_type in part_types]
+        nullable = [False] * part_count
+        for part_id in self.nullable_parts:
+            nullable[part_id] = True
+        # Index options map on modern Tarantool, a flag on old ones.
+        unique = self.unique
+        if isinstance(unique, dict):
+            unique = unique.get('unique', unique.get(b'unique', False))
+        unique = bool(unique)
+
+        def check(key, encoding, encoders, exact):
+            if exact and unique:
+                if len(key) != part_count:
+                    errmsg = (f"Invalid key part count in an exact match "
+                              f"(expected {part_count}, got {len(key)})")
+                    raise DatabaseError(ER_EXACT_MATCH, errmsg)
+            elif len(key) > part_count:
+                errmsg = f"Invalid key part count (expected [0..{part_count}], got {len(key)})"
+                raise DatabaseError(ER_KEY_PART_COUNT, errmsg)
+
+            for part_id, value in enumerate(key):
+                part_check = checks[part_id]
+                if value is None:
+                    if nullable[part_id]:
+                        continue
+                elif part_check is None or part_check(value, encoding, encoders):
+                    continue
+                errmsg = (f"Supplied key type of part {part_id} does not match index "
+                          f"part type: expected {part_types[part_id]}")
+                raise DatabaseError(ER_KEY_PART_TYPE, errmsg)
+
+        return check
 
     def flush(self):
         """
@@ -141,7 +379,7 @@ class SchemaSpace():
     """
     Contains schema for a space.
     """
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self, space_row, schema):
         """
@@ -154,6 +392,7 @@ class SchemaSpace():
         :raise: :exc:`~tarantool.error.SchemaError`
         """
 
+        self.row = space_row
         self.sid = space_row[0]
         self.arity = space_row[1]
         self.name = to_unicode(space_row[2])
@@ -172,6 +411,193 @@ class SchemaSpace():
             part['id'] = part_id
             self.format[part['name']] = part
             self.format[part_id] = part
+        self._tuple_encoder = None
+        self._ops_cache = {}
+
+    def tuple_from_dict(self, values):
+        """
+        Build a tuple from a field name to value mapping with respect
+        to the space format. Missing nullable fields (and fields with
+        default value) are set to ``None``, trailing ones are omitted.
+
+        Fields of index parts should be set and not ``None``, unless
+        the part is nullable. Only indexes already known to the schema
+        are taken into account (all of them with ``schema_preload="all"``).
+        Part value types are checked by the server, and a JSON path
+        part is checked as the whole field it belongs to.
+
+        The encoder is compiled on first use and rebuilt when an index
+        schema is added. Space schema objects are rebuilt on space
+        format change, so the encoder is always consistent with the
+        schema version.
+
+        :param values: Tuple field values by field name.
+        :type values: :class:`collections.abc.Mapping`
+
+        :rtype: :obj:`list`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+        """
+
+        encoder = self._tuple_encoder
+        if encoder is None:
+            encoder = self._tuple_encoder = self._compile_tuple_encoder()
+        return encoder(values)
+
+    def _compile_tuple_encoder(self):
+        """
+        Build a function which converts a field name to value mapping
+        to a tuple.
+
+        :rtype: :obj:`function`
+        """
+
+        fields = [field for key, field in self.format.items() if isinstance(key, int)]
+        if not fields:
+            raise SchemaError(f"Space '{self.name}' has no format")
+
+        field_ids = {field['name']: field['id'] for field in fields}
+        optional = [field.get('is_nullable', False) or 'default' in field for field in fields]
+        field_count = len(fields)
+        space_name = self.name
+
+        index_fields = {}
+        for index in {index.iid: index for index in self.indexes.values()}.values():
+            for part_id, (field_id, _) in enumerate(index.parts):
+                if (part_id not in index.nullable_parts and isinstance(field_id, int)
+                        and field_id < field_count):
+                    index_fields.setdefault(field_id, index.name)
+        index_fields = sorted(index_fields.items())
+
+        def encode(values):
+            result = [_MISSING] * field_count
+            for name, value in values.items():
+                try:
+                    result[field_ids[name]] = value
+                except KeyError:
+                    errmsg = f"There's no field with name '{name}' in space '{space_name}'"
+                    raise SchemaError(errmsg) from None
+
+            if len(values) != field_count:
+                size = field_count
+                while size > 0 and result[size - 1] is _MISSING and optional[size - 1]:
+                    size -= 1
+                del result[size:]
+
+                for field_id in range(size):
+                    if result[field_id] is _MISSING:
+                        if not optional[field_id]:
+                            errmsg = (f"Field '{fields[field_id]['name']}' is required "
+                                      f"in space '{space_name}'")
+                            raise SchemaError(errmsg)
+                        result[field_id] = None
+
+            for field_id, index_name in index_fields:
+                if field_id >= len(result) or result[field_id] is None:
+                    errmsg = (f"Field '{fields[field_id]['name']}' is required by index "
+                              f"'{index_name}' in space '{space_name}'")
+                    raise SchemaError(errmsg)
+            return result
+
+        return encode
+
+    def resolve_ops(self, ops):
+        """
+        Replace field names in update operations with field ids.
+
+        Field ids are cached by the sequence of operation fields, so
+        operation lists of the same shape are resolved with a single
+        dictionary lookup. Space schema objects are rebuilt on space
+        format change, so the cache is always consistent with the
+        schema version.
+
+        :param ops: Update operations, refer to
+            :paramref:`~tarantool.Connection.update.params.op_list`.
+        :type ops: :obj:`tuple` or :obj:`list`
+
+        :rtype: :obj:`tuple` or :obj:`list`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+        """
+
+        shape = tuple(operation[1] for operation in ops)
+        try:
+            field_ids = self._ops_cache[shape]
+        except KeyError:
+            field_ids = self._resolve_ops_fields(shape)
+            if len(self._ops_cache) >= MAX_OPS_CACHE_SIZE:
+                self._ops_cache.clear()
+            self._ops_cache[shape] = field_ids
+
+        if field_ids is None:
+            return ops
+
+        new_ops = []
+        for operation, field_id in zip(ops, field_ids):
+            if field_id is not None:
+                operation = list(operation)
+                operation[1] = field_id
+            new_ops.append(operation)
+        return new_ops
+
+    def _resolve_ops_fields(self, shape):
+        """
+        Resolve field names of an update operations shape.
+
+        :param shape: Operation fields.
+        :type shape: :obj:`tuple`
+
+        :return: Field id for each field name and ``None`` for other
+            fields, or ``None`` if there are no field names.
+        :rtype: :obj:`tuple` or :obj:`None`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+        """
+
+        if not any(isinstance(field, str) for field in shape):
+            return None
+
+        field_ids = []
+        for field in shape:
+            if isinstance(field, str):
+                try:
+                    field_ids.append(self.format[field]['id'])
+                except KeyError as exc:
+                    errmsg = f"There's no field with name '{field}' in space '{self.name}'"
+                    raise SchemaError(errmsg) from exc
+            else:
+                field_ids.append(None)
+        return tuple(field_ids)
+
+    def copy(self, schema):
+        """
+        Copy the space and its indexes schema objects to another
+        schema data. Parsed format and compiled encoders are reused,
+        the original objects are not changed, so they could still be
+        used with the previous schema data.
+
+        :param schema: Schema data to add the copy to, see
+            :attr:`~tarantool.schema.Schema.schema`.
+        :type schema: :obj:`dict`
+
+        :rtype: :class:`~tarantool.schema.SchemaSpace`
+        """
+
+        space = copy.copy(self)
+        space.schema = schema
+        schema[space.sid] = space
+        if space.name:
+            schema[space.name] = space
+
+        space.indexes = {}
+        copies = {}
+        for key, index in self.indexes.items():
+            index_copy = copies.get(index.iid)
+            if index_copy is None:
+                index_copy = copies[index.iid] = copy.copy(index)
+                index_copy.space = space
+            space.indexes[key] = index_copy
+        return space
 
     def flush(self):
         """
@@ -295,6 +721,9 @@ class Schema():
         Fetch all spaces schema from the Tarantool server and build
         corresponding schema objects.
 
+        :return: Space format data received from Tarantool.
+        :rtype: :class:`~tarantool.response.Response`
+
         :raises: :meth:`~tarantool.schema.Schema.fetch_space_from`
             exceptions
         """
@@ -303,6 +732,8 @@ class Schema():
         for row in space_rows:
             SchemaSpace(row, self.schema)
 
+        return space_rows
+
     def get_index(self, space, index):
         """
         Get space index schema. If it exists in the local schema, return
@@ -329,6 +760,26 @@ class Schema():
 
         return self.fetch_index(_space, index)
 
+    def find_index(self, space, index):
+        """
+        Get space index schema if it exists in the local schema. Data
+        is never fetched from the Tarantool server, so the method is
+        safe to use while serving schema requests.
+
+        :param space: Space id or space name.
+        :type space: :obj:`str` or :obj:`int`
+
+        :param index: Index id or index name.
+        :type index: :obj:`str` or :obj:`int`
+
+        :rtype: :class:`~tarantool.schema.SchemaIndex` or :obj:`None`
+        """
+
+        _space = self.schema.get(space)
+        if _space is None:
+            return None
+        return _space.indexes.get(index)
+
     def fetch_index(self, space_object, index):
         """
         Fetch a single index space schema from the Tarantool server and
@@ -369,6 +820,9 @@ class Schema():
         Fetch all spaces indexes schema from the Tarantool server and
         build corresponding schema objects.
 
+        :return: Space index format data received from Tarantool.
+        :rtype: :class:`~tarantool.response.Response`
+
         :raises: :meth:`~tarantool.schema.Schema.fetch_index_from`
             exceptions
         """
@@ -376,6 +830,51 @@ class Schema():
         for row in index_rows:
             SchemaIndex(row, self.schema[row[0]])
 
+        return index_rows
+
+    def load_rows(self, space_rows, index_rows):
+        """
+        Build spaces and indexes schema objects from all spaces and
+        indexes format data, for example fetched on schema version
+        change or read from :class:`~tarantool.schema.SchemaCache`.
+
+        Schema objects of spaces which format and indexes data has
+        not changed are copied with parsed data reused (see
+        :meth:`~tarantool.schema.SchemaSpace.copy`), so only changed
+        spaces are rebuilt and objects of the previous schema data,
+        which may be shared with other connections, are not changed.
+        New schema data replaces the existing one at once.
+
+        :param space_rows: Spaces format data.
+        :type space_rows: :obj:`list` or :obj:`tuple`
+
+        :param index_rows: Space indexes format data.
+        :type index_rows: :obj:`list` or :obj:`tuple`
+
+        :raises: :exc:`~tarantool.error.SchemaError`
+        """
+
+        index_rows_by_space = {}
+        for row in index_rows:
+            index_rows_by_space.setdefault(row[0], {})[row[1]] = row
+
+        old_schema = self.schema
+        schema = {}
+        for row in space_rows:
+            space_index_rows = index_rows_by_space.get(row[0], {})
+            space = old_schema.get(row[0])
+            if (space is not None and space.row == row
+                    and {index.iid: index.row for index in space.indexes.values()}
+                    == space_index_rows):
+                space.copy(schema)
+                continue
+
+            space = SchemaSpace(row, schema)
+            for index_row in space_index_rows.values():
+                SchemaIndex(index_row, space)
+
+        self.schema = schema
+
     def fetch_index_from(self, space, index):
         """
         Fetch space index schema from the Tarantool server.
@@ -458,7 +957,243 @@ class Schema():
 
     def flush(self):
         """
-        Clean existing schema data.
+        Clean existing schema data. Data is detached rather than
+        cleared, since it may be shared with other connections, see
+        :class:`~tarantool.schema.SchemaRegistry`.
+        """
+
+        self.schema = {}
+
+
+def schema_owner_key(con):
+    """
+    Get the key of a connection schema owner: spaces and indexes
+    schema versions are local to an instance, and ``_vspace`` and
+    ``_vindex`` contents depend on the user privileges.
+
+    :param con: Related Tarantool server connection.
+    :type con: :class:`~tarantool.Connection`
+
+    :return: ``"instance_uuid:user"`` key.
+    :rtype: :obj:`str`
+
+    :meta private:
+    """
+
+    return f"{con.uuid}:{con.user or 'guest'}"
+
+
+class SchemaRegistry():
+    """
+    Thread-safe storage of spaces and indexes schema data shared
+    between connections, keyed by Tarantool instance UUID, user and
+    schema version. A connection with
+    :paramref:`~tarantool.Connection.params.schema_registry` option
+    reuses the data loaded by another connection to the same instance
+    with the same user for the same schema version, so a single copy
+    of the schema is fetched and stored.
+    """
+
+    max_versions = 8
+    """
+    Amount of schema versions to keep over all instances and users.
+    Data of the oldest stored versions is dropped first.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._schemas = {}
+        self._loading = {}
+
+    @contextlib.contextmanager
+    def loading(self, con, schema_version):
+        """
+        Context manager held while a connection looks up and loads
+        schema data for the registry, so each schema version is
+        fetched once. Loads for other instances, users or versions
+        are not blocked.
+
+        :param con: Related Tarantool server connection.
+        :type con: :class:`~tarantool.Connection`
+
+        :param schema_version: Schema version.
+        :type schema_version: :obj:`int`
+        """
+
+        key = (schema_owner_key(con), schema_version)
+        with self._lock:
+            entry = self._loading.get(key)
+            if entry is None:
+                entry = self._loading[key] = [threading.RLock(), 0]
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._loading[key]
+
+    def get(self, con, schema_version):
+        """
+        Get schema data for a connection instance, user and version.
+
+        :param con: Related Tarantool server connection.
+        :type con: :class:`~tarantool.Connection`
+
+        :param schema_version: Schema version.
+        :type schema_version: :obj:`int`
+
+        :return: Schema data or :obj:`None`, if there is no data
+            for the version.
+        :rtype: :obj:`dict` or :obj:`None`
+        """
+
+        with self._lock:
+            return self._schemas.get((schema_owner_key(con), schema_version))
+
+    def put(self, con, schema_version, schema):
+        """
+        Store schema data for a connection instance, user and version.
+
+        :param con: Related Tarantool server connection.
+        :type con: :class:`~tarantool.Connection`
+
+        :param schema_version: Schema version.
+        :type schema_version: :obj:`int`
+
+        :param schema: Schema data, see
+            :attr:`~tarantool.schema.Schema.schema`.
+        :type schema: :obj:`dict`
+        """
+
+        with self._lock:
+            self._schemas[(schema_owner_key(con), schema_version)] = schema
+            while len(self._schemas) > self.max_versions:
+                del self._schemas[next(iter(self._schemas))]
+
+
+class SchemaCache():
+    """
+    File-backed cache of spaces and indexes schema data. Entries are
+    keyed by Tarantool instance UUID, user and schema version, so a
+    connection with
+    :paramref:`~tarantool.Connection.params.schema_cache` option
+    skips spaces and indexes fetch if the instance schema has not
+    changed since the cache entry was stored. The user is a part of
+    the key since ``_vspace`` and ``_vindex`` contents depend on the
+    user privileges.
+
+    The file is replaced atomically on each write, so it could be
+    shared between processes. Concurrent writes do not corrupt the
+    file, but one of them may be lost: the connection would fetch
+    the schema and store it again next time.
+
+    The file is written with connection packer and read with
+    connection unpacker, see
+    :paramref:`~tarantool.Connection.params.packer_factory` and
+    :paramref:`~tarantool.Connection.params.unpacker_factory`.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Cache file path.
+        :type path: :obj:`str` or :class:`os.PathLike`
+        """
+
+        self.path = os.fspath(path)
+
+    def _read(self, con):
+        """
+        Read all cache entries. Missing or malformed file is
+        considered empty.
+
+        :param con: Related Tarantool server connection.
+        :type con: :class:`~tarantool.Connection`
+
+        :return: Map of ``"instance_uuid:user"`` keys to
+            ``[schema_version, space_rows, index_rows]`` entries.
+        :rtype: :obj:`dict`
         """
 
-        self.schema.clear()
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return {}
+        except OSError as exc:
+            warn(f"Failed to read schema cache {self.path}: {exc}", SchemaCacheWarning)
+            return {}
+
+        unpacker = con._unpacker_factory()  # pylint: disable=protected-access
+        unpacker.feed(data)
+        try:
+            entries = unpacker.unpack()
+        except (ValueError, msgpack.UnpackException, MsgpackError):
+            entries = None
+        if not isinstance(entries, dict):
+            warn(f"Ignoring malformed schema cache {self.path}", SchemaCacheWarning)
+            return {}
+
+        return {to_unicode(key): entry for key, entry in entries.items()}
+
+    def load(self, con, schema_version):
+        """
+        Get cached schema data.
+
+        :param con: Related Tarantool server connection.
+        :type con: :class:`~tarantool.Connection`
+
+        :param schema_version: Current instance schema version.
+        :type schema_version: :obj:`int`
+
+        :return: ``(space_rows, index_rows)`` or :obj:`None`, if there
+            is no entry for the connection instance, user and schema
+            version.
+        :rtype: :obj:`tuple` or :obj:`None`
+        """
+
+        entry = self._read(con).get(schema_owner_key(con))
+        if (not isinstance(entry, (list, tuple)) or len(entry) != 3
+                or entry[0] != schema_version):
+            return None
+
+        return entry[1], entry[2]
+
+    def store(self, con, schema_version, space_rows, index_rows):
+        """
+        Store schema data of the connection instance and user. The
+        entry replaces the previous entry for the instance and user,
+        if any.
+
+        :param con: Related Tarantool server connection.
+        :type con: :class:`~tarantool.Connection`
+
+        :param schema_version: Instance schema version of the data.
+        :type schema_version: :obj:`int`
+
+        :param space_rows: Spaces format data.
+        :type space_rows: :obj:`list` or :obj:`tuple`
+
+        :param index_rows: Space indexes format data.
+        :type index_rows: :obj:`list` or :obj:`tuple`
+        """
+
+        entries = self._read(con)
+        entries[schema_owner_key(con)] = [schema_version, list(space_rows), list(index_rows)]
+        data = con._packer_factory().pack(entries)  # pylint: disable=protected-access
+
+        directory, name = os.path.split(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=name + '.')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(data)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as exc:
+            warn(f"Failed to write schema cache {self.path}: {exc}", SchemaCacheWarning)
@@ -0,0 +1,721 @@
+"""
+This module provides API for interaction with `vshard`_ sharded
+Tarantool cluster storages without a router.
+
+.. _vshard: https://www.tarantool.io/en/doc/latest/concepts/sharding/
+"""
+
+import random
+import threading
+import time
+
+from tarantool.connection_pool import ConnectionPool, Mode
+from tarantool.const import POOL_BUCKETS_MISSING_DELAY, POOL_BUCKETS_REFRESH_TIMEOUT
+from tarantool.error import (
+    ConfigurationError,
+    DatabaseError,
+    PoolTolopogyError,
+    PoolTolopogyWarning,
+    warn,
+)
+from tarantool.types import BoxError
+
+VSHARD_WRONG_BUCKET = 1
+"""
+`vshard`_ error code of a request to a storage which does not own
+the bucket.
+
+.. _vshard: https://www.tarantool.io/en/doc/latest/concepts/sharding/
+"""
+
+VSHARD_TRANSFER_IS_IN_PROGRESS = 7
+"""
+`vshard`_ error code of a request to a bucket which is being moved
+to another storage.
+
+.. _vshard: https://www.tarantool.io/en/doc/latest/concepts/sharding/
+"""
+
+VSHARD_BUCKET_MOVED_ERRORS = ('WRONG_BUCKET', 'TRANSFER_IS_IN_PROGRESS')
+"""
+`vshard`_ error names of :data:`VSHARD_WRONG_BUCKET` and
+:data:`VSHARD_TRANSFER_IS_IN_PROGRESS` errors.
+
+.. _vshard: https://www.tarantool.io/en/doc/latest/concepts/sharding/
+"""
+
+LUA_INT_MAX = 2**53 - 1
+"""
+Greatest integer which Tarantool decodes to a Lua number rather than
+``int64_t`` or ``uint64_t`` cdata.
+"""
+
+BUCKETS_EXPR = """
+    local info = box.info
+    local uuid = info.cluster.uuid
+    if info.replicaset ~= nil and info.replicaset.uuid ~= nil then
+        uuid = info.replicaset.uuid
+    end
+    local ids = {}
+    for _, status in ipairs({'active', 'pinned'}) do
+        for _, bucket in box.space._bucket.index.status:pairs(status) do
+            table.insert(ids, bucket[1])
+        end
+    end
+    return uuid, ids, require('vshard').storage.internal.total_bucket_count
+"""
+"""
+Lua expression to get a storage replicaset UUID, its readable and
+writable buckets and the total bucket count.
+
+:meta private:
+"""
+
+
+def _make_crc32c_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def crc32c_update(crc, data):
+    """
+    Update `digest.crc32`_ checksum: CRC32-C without final XOR.
+
+    :param crc: Current checksum. Start with ``0xFFFFFFFF``.
+    :type crc: :obj:`int`
+
+    :param data: Data to add to the checksum.
+    :type data: :obj:`bytes`
+
+    :rtype: :obj:`int`
+
+    .. _digest.crc32: https://www.tarantool.io/en/doc/latest/reference/reference_lua/digest/
+    """
+
+    table = _CRC32C_TABLE
+    for byte in data:
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc
+
+
+def lua_tostring(value):
+    """
+    Build Lua ``tostring()`` representation of a value passed to
+    Tarantool.
+
+    :param value: Value to convert.
+    :type value: :obj:`str`, :obj:`bytes`, :obj:`int`, :obj:`float`
+        or :obj:`bool`
+
+    :rtype: :obj:`bytes`
+
+    :raise: :exc:`~TypeError`
+    """
+    # pylint: disable=too-many-return-statements
+
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, bool):
+        return b'true' if value else b'false'
+    if isinstance(value, int):
+        if value > LUA_INT_MAX:
+            return f'{value}ULL'.encode()
+        if value < -LUA_INT_MAX:
+            return f'{value}LL'.encode()
+        return f'{value:.14g}'.encode()
+    if isinstance(value, float):
+        if value != value:  # pylint: disable=comparison-with-itself
+            return b'nan'
+        if value in (float('inf'), float('-inf')):
+            return b'inf' if value > 0 else b'-inf'
+        return f'{value:.14g}'.encode()
+    raise TypeError(f"Unsupported sharding key part type: {type(value)}")
+
+
+def bucket_id_strcrc32(key, bucket_count):
+    """
+    Compute a bucket ID of a sharding key the same way as
+    `vshard.router.bucket_id_strcrc32`_ does.
+
+    :param key: Sharding key: a scalar value or a list of them.
+    :type key: :obj:`str`, :obj:`bytes`, :obj:`int`, :obj:`float`,
+        :obj:`bool` or :obj:`list`
+
+    :param bucket_count: Total bucket count of the cluster.
+    :type bucket_count: :obj:`int`
+
+    :rtype: :obj:`int`
+
+    :raise: :exc:`~TypeError`
+
+    .. _vshard.router.bucket_id_strcrc32: https://www.tarantool.io/en/doc/latest/reference/reference_rock/vshard/vshard_router/#router-api-bucket-id-strcrc32
+    """
+
+    crc = 0xFFFFFFFF
+    if isinstance(key, (list, tuple)):
+        for part in key:
+            crc = crc32c_update(crc, lua_tostring(part))
+    else:
+        crc = crc32c_update(crc, lua_tostring(key))
+    return crc % bucket_count + 1
+
+
+class ShardedConnectionPool(ConnectionPool):
+    """
+    Connection pool to `vshard`_ storages of all replicasets of
+    a sharded cluster. ``vshard_*`` requests are sent straight to
+    a storage which owns the bucket through `vshard.storage.call`_,
+    without an extra hop through a router:
+
+    .. code-block:: python
+
+        >>> pool = tarantool.ShardedConnectionPool(storage_addrs, user='storage',
+        ...                                        password='secret')
+        >>> bucket_id = pool.bucket_id(42)
+        >>> pool.vshard_insert('customers', [42, bucket_id, 'Alpha'], bucket_id=bucket_id)
+        [42, 1234, 'Alpha']
+        >>> pool.vshard_select('customers', 42, bucket_id=bucket_id,
+        ...                    mode=tarantool.Mode.PREFER_RO)
+        [[42, 1234, 'Alpha']]
+
+    Bucket to replicaset map is fetched from storages on first request
+    and refreshed if a storage responds that it does not own
+    the bucket. Concurrent refreshes are coalesced, and a bucket which
+    is not found on any storage (for example, a bucket being moved)
+    triggers a refresh at most once in
+    :data:`~tarantool.const.POOL_BUCKETS_MISSING_DELAY`. Other
+    :class:`~tarantool.ConnectionPool` requests work as usual.
+
+    .. _vshard: https://www.tarantool.io/en/doc/latest/concepts/sharding/
+    .. _vshard.storage.call: https://www.tarantool.io/en/doc/latest/reference/reference_rock/vshard/vshard_storage/#storage-api-call
+    """
+
+    def __init__(self, addrs, *args, bucket_count=None, **kwargs):
+        """
+        :param addrs: Addresses of storage instances of all
+            replicasets. Refer to
+            :paramref:`~tarantool.ConnectionPool.params.addrs`.
+
+        :param args: Refer to :class:`~tarantool.ConnectionPool`
+            parameters.
+
+        :param bucket_count: Total bucket count of the cluster. If
+            ``None``, it is fetched from storages.
+        :type bucket_count: :obj:`int`, optional
+
+        :param kwargs: Refer to :class:`~tarantool.ConnectionPool`
+            parameters.
+
+        :raise: :exc:`~tarantool.error.ConfigurationError`,
+            :class:`~tarantool.ConnectionPool` exceptions
+        """
+
+        if bucket_count is not None and (not isinstance(bucket_count, int)
+                                         or bucket_count < 1):
+            raise ConfigurationError("bucket_count must be None or a positive integer")
+
+        self.bucket_count = bucket_count
+        self._buckets = {}
+        self._replicasets = {}
+        self._buckets_lock = threading.Lock()
+        self._buckets_refresh_time = None
+        self._missing_buckets = {}
+        self._random = random.Random()
+
+        super().__init__(addrs, *args, **kwargs)
+
+    def refresh_buckets(self):
+        """
+        Fetch bucket to replicaset map from all healthy storages.
+        Storages which have not responded in
+        :data:`~tarantool.const.POOL_BUCKETS_REFRESH_TIMEOUT` are
+        skipped with a warning.
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+        """
+
+        with self._buckets_lock:
+            self._refresh_buckets()
+
+    def _refresh_buckets(self):
+        """
+        Fetch bucket to replicaset map from all healthy storages.
+        The caller should hold the bucket map lock.
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        buckets = {}
+        replicasets = {}
+        bucket_count = self.bucket_count
+        start = time.monotonic()
+        for key, resp in self._send_all(Mode.ANY, POOL_BUCKETS_REFRESH_TIMEOUT,
+                                        'eval', BUCKETS_EXPR).items():
+            if isinstance(resp, Exception):
+                warn(f"Failed to fetch buckets from {key}, reason: {repr(resp)}",
+                     PoolTolopogyWarning)
+                continue
+
+            uuid, ids, total = resp.data[:3]
+            replicasets.setdefault(uuid, []).append(key)
+            for bucket_id in ids:
+                buckets[bucket_id] = uuid
+            if bucket_count is None:
+                bucket_count = total
+
+        self._buckets = buckets
+        self._replicasets = replicasets
+        self.bucket_count = bucket_count
+        self._buckets_refresh_time = start
+        self._missing_buckets = {bucket_id: missing_time for bucket_id, missing_time
+                                 in self._missing_buckets.items()
+                                 if bucket_id not in buckets}
+
+    def _refresh_bucket(self, bucket_id):
+        """
+        Refresh bucket to replicaset map to find a bucket. The map
+        is not fetched again if it has been refreshed since the call
+        or if the bucket was not found on any storage in the last
+        :data:`~tarantool.const.POOL_BUCKETS_MISSING_DELAY`.
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        start = time.monotonic()
+        with self._buckets_lock:
+            refresh_time = self._buckets_refresh_time
+            if refresh_time is not None and refresh_time >= start:
+                return
+            missing_time = self._missing_buckets.get(bucket_id)
+            if missing_time is not None and start - missing_time < POOL_BUCKETS_MISSING_DELAY:
+                return
+
+            self._refresh_buckets()
+            if self._buckets.get(bucket_id) not in self._replicasets:
+                self._missing_buckets[bucket_id] = self._buckets_refresh_time
+
+    def _get_bucket_count(self):
+        """
+        Get the total bucket count, fetch it from storages if unknown.
+
+        :rtype: :obj:`int`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        if self.bucket_count is None:
+            self.refresh_buckets()
+            if self.bucket_count is None:
+                raise PoolTolopogyError("Can't fetch bucket count from storages")
+        return self.bucket_count
+
+    def bucket_id(self, key):
+        """
+        Compute a bucket ID of a sharding key the same way as
+        `vshard.router.bucket_id_strcrc32`_ does.
+
+        :param key: Refer to
+            :paramref:`~tarantool.sharded_pool.bucket_id_strcrc32.params.key`.
+
+        :rtype: :obj:`int`
+
+        :raise: :exc:`~TypeError`,
+            :exc:`~tarantool.error.PoolTolopogyError`
+
+        .. _vshard.router.bucket_id_strcrc32: https://www.tarantool.io/en/doc/latest/reference/reference_rock/vshard/vshard_router/#router-api-bucket-id-strcrc32
+        """
+
+        return bucket_id_strcrc32(key, self._get_bucket_count())
+
+    def _bucket_key(self, bucket_id, mode):
+        """
+        Choose a storage of the replicaset which owns the bucket.
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
+
+        :rtype: :obj:`str`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        uuid = self._buckets.get(bucket_id)
+        if uuid not in self._replicasets:
+            self._refresh_bucket(bucket_id)
+            uuid = self._buckets.get(bucket_id)
+            if uuid not in self._replicasets:
+                raise PoolTolopogyError(f"Can't find replicaset of bucket {bucket_id}")
+
+        keys = self._keys_by_mode(mode, self._replicasets[uuid])
+        now = time.monotonic()
+        available = [key for key in keys if self.pool[key].circuit_allows(now)]
+        if not available:
+            raise PoolTolopogyError(f"Can't find healthy instance of bucket {bucket_id} "
+                                    "replicaset")
+        return self._random.choice(available)
+
+    def vshard_call(self, func_name, args=None, *, bucket_id, mode=Mode.RW):
+        """
+        Call a function on a storage which owns the bucket through
+        `vshard.storage.call`_.
+
+        :param func_name: Stored Lua function name, like
+            ``'box.space.customers:insert'``.
+        :type func_name: :obj:`str`
+
+        :param args: Function arguments.
+        :type args: :obj:`list` or :obj:`tuple`, optional
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param mode: Request mode. Requests in ``Mode.RW`` mode are
+            write requests, other are read requests.
+        :type mode: :class:`~tarantool.Mode`, optional
+
+        :return: The first value returned by the function.
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.PoolTolopogyError`,
+            :meth:`~tarantool.ConnectionPool.call` exceptions
+
+        .. _vshard.storage.call: https://www.tarantool.io/en/doc/latest/reference/reference_rock/vshard/vshard_storage/#storage-api-call
+        """
+
+        bucket_count = self._get_bucket_count()
+        if (not isinstance(bucket_id, int) or isinstance(bucket_id, bool)
+                or not 1 <= bucket_id <= bucket_count):
+            raise ValueError(f"bucket_id must be an integer in [1, {bucket_count}]")
+
+        args = [] if args is None else list(args)
+
+        data = self._storage_call(bucket_id, mode, func_name, args)
+        if data[0] is not True:
+            err = data[1]
+            if self._is_bucket_moved_error(err):
+                self._bucket_moved(bucket_id, err.get('destination'))
+                data = self._storage_call(bucket_id, mode, func_name, args)
+
+        if data[0] is not True:
+            raise self._storage_error(data[1])
+        return data[1] if len(data) > 1 else None
+
+    def _storage_call(self, bucket_id, mode, func_name, args):
+        """
+        Send `vshard.storage.call`_ request to a storage of the
+        replicaset which owns the bucket.
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
+
+        :param func_name: Stored Lua function name.
+        :type func_name: :obj:`str`
+
+        :param args: Function arguments.
+        :type args: :obj:`list`
+
+        :return: ``[true, result...]`` on success,
+            ``[false or nil, error]`` otherwise.
+        :rtype: :obj:`list`
+
+        :meta private:
+
+        .. _vshard.storage.call: https://www.tarantool.io/en/doc/latest/reference/reference_rock/vshard/vshard_storage/#storage-api-call
+        """
+
+        access = 'write' if mode == Mode.RW else 'read'
+        key = self._bucket_key(bucket_id, mode)
+        return self._send_to(key, 'call', 'vshard.storage.call',
+                             bucket_id, access, func_name, args).data
+
+    def _bucket_moved(self, bucket_id, destination):
+        """
+        Update bucket to replicaset map after a storage has responded
+        that it does not own the bucket.
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param destination: Replicaset UUID the bucket is moved to,
+            if known.
+        :type destination: :obj:`str`, optional
+
+        :meta private:
+        """
+
+        if destination in self._replicasets:
+            self._buckets[bucket_id] = destination
+        else:
+            self._refresh_bucket(bucket_id)
+
+    @staticmethod
+    def _is_bucket_moved_error(err):
+        """
+        Check whether `vshard.storage.call`_ error means that the
+        bucket is not on the storage anymore. Codes are checked only for
+        vshard errors: box error codes overlap with them, and a request
+        that failed with a box error must not be retried.
+
+        :param err: Error object.
+        :type err: :obj:`dict`, :class:`~tarantool.BoxError` or
+            :obj:`str`
+
+        :rtype: :obj:`bool`
+
+        :meta private:
+        """
+
+        if not isinstance(err, dict):
+            return False
+        if err.get('name') in VSHARD_BUCKET_MOVED_ERRORS:
+            return True
+        return (err.get('type') == 'ShardingError'
+                and err.get('code') in (VSHARD_WRONG_BUCKET, VSHARD_TRANSFER_IS_IN_PROGRESS))
+
+    @staticmethod
+    def _storage_error(err):
+        """
+        Build an exception from `vshard.storage.call`_ error.
+
+        :param err: Error object.
+        :type err: :obj:`dict`, :class:`~tarantool.BoxError` or
+            :obj:`str`
+
+        :rtype: :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        if isinstance(err, BoxError):
+            return DatabaseError(err.code, err.message, extra_info=err)
+        if isinstance(err, dict):
+            return DatabaseError(err.get('code', 0), str(err.get('message', err)))
+        return DatabaseError(str(err))
+
+    def vshard_insert(self, space_name, values, *, bucket_id):
+        """
+        Insert a tuple into the space on a storage which owns the
+        bucket. Refer to :meth:`~tarantool.Connection.insert`.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param values: Tuple to insert.
+        :type values: :obj:`tuple` or :obj:`list`
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :return: Inserted tuple.
+
+        :raise: :meth:`~tarantool.ShardedConnectionPool.vshard_call`
+            exceptions
+        """
+
+        return self.vshard_call(f'box.space.{space_name}:insert', [values],
+                                bucket_id=bucket_id)
+
+    def vshard_replace(self, space_name, values, *, bucket_id):
+        """
+        Replace a tuple in the space on a storage which owns the
+        bucket. Refer to :meth:`~tarantool.Connection.replace`.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param values: Tuple to replace.
+        :type values: :obj:`tuple` or :obj:`list`
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :return: Replaced tuple.
+
+        :raise: :meth:`~tarantool.ShardedConnectionPool.vshard_call`
+            exceptions
+        """
+
+        return self.vshard_call(f'box.space.{space_name}:replace', [values],
+                                bucket_id=bucket_id)
+
+    def vshard_delete(self, space_name, key, *, bucket_id, index=0):
+        """
+        Delete a tuple from the space on a storage which owns the
+        bucket. Refer to :meth:`~tarantool.Connection.delete`.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param key: Key of a tuple to delete.
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param index: Index name or ``0`` for the primary index.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :return: Deleted tuple.
+
+        :raise: :exc:`~ValueError`,
+            :meth:`~tarantool.ShardedConnectionPool.vshard_call`
+            exceptions
+        """
+
+        return self.vshard_call(self._index_func(space_name, index, 'delete'), [key],
+                                bucket_id=bucket_id)
+
+    def vshard_update(self, space_name, key, op_list, *, bucket_id, index=0):
+        """
+        Update a tuple in the space on a storage which owns the
+        bucket. Refer to :meth:`~tarantool.Connection.update`.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param key: Key of a tuple to update.
+
+        :param op_list: Update operations, field numbers start
+            from 1 as in Lua.
+        :type op_list: :obj:`list` or :obj:`tuple`
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param index: Index name or ``0`` for the primary index.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :return: Updated tuple.
+
+        :raise: :exc:`~ValueError`,
+            :meth:`~tarantool.ShardedConnectionPool.vshard_call`
+            exceptions
+        """
+
+        return self.vshard_call(self._index_func(space_name, index, 'update'),
+                                [key, op_list], bucket_id=bucket_id)
+
+    def vshard_upsert(self, space_name, tuple_value, op_list, *, bucket_id):
+        """
+        Upsert a tuple in the space on a storage which owns the
+        bucket. Refer to :meth:`~tarantool.Connection.upsert`.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param tuple_value: Tuple to insert if there is no such tuple.
+        :type tuple_value: :obj:`tuple` or :obj:`list`
+
+        :param op_list: Update operations, field numbers start
+            from 1 as in Lua.
+        :type op_list: :obj:`list` or :obj:`tuple`
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :raise: :meth:`~tarantool.ShardedConnectionPool.vshard_call`
+            exceptions
+        """
+
+        self.vshard_call(f'box.space.{space_name}:upsert', [tuple_value, op_list],
+                         bucket_id=bucket_id)
+
+    def vshard_select(self, space_name, key, *, bucket_id, index=0, offset=0, limit=None,
+                      iterator=None, mode=Mode.ANY):
+        """
+        Select tuples from the space on a storage which owns the
+        bucket. Refer to :meth:`~tarantool.Connection.select`.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param key: Key to select.
+
+        :param bucket_id: Bucket ID.
+        :type bucket_id: :obj:`int`
+
+        :param index: Index name or ``0`` for the primary index.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :param offset: Number of tuples to skip.
+        :type offset: :obj:`int`, optional
+
+        :param limit: Maximum number of tuples to select.
+        :type limit: :obj:`int`, optional
+
+        :param iterator: Index iterator type, like ``'GE'``.
+        :type iterator: :obj:`str`, optional
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`, optional
+
+        :return: Selected tuples.
+        :rtype: :obj:`list`
+
+        :raise: :exc:`~ValueError`,
+            :meth:`~tarantool.ShardedConnectionPool.vshard_call`
+            exceptions
+        """
+
+        opts = {'offset': offset}
+        if limit is not None:
+            opts['limit'] = limit
+        if iterator is not None:
+            opts['iterator'] = iterator
+
+        return self.vshard_call(self._index_func(space_name, index, 'select'), [key, opts],
+                                bucket_id=bucket_id, mode=mode)
+
+    @staticmethod
+    def _index_func(space_name, index, method):
+        """
+        Build a stored function name of an index method.
+
+        :param space_name: Space name.
+        :type space_name: :obj:`str`
+
+        :param index: Index name or ``0`` for the primary index.
+        :type index: :obj:`str` or :obj:`int`
+
+        :param method: Index method name.
+        :type method: :obj:`str`
+
+        :rtype: :obj:`str`
+
+        :raise: :exc:`~ValueError`
+
+        :meta private:
+        """
+
+        if index == 0:
+            return f'box.space.{space_name}:{method}'
+        if not isinstance(index, str):
+            raise ValueError("index must be an index name or 0 for the primary index")
+        return f'box.space.{space_name}.index.{index}:{method}'
@@ -3,7 +3,8 @@ Additional Tarantool type definitions.
 """
 
 import typing
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, fields as dataclass_fields
 
 
 @dataclass
@@ -68,6 +69,43 @@ class BoxError():
     Previous error in stack.
     """
 
+    def __getattr__(self, name):
+        """
+        Materialize error fields on first access if the object was
+        built lazily with :func:`~tarantool.types.decode_box_error`.
+
+        :raise: :exc:`AttributeError`
+        """
+
+        lazy = self.__dict__.get('_lazy')
+        if lazy is None or name not in BOX_ERROR_FIELDS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        stack, pos = lazy
+        item = stack[pos]
+        values = self.__dict__
+        # Do not override fields set explicitly after decode.
+        values.setdefault('type', item[MP_ERROR_TYPE])
+        values.setdefault('file', item[MP_ERROR_FILE])
+        values.setdefault('line', item[MP_ERROR_LINE])
+        values.setdefault('message', item[MP_ERROR_MESSAGE])
+        values.setdefault('errno', item[MP_ERROR_ERRNO])
+        values.setdefault('errcode', item[MP_ERROR_ERRCODE])
+        values.setdefault('fields', item.get(MP_ERROR_FIELDS))  # omitted if empty
+        values.setdefault('prev', _lazy_box_error(stack, pos + 1))
+        del values['_lazy']
+
+        return values[name]
+
+
+BOX_ERROR_FIELDS = frozenset(item.name for item in dataclass_fields(BoxError))
+
+# Dataclass stores field defaults as class attributes. They would
+# shadow __getattr__ for lazily decoded objects, while __init__ keeps
+# its own copy of defaults, so it is safe to drop them.
+del BoxError.fields
+del BoxError.prev
+
 
 MP_ERROR_STACK = 0x00
 MP_ERROR_TYPE = 0x00
@@ -78,12 +116,45 @@ MP_ERROR_ERRNO = 0x04
 MP_ERROR_ERRCODE = 0x05
 MP_ERROR_FIELDS = 0x06
 
+MP_ERROR_REQUIRED_KEYS = (MP_ERROR_TYPE, MP_ERROR_FILE, MP_ERROR_LINE, MP_ERROR_MESSAGE,
+                          MP_ERROR_ERRNO, MP_ERROR_ERRCODE)
+
+
+def _lazy_box_error(stack, pos):
+    """
+    Build `box.error`_ object which fields are decoded from the stack
+    item on first access.
+
+    :param stack: Encoded error stack received from Tarantool.
+    :type stack: :obj:`list` or :obj:`tuple`
+
+    :param pos: Stack item position.
+    :type pos: :obj:`int`
+
+    :rtype: :class:`~tarantool.BoxError` or :obj:`None`
+
+    :meta private:
+    """
+
+    if pos >= len(stack):
+        return None
+
+    err = BoxError.__new__(BoxError)
+    err.__dict__['_lazy'] = (stack, pos)
+    return err
+
 
 def decode_box_error(err_map):
     """
     Decode MessagePack map received from Tarantool to `box.error`_
     object representation.
 
+    Error fields (including the ``prev`` chain) are materialized on
+    first attribute access, so errors that are only raised and
+    checked by :attr:`~tarantool.error.DatabaseError.code` are cheap.
+    Required fields of stack items are validated on decode, so
+    attribute access does not fail.
+
     :param err_map: Error MessagePack map received from Tarantool.
     :type err_map: :obj:`dict`
 
@@ -92,23 +163,13 @@ def decode_box_error(err_map):
     :raises: :exc:`KeyError`
     """
 
-    encoded_stack = err_map[MP_ERROR_STACK]
-
-    prev = None
-    for item in encoded_stack[::-1]:
-        err = BoxError(
-            type=item[MP_ERROR_TYPE],
-            file=item[MP_ERROR_FILE],
-            line=item[MP_ERROR_LINE],
-            message=item[MP_ERROR_MESSAGE],
-            errno=item[MP_ERROR_ERRNO],
-            errcode=item[MP_ERROR_ERRCODE],
-            fields=item.get(MP_ERROR_FIELDS),  # omitted if empty
-            prev=prev,
-        )
-        prev = err
+    stack = err_map[MP_ERROR_STACK]
+    for item in stack:
+        for key in MP_ERROR_REQUIRED_KEYS:
+            if key not in item:
+                raise KeyError(key)
 
-    return prev
+    return _lazy_box_error(stack, 0)
 
 
 def encode_box_error(err):
@@ -143,3 +204,146 @@ def encode_box_error(err):
         err = err.prev
 
     return {MP_ERROR_STACK: stack}
+
+
+class Packed():
+    """
+    Value already encoded to MessagePack. Its data is spliced into a
+    request body as is, so a large value (like a configuration blob
+    or a batch tuple) may be encoded once and sent many times, or
+    MessagePack data from another source may be forwarded without
+    decoding.
+
+    It is supported as a whole tuple and as a tuple field in
+    :meth:`~tarantool.Connection.insert` and
+    :meth:`~tarantool.Connection.replace` and as an argument in
+    :meth:`~tarantool.Connection.call` and
+    :meth:`~tarantool.Connection.eval`:
+
+    .. code-block:: python
+
+        >>> blob = tarantool.Packed(msgpack.packb({'key': 'value'}))
+        >>> conn.call('apply_config', blob)
+        >>> conn.replace('configs', [1, blob])
+
+    Use :meth:`~tarantool.Connection.pack` to encode a value with
+    connection encoding options and extension types.
+
+    The data is not validated: it must be a single complete
+    MessagePack object, otherwise the request would be malformed.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        """
+        :param data: MessagePack-encoded value.
+        :type data: :obj:`bytes`
+        """
+
+        self.data = bytes(data)
+        """
+        MessagePack-encoded value.
+
+        :type: :obj:`bytes`
+        """
+
+    def __bytes__(self):
+        return self.data
+
+    def __eq__(self, other):
+        if isinstance(other, Packed):
+            return self.data == other.data
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.data)
+
+    def __repr__(self):
+        return f'tarantool.Packed({self.data!r})'
+
+
+class CompiledOps(Packed):
+    """
+    Update operations prepared once and sent many times. Built with
+    :meth:`~tarantool.Connection.compile_ops`: field names are
+    resolved to field ids and the operation list (with its operands)
+    is encoded with connection packer, so it is spliced into
+    :meth:`~tarantool.Connection.update` and
+    :meth:`~tarantool.Connection.upsert` request body as is:
+
+    .. code-block:: python
+
+        >>> ops = conn.compile_ops('counters', [('+', 'hits', 1)])
+        >>> conn.update('counters', 'page', ops)
+
+    If the space schema changes, the operations are compiled again on
+    next use. The object itself is never changed: operations compiled
+    for other space schema objects are cached in it, so the object may
+    be shared between threads and connections. Operands are encoded
+    with the packer of the connection that compiles them first.
+    """
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('ops', 'space', '_compiled')
+
+    def __init__(self, data, ops, space):
+        """
+        :param data: MessagePack-encoded operation list.
+        :type data: :obj:`bytes`
+
+        :param ops: Source operation list.
+        :type ops: :obj:`tuple` or :obj:`list`
+
+        :param space: Space schema the operations are compiled with,
+            ``None`` for a schemaless connection.
+        :type space: :class:`~tarantool.schema.SchemaSpace` or
+            :obj:`None`
+        """
+
+        super().__init__(data)
+        self.ops = ops
+        """
+        Source operation list.
+
+        :type: :obj:`tuple` or :obj:`list`
+        """
+
+        self.space = space
+        """
+        Space schema the operations are compiled with.
+
+        :type: :class:`~tarantool.schema.SchemaSpace` or :obj:`None`
+        """
+
+        self._compiled = weakref.WeakKeyDictionary()
+
+    def compiled_for(self, space, compile_ops):
+        """
+        Get the operations compiled for a space schema.
+
+        :param space: Current space schema.
+        :type space: :class:`~tarantool.schema.SchemaSpace`
+
+        :param compile_ops: Called to compile the operations for the
+            space schema if they are not compiled yet.
+        :type compile_ops: :obj:`callable`
+
+        :rtype: :class:`~tarantool.CompiledOps`
+
+        :meta private:
+        """
+
+        if space is self.space:
+            return self
+        # Only the encoded data is cached: a value referencing the
+        # space schema would keep the weak key alive. Concurrent callers
+        # may compile the same operations twice, the results are equal.
+        data = self._compiled.get(space)
+        if data is None:
+            data = compile_ops().data
+            self._compiled[space] = data
+        return CompiledOps(data, self.ops, space)
+
+    def __repr__(self):
+        return f'tarantool.CompiledOps({self.ops!r})'
@@ -25,6 +25,7 @@ from .test_error_ext import TestSuiteErrorExt
 from .test_push import TestSuitePush
 from .test_connection import TestSuiteConnection
 from .test_crud import TestSuiteCrud
+from .test_sharded_pool import TestSuiteShardedPool
 
 test_cases = (TestSuiteSchemaUnicodeConnection,
               TestSuiteSchemaBinaryConnection,
@@ -33,7 +34,8 @@ test_cases = (TestSuiteSchemaUnicodeConnection,
               TestSuiteEncoding, TestSuitePool, TestSuiteSsl,
               TestSuiteDecimal, TestSuiteUUID, TestSuiteDatetime,
               TestSuiteInterval, TestSuitePackage, TestSuiteErrorExt,
-              TestSuitePush, TestSuiteConnection, TestSuiteCrud,)
+              TestSuitePush, TestSuiteConnection, TestSuiteCrud,
+              TestSuiteShardedPool,)
 
 
 def load_tests(loader, tests, pattern):
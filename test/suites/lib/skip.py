@@ -306,3 +306,17 @@ def skip_or_run_iproto_basic_features_test(func):
 
     return skip_or_run_test_tarantool(func, '2.10.0',
                                       'does not support iproto ID and iproto basic features')
+
+
+def skip_or_run_space_and_index_names_test(func):
+    """
+    Decorator to skip or run tests related to space and index names
+    in space requests.
+
+    Tarantool supports IPROTO_FEATURE_SPACE_AND_INDEX_NAMES only since
+    3.0.0 version.
+    See https://github.com/tarantool/tarantool/issues/8146
+    """
+
+    return skip_or_run_test_tarantool(func, '3.0.0',
+                                      'does not support space and index names in requests')
@@ -156,6 +156,56 @@ class TestSuiteConnection(unittest.TestCase):
         resp = self.con.eval("return {1, 2, 3}")
         self.assertIsInstance(resp[0], tuple)
 
+    @skip_or_run_decimal_test
+    def test_ext_types_register(self):
+        class MyDecimal(decimal.Decimal):
+            pass
+
+        def my_decimal_decode(data, unpacker):
+            return MyDecimal(ext_decimal.decode(data, unpacker))
+
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+        self.con.ext_types.register(ext_decimal.EXT_ID, python_type=MyDecimal,
+                                    encode=ext_decimal.encode,
+                                    decode=my_decimal_decode)
+
+        resp = self.con.eval("return ...", (MyDecimal('27756'),))
+        self.assertIsInstance(resp[0], MyDecimal)
+        self.assertSequenceEqual(resp, [decimal.Decimal('27756')])
+
+    @skip_or_run_decimal_test
+    def test_ext_types_disable(self):
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+        self.con.ext_types.disable(ext_decimal.EXT_ID)
+
+        resp = self.con.eval("return require('decimal').new('27756')")
+        self.assertEqual(resp[0], msgpack.ExtType(
+            ext_decimal.EXT_ID, ext_decimal.encode(decimal.Decimal('27756'), None)))
+
+        resp = self.con.eval("return require('decimal').is_decimal(...)", (resp[0],))
+        self.assertSequenceEqual(resp, [True])
+
+        with self.assertRaisesRegex(TypeError, 'Unknown type'):
+            self.con.eval("return ...", (decimal.Decimal('27756'),))
+
+    @skip_or_run_varbinary_test
+    def test_varbinary_memoryview(self):
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test',
+                                        varbinary_memoryview=True)
+
+        data = bytes(bytearray.fromhex('DEADBEAF0102'))
+        resp = self.con.replace('space_varbin', [2, data])
+        self.assertIsInstance(resp[0][1], memoryview)
+        self.assertEqual(bytes(resp[0][1]), data)
+
+        resp = self.con.eval("return ...", (data, {'key': data}))
+        self.assertIsInstance(resp[0], memoryview)
+        self.assertEqual(bytes(resp[0]), data)
+        self.assertEqual(resp[1], {'key': data})
+
     def tearDown(self):
         if self.con:
             self.con.close()
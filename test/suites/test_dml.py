@@ -420,6 +420,22 @@ class TestSuiteRequest(unittest.TestCase):
         else:
             self.fail('Expected error')
 
+    def test_17_packed(self):
+        args = self.con.pack([123, 'packed'])
+        self.assertEqual(args, tarantool.Packed(b'\x92\x7b\xa6packed'))
+        self.assertSequenceEqual(self.con.eval('return ...', args, 'plain'),
+                                 [[123, 'packed'], 'plain'])
+        self.assertSequenceEqual(self.con.call('box.tuple.new', args),
+                                 [[123, 'packed']])
+
+        values = tarantool.Packed(b'\x93\xcd\x02\x58\x01\xa9tuple_600')
+        self.assertSequenceEqual(self.con.replace('space_1', values),
+                                 [[600, 1, 'tuple_600']])
+        self.assertSequenceEqual(self.con.insert('space_1', [601, 1, self.con.pack('tuple_601')]),
+                                 [[601, 1, 'tuple_601']])
+        self.assertSequenceEqual(self.con.select('space_1', 600), [[600, 1, 'tuple_600']])
+        self.assertSequenceEqual(self.con.select('space_1', 601), [[601, 1, 'tuple_601']])
+
     @classmethod
     def tearDownClass(cls):
         cls.con.close()
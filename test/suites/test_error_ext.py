@@ -12,6 +12,7 @@ import msgpack
 import tarantool
 from tarantool.msgpack_ext.packer import default as packer_default
 from tarantool.msgpack_ext.unpacker import ext_hook as unpacker_ext_hook
+from tarantool.types import decode_box_error
 
 from .lib.tarantool_server import TarantoolServer
 from .lib.skip import skip_or_run_error_ext_type_test
@@ -324,6 +325,29 @@ class TestSuiteErrorExt(unittest.TestCase):
 
                 self.assertEqual(err, expected_err)
 
+    def test_msgpack_decode_lazy(self):
+        for name, case in self.cases.items():
+            with self.subTest(msg=name):
+                conn = getattr(self, case['conn'])
+
+                err = unpacker_ext_hook(3, case['msgpack'], conn._unpacker_factory())
+                self.assertNotIn('errcode', vars(err))
+
+                self.assertEqual(err.errcode, case['python'].errcode)
+                self.assertIn('message', vars(err))
+                if err.prev is not None:
+                    self.assertNotIn('errcode', vars(err.prev))
+
+    def test_msgpack_decode_malformed(self):
+        stack = [{0: 'ClientError', 1: 'file', 2: 1, 3: 'message', 4: 0, 5: 1},
+                 {0: 'ClientError', 1: 'file', 2: 1, 3: 'message', 4: 0}]
+        with self.assertRaises(KeyError):
+            decode_box_error({0: stack})
+
+        err = decode_box_error({0: stack[:1]})
+        self.assertFalse(hasattr(err, 'unknown'))
+        self.assertEqual(getattr(err, 'errcode', None), 1)
+
     def test_msgpack_encode(self):
         for name, case in self.cases.items():
             with self.subTest(msg=name):
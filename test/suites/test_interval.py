@@ -210,6 +210,12 @@ class TestSuiteInterval(unittest.TestCase):
             MsgpackError, '3 is not a valid Adjust',
             lambda: unpacker_ext_hook(6, case, self.con._unpacker_factory()))
 
+    def test_truncated_payload_decode(self):
+        case = b'\x02\x07\xce\x00\x98\x96'
+        self.assertRaisesRegex(
+            MsgpackError, 'Unexpected end of interval payload',
+            lambda: unpacker_ext_hook(6, case, self.con._unpacker_factory()))
+
     arithmetic_cases = {
         'year': {
             'arg_1': tarantool.Interval(year=2),
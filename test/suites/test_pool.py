@@ -2,9 +2,13 @@
 This module tests work with a cluster of Tarantool servers through
 ConnectionPool.
 """
-# pylint: disable=missing-class-docstring,missing-function-docstring,too-many-public-methods,too-many-locals,duplicate-code,bad-option-value,no-self-use
+# pylint: disable=missing-class-docstring,missing-function-docstring,too-many-public-methods,too-many-locals,duplicate-code,bad-option-value,no-self-use,too-many-lines
 
+import concurrent.futures
+import signal
+import socket
 import sys
+import threading
 import time
 import unittest
 import warnings
@@ -14,6 +18,7 @@ from tarantool.error import (
     ClusterConnectWarning,
     DatabaseError,
     NetworkWarning,
+    PoolManyError,
     PoolTolopogyError,
     PoolTolopogyWarning,
 )
@@ -565,6 +570,458 @@ class TestSuitePool(unittest.TestCase):
 
         self.assertEqual(self.pool.is_closed(), True)
 
+    def test_17_idle_pool_does_not_spin(self):
+        self.set_cluster_ro([False, False, True, False, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=10)
+
+        cpu_start = time.process_time()
+        time.sleep(1)
+        self.assertLess(time.process_time() - cpu_start, 0.5)
+
+        # Worker threads are woken up on close without waiting for refresh.
+        close_start = time.monotonic()
+        self.pool.close()
+        self.assertLess(time.monotonic() - close_start, 5)
+        self.assertEqual(self.pool.is_closed(), True)
+
+    def test_18_connections_per_instance(self):
+        self.set_cluster_ro([False, False, True, False, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs[:1],
+            user='test',
+            password='test',
+            connections_per_instance=3)
+
+        results = []
+
+        def sleep_and_get_id():
+            results.append(self.pool.eval("require('fiber').sleep(0.5) return srv_id()",
+                                          mode=tarantool.Mode.ANY).data)
+
+        threads = [threading.Thread(target=sleep_and_get_id) for _ in range(3)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Requests are processed concurrently, not one after another.
+        self.assertLess(time.monotonic() - start, 1.4)
+        self.assertEqual(results, [[0], [0], [0]])
+
+    def test_18_connections_per_instance_invalid(self):
+        with self.assertRaisesRegex(tarantool.error.ConfigurationError,
+                                    'connections_per_instance must be a positive integer'):
+            tarantool.ConnectionPool(addrs=self.addrs, connections_per_instance=0)
+
+    def test_19_load_aware_strategies(self):
+        self.set_cluster_ro([False, False, True, False, True])
+
+        for strategy_class in [tarantool.connection_pool.LeastLoadedStrategy,
+                               tarantool.connection_pool.LatencyStrategy]:
+            with self.subTest(strategy=strategy_class.__name__):
+                self.pool = tarantool.ConnectionPool(
+                    addrs=self.addrs,
+                    user='test',
+                    password='test',
+                    strategy_class=strategy_class)
+
+                for _ in range(10):
+                    self.assertSequenceEqual(
+                        self.pool.eval('return box.info().ro', mode=tarantool.Mode.RW),
+                        [False])
+                    self.assertSequenceEqual(
+                        self.pool.eval('return box.info().ro', mode=tarantool.Mode.RO),
+                        [True])
+                    self.assertSequenceEqual(
+                        self.pool.eval('return box.info().ro', mode=tarantool.Mode.PREFER_RO),
+                        [True])
+
+                units = self.pool.pool.values()
+                self.assertTrue(all(unit.in_flight == 0 for unit in units))
+                self.assertTrue(any(unit.latency is not None for unit in units))
+
+                self.pool.close()
+                self.pool = None
+
+    def test_20_network_error_marks_unhealthy(self):
+        self.set_cluster_ro([False, True, True, True, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            reconnect_max_attempts=0,
+            refresh_delay=100)
+
+        self.assertSequenceEqual(self.pool.eval('return srv_id()', mode=tarantool.Mode.RW), [0])
+
+        self.servers[0].stop()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            with self.assertRaises(tarantool.error.NetworkError):
+                self.pool.eval('return srv_id()', mode=tarantool.Mode.RW)
+
+            # The server is excluded without waiting for the next probe.
+            with self.assertRaisesRegex(PoolTolopogyError,
+                                        "Can't find healthy rw instance in pool"):
+                self.pool.eval('return srv_id()', mode=tarantool.Mode.RW)
+
+        self.assertIn(self.pool.eval('return srv_id()', mode=tarantool.Mode.PREFER_RW)[0],
+                      [1, 2, 3, 4])
+
+    def test_21_connect_quorum(self):
+        self.set_cluster_ro([False, True, True, True, True])
+
+        # Server which accepts connections but never sends a greeting.
+        hanging = socket.socket()
+        hanging.bind(('127.0.0.1', 0))
+        hanging.listen()
+        self.addCleanup(hanging.close)
+        addrs = self.addrs + [{'host': '127.0.0.1', 'port': hanging.getsockname()[1]}]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            start = time.monotonic()
+            self.pool = tarantool.ConnectionPool(
+                addrs=addrs,
+                user='test',
+                password='test',
+                socket_timeout=5,
+                connection_timeout=5,
+                connect_quorum=tarantool.Mode.RW)
+            self.assertLess(time.monotonic() - start, 3)
+
+            self.assertSequenceEqual(self.pool.eval('return srv_id()', mode=tarantool.Mode.RW),
+                                     [0])
+
+    def test_21_connect_quorum_invalid(self):
+        with self.assertRaisesRegex(tarantool.error.ConfigurationError,
+                                    'connect_quorum must be None, a Mode value '
+                                    'or a positive integer'):
+            tarantool.ConnectionPool(addrs=self.addrs, connect_quorum=0)
+
+    def test_22_call_all(self):
+        self.set_cluster_ro([False, False, True, False, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        results = self.pool.call_all('srv_id', mode=tarantool.Mode.RO)
+        self.assertEqual(sorted(resp[0] for resp in results.values()), [2, 4])
+
+        results = self.pool.call_all('srv_id', mode=tarantool.Mode.ANY)
+        self.assertEqual(set(results.keys()), set(self.pool.pool.keys()))
+
+        self.assertEqual(
+            self.pool.map_reduce('srv_id', reducer=lambda acc, resp: acc + resp[0],
+                                 initializer=0, mode=tarantool.Mode.RW),
+            0 + 1 + 3)
+
+        self.servers[1].admin("function srv_id() error('srv_id failure') end")
+        with self.assertRaises(PoolManyError) as ctx:
+            self.pool.map_reduce('srv_id', reducer=lambda acc, resp: acc + resp[0],
+                                 mode=tarantool.Mode.RW)
+        self.assertEqual(len(ctx.exception.results), 2)
+        self.assertEqual(len(ctx.exception.errors), 1)
+        self.assertIsInstance(list(ctx.exception.errors.values())[0], DatabaseError)
+
+    def test_22_call_all_timeout(self):
+        self.set_cluster_ro([False, False, True, False, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        self.servers[0].admin("function srv_id() require('fiber').sleep(1) return 0 end")
+        results = self.pool.call_all('srv_id', mode=tarantool.Mode.ANY, timeout=0.5)
+        self.assertEqual(
+            sorted(type(resp).__name__ for resp in results.values()),
+            ['PoolTimeoutError', 'Response', 'Response', 'Response', 'Response'])
+
+    def test_23_hedged_select(self):
+        self.set_cluster_ro([False, False, True, False, True])
+        self.servers[2].admin("box.space.test:insert{'hedged', 1}")
+        self.servers[4].admin("box.space.test:insert{'hedged', 1}")
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            socket_timeout=10,
+            refresh_delay=100,
+            hedge_delay=0.1)
+
+        # Freeze one of RO servers: its requests hang.
+        self.servers[2].process.send_signal(signal.SIGSTOP)
+        self.addCleanup(self.servers[2].process.send_signal, signal.SIGCONT)
+
+        for _ in range(4):
+            start = time.monotonic()
+            self.assertSequenceEqual(
+                self.pool.select('test', 'hedged', mode=tarantool.Mode.RO),
+                [['hedged', 1]])
+            self.assertLess(time.monotonic() - start, 2)
+
+    def test_23_hedge_delay_invalid(self):
+        with self.assertRaisesRegex(tarantool.error.ConfigurationError,
+                                    'hedge_delay must be None or a non-negative number'):
+            tarantool.ConnectionPool(addrs=self.addrs, hedge_delay=-1)
+
+    def test_24_circuit_breaker(self):
+        self.set_cluster_ro([False, False, True, False, True])
+        self.servers[0].admin("function srv_id() require('fiber').sleep(0.2) return 0 end")
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=100)
+
+        for _ in range(50):
+            self.pool.call('srv_id', mode=tarantool.Mode.ANY)
+
+        slow_unit = self.pool.pool[f"{self.addrs[0]['host']}:{self.addrs[0]['port']}"]
+        self.assertEqual(slow_unit.circuit, tarantool.connection_pool.CircuitState.OPEN)
+
+        # Outlier is skipped while its circuit is open.
+        start = time.monotonic()
+        ids = [self.pool.call('srv_id', mode=tarantool.Mode.ANY)[0] for _ in range(8)]
+        self.assertNotIn(0, ids)
+        self.assertLess(time.monotonic() - start, 0.2)
+
+        # Circuit is closed after a successful trial request.
+        self.servers[0].admin("function srv_id() return 0 end")
+        time.sleep(1.5)
+        for _ in range(5):
+            self.pool.call('srv_id', mode=tarantool.Mode.ANY)
+        self.assertEqual(slow_unit.circuit, tarantool.connection_pool.CircuitState.CLOSED)
+
+    def test_24_circuit_breaker_single_master(self):
+        self.set_cluster_ro([False, True, True, True, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=100)
+
+        for _ in range(20):
+            self.pool.call('srv_id', mode=tarantool.Mode.RO)
+        # Replicas have been idle for a while.
+        for unit in self.pool.pool.values():
+            if unit.latency_time is not None:
+                unit.latency_time -= 60
+
+        self.servers[0].admin("function srv_id() require('fiber').sleep(0.2) return 0 end")
+        self.addCleanup(self.servers[0].admin, "function srv_id() return 0 end")
+        for _ in range(10):
+            self.assertSequenceEqual(self.pool.call('srv_id', mode=tarantool.Mode.RW), [0])
+
+        master = self.pool.pool[f"{self.addrs[0]['host']}:{self.addrs[0]['port']}"]
+        self.assertEqual(master.circuit, tarantool.connection_pool.CircuitState.CLOSED)
+
+    def test_24_circuit_trial_outcome_unknown(self):
+        unit = tarantool.connection_pool.PoolUnit(addr=self.addrs[0], conn=None,
+                                                  health_conn=None)
+        unit.circuit = tarantool.connection_pool.CircuitState.OPEN
+        unit.circuit_open_time = time.monotonic() - 2
+
+        unit.request_started()
+        self.assertEqual(unit.circuit, tarantool.connection_pool.CircuitState.HALF_OPEN)
+        unit.request_finished(0.1)
+        unit.request_abandoned(time.monotonic())
+
+        self.assertEqual(unit.circuit, tarantool.connection_pool.CircuitState.OPEN)
+        self.assertTrue(unit.circuit_allows(time.monotonic() + 2))
+
+    def test_25_submit(self):
+        self.set_cluster_ro([False, False, True, False, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        start = time.monotonic()
+        futures = [self.pool.submit('eval', "require('fiber').sleep(0.5) return srv_id()",
+                                    mode=tarantool.Mode.ANY)
+                   for _ in range(self.servers_count)]
+        results = tarantool.connection_pool.gather(futures)
+        # Requests to different servers are processed concurrently.
+        self.assertLess(time.monotonic() - start, 1.4)
+        self.assertEqual(sorted(resp[0] for resp in results), [0, 1, 2, 3, 4])
+
+        futures = [self.pool.submit('call', 'srv_id', mode=tarantool.Mode.RO),
+                   self.pool.submit('call', 'unknown_function', mode=tarantool.Mode.RO)]
+        results = tarantool.connection_pool.gather(futures, return_exceptions=True)
+        self.assertIn(results[0][0], [2, 4])
+        self.assertIsInstance(results[1], DatabaseError)
+
+        with self.assertRaises(DatabaseError):
+            tarantool.connection_pool.gather(futures)
+
+    def test_25_submit_close(self):
+        self.set_cluster_ro([False, False, True, False, False])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            socket_timeout=1,
+            refresh_delay=100)
+
+        # Freeze the only RO server: its requests queue up.
+        self.servers[2].process.send_signal(signal.SIGSTOP)
+        self.addCleanup(self.servers[2].process.send_signal, signal.SIGCONT)
+
+        futures = [self.pool.submit('call', 'srv_id', mode=tarantool.Mode.RO)
+                   for _ in range(3)]
+        self.pool.close()
+
+        # Requests left in the queue are not lost on close.
+        results = tarantool.connection_pool.gather(futures, timeout=5, return_exceptions=True)
+        self.assertIsInstance(results[0], tarantool.error.NetworkError)
+        self.assertTrue(all(isinstance(result, concurrent.futures.CancelledError)
+                            for result in results[1:]))
+
+    def test_25_submit_cancelled_trial(self):
+        unit = tarantool.connection_pool.PoolUnit(addr=self.addrs[0], conn=None,
+                                                  health_conn=None)
+        unit.circuit = tarantool.connection_pool.CircuitState.OPEN
+        unit.circuit_open_time = time.monotonic() - 2
+
+        unit.request_started()
+        unit.request_cancelled(time.monotonic())
+
+        self.assertEqual(unit.in_flight, 0)
+        self.assertEqual(unit.circuit, tarantool.connection_pool.CircuitState.OPEN)
+        self.assertTrue(unit.circuit_allows(time.monotonic() + 2))
+
+    def test_25_submit_invalid(self):
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        with self.assertRaisesRegex(ValueError, "Please, specify 'mode' keyword argument"):
+            self.pool.submit('call', 'srv_id')
+
+        with self.assertRaisesRegex(ValueError, 'Unsupported method close'):
+            self.pool.submit('close', mode=tarantool.Mode.ANY)
+
+    def test_26_replication_tracking(self):
+        self.set_cluster_ro([True, True, False, True, True])
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=100,
+            max_replica_lag=1)
+
+        for key in self.pool.pool:
+            state = self.pool.pool[key].state
+            self.assertEqual(state.lag, 0)
+            self.assertIsInstance(state.vclock, dict)
+
+        self.pool.insert('test', ['vclock', 1])
+        token = self.pool.vclock_token()
+        self.assertIsInstance(token, dict)
+
+        # Servers are not replicas of the RW one, so their vclocks are
+        # not comparable with the token: make the token to be ahead.
+        token = {replica_id: lsn + 2**32 for replica_id, lsn in token.items()}
+        for _ in range(4):
+            self.assertSequenceEqual(
+                self.pool.call('srv_id', mode=tarantool.Mode.PREFER_RO, min_vclock=token),
+                [2])
+
+        ids = {self.pool.call('srv_id', mode=tarantool.Mode.RO, min_vclock={})[0]
+               for _ in range(20)}
+        self.assertNotIn(2, ids)
+
+    def test_26_sparse_vclock(self):
+        vclock_from_lua = tarantool.connection_pool.vclock_from_lua
+        vclock_covers = tarantool.connection_pool.vclock_covers
+
+        # Lua table {[1] = 5, [3] = 7} is encoded as a sparse array.
+        vclock = vclock_from_lua([5, None, 7])
+        self.assertEqual(vclock, {1: 5, 3: 7})
+        self.assertTrue(vclock_covers(vclock, {1: 3, 2: 0}))
+        self.assertFalse(vclock_covers(vclock, {1: 3, 2: 1}))
+        self.assertTrue(vclock_covers(vclock, {1: 3, 2: None}))
+
+    def test_26_replica_lag(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        # Standalone servers have no upstreams: add a fake one to the
+        # server 1 replication info to control its state.
+        self.servers[1].admin(r"""
+            real_info = box.info
+            fake_upstream = {status = 'stopped', lag = 0}
+            box.info = setmetatable({}, {
+                __index = real_info,
+                __call = function()
+                    local info = real_info()
+                    info.replication[100] = {id = 100, upstream = fake_upstream}
+                    return info
+                end,
+            })
+        """)
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=0.2,
+            max_replica_lag=1)
+
+        unit = self.pool.pool[f"{self.addrs[1]['host']}:{self.addrs[1]['port']}"]
+        status = tarantool.connection_pool.Status
+
+        def expect_lag(lag, lagging):
+            self.assertEqual(unit.state.lag, lag)
+            self.assertEqual(unit.state.lagging, lagging)
+            # Lagging servers stay healthy.
+            self.assertEqual(unit.state.status, status.HEALTHY)
+
+        def ids(mode):
+            return {self.pool.call('srv_id', mode=mode)[0] for _ in range(20)}
+
+        # Replication is stopped.
+        self.retry(func=lambda: expect_lag(float('inf'), True))
+        self.assertNotIn(1, ids(tarantool.Mode.RO))
+        self.assertNotIn(1, ids(tarantool.Mode.PREFER_RO))
+        self.assertIn(1, ids(tarantool.Mode.ANY))
+        self.assertIn(1, {resp[0] for resp in self.pool.call_all('srv_id').values()})
+
+        # Replication lag exceeds the threshold.
+        self.servers[1].admin("fake_upstream.status = 'follow'; fake_upstream.lag = 5")
+        self.retry(func=lambda: expect_lag(5, True))
+        self.assertNotIn(1, ids(tarantool.Mode.RO))
+
+        # Replica has caught up.
+        self.servers[1].admin("fake_upstream.lag = 0.1")
+        self.retry(func=lambda: expect_lag(0.1, False))
+        self.assertIn(1, ids(tarantool.Mode.RO))
+
+    def test_26_max_replica_lag_invalid(self):
+        with self.assertRaisesRegex(tarantool.error.ConfigurationError,
+                                    'max_replica_lag must be None or a non-negative number'):
+            tarantool.ConnectionPool(addrs=self.addrs, max_replica_lag='1')
+
     def tearDown(self):
         if self.pool:
             self.pool.close()
@@ -97,8 +97,14 @@ class TestSuiteProtocol(unittest.TestCase):
         self.assertEqual(self.con._features[IPROTO_FEATURE_TRANSACTIONS], False)
         self.assertEqual(self.con._features[IPROTO_FEATURE_WATCHERS], False)
         self.assertEqual(self.con._features[IPROTO_FEATURE_PAGINATION], False)
-        self.assertEqual(self.con._features[IPROTO_FEATURE_SPACE_AND_INDEX_NAMES], False)
-        self.assertEqual(self.con._features[IPROTO_FEATURE_WATCH_ONCE], False)
+        if self.adm.tnt_version >= pkg_resources.parse_version('3.0.0'):
+            self.assertEqual(self.con._features[IPROTO_FEATURE_SPACE_AND_INDEX_NAMES], True)
+        else:
+            self.assertEqual(self.con._features[IPROTO_FEATURE_SPACE_AND_INDEX_NAMES], False)
+        if self.adm.tnt_version >= pkg_resources.parse_version('3.0.0'):
+            self.assertEqual(self.con._features[IPROTO_FEATURE_WATCH_ONCE], True)
+        else:
+            self.assertEqual(self.con._features[IPROTO_FEATURE_WATCH_ONCE], False)
 
     @skip_or_run_iproto_basic_features_test
     def test_protocol_requirement(self):
@@ -3,15 +3,19 @@ This module tests space and index schema fetch.
 """
 # pylint: disable=missing-class-docstring,missing-function-docstring,fixme,too-many-public-methods,too-many-branches,too-many-statements
 
+import contextlib
+import os
 import sys
+import tempfile
 import unittest
+from unittest import mock
 import pkg_resources
 
 import tarantool
 from tarantool.error import NotSupportedError
 
 from .lib.tarantool_server import TarantoolServer
-from .lib.skip import skip_or_run_constraints_test
+from .lib.skip import skip_or_run_constraints_test, skip_or_run_space_and_index_names_test
 
 
 # FIXME: I'm quite sure that there is a simpler way to count
@@ -598,6 +602,264 @@ class TestSuiteSchemaAbstract(unittest.TestCase):
                                     'foreign tuple was not found'):
             self.con.replace('constr_tester_2', [2, 999, 623])
 
+    def test_12_schema_preload_disabled(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   encoding=self.encoding, user='test', password='test',
+                                   schema_preload=None)
+        self.assertEqual(con.schema.schema, {})
+
+        fetch_space_counter = MethodCallCounter(con.schema, 'fetch_space')
+        fetch_index_counter = MethodCallCounter(con.schema, 'fetch_index')
+        try:
+            self.assertSequenceEqual(con.select('tester', 1, index='primary_index'),
+                                     [[1, None]])
+            self.assertSequenceEqual(con.select('tester', 1, index='primary_index'),
+                                     [[1, None]])
+            self.assertEqual(fetch_space_counter.call_count(), 1)
+            self.assertEqual(fetch_index_counter.call_count(), 1)
+        finally:
+            fetch_space_counter.unbind()
+            fetch_index_counter.unbind()
+            con.close()
+
+    def test_12_schema_preload_invalid(self):
+        with self.assertRaisesRegex(tarantool.error.ConfigurationError,
+                                    "Unknown schema_preload mode 'some'"):
+            tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                 schema_preload='some', connect_now=False)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def patch_schema_fetch():
+        # Track _vspace and _vindex selects without changing them.
+        schema = tarantool.schema.Schema
+        with mock.patch.object(schema, 'fetch_space_from', autospec=True,
+                               side_effect=schema.fetch_space_from) as fetch_space_from, \
+             mock.patch.object(schema, 'fetch_index_from', autospec=True,
+                               side_effect=schema.fetch_index_from) as fetch_index_from:
+            yield fetch_space_from, fetch_index_from
+
+    def test_13_schema_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'schema.cache')
+
+            con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                       encoding=self.encoding, user='test', password='test',
+                                       schema_cache=cache_path)
+            con.close()
+            self.assertTrue(os.path.exists(cache_path))
+
+            with self.patch_schema_fetch() as (fetch_space_from, fetch_index_from):
+                con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                           encoding=self.encoding, user='test', password='test',
+                                           schema_cache=cache_path)
+                try:
+                    fetch_space_from.assert_not_called()
+                    fetch_index_from.assert_not_called()
+                    self.assertSequenceEqual(con.select('tester', 1, index='primary_index'),
+                                             [[1, None]])
+                    self.assertEqual(con.schema.get_field('tester', 'name')['id'], 1)
+                finally:
+                    con.close()
+
+            # Entries of other users are not used.
+            with self.patch_schema_fetch() as (fetch_space_from, _):
+                con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                           encoding=self.encoding, schema_cache=cache_path)
+                try:
+                    fetch_space_from.assert_called()
+                finally:
+                    con.close()
+
+            # Schema version change invalidates the cache entry.
+            self.srv.admin("box.schema.create_space('cache_tester')")
+            try:
+                con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                           encoding=self.encoding, user='test', password='test',
+                                           schema_cache=cache_path)
+                try:
+                    self.assertEqual(con.schema.get_space('cache_tester').name, 'cache_tester')
+                finally:
+                    con.close()
+            finally:
+                self.srv.admin("box.space.cache_tester:drop()")
+
+    def test_14_schema_registry(self):
+        registry = tarantool.SchemaRegistry()
+        con_1 = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                     encoding=self.encoding, user='test', password='test',
+                                     schema_registry=registry)
+        try:
+            with self.patch_schema_fetch() as (fetch_space_from, fetch_index_from):
+                con_2 = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                             encoding=self.encoding, user='test', password='test',
+                                             schema_registry=registry)
+                fetch_space_from.assert_not_called()
+                fetch_index_from.assert_not_called()
+
+            # Schema of other users is not shared.
+            con_guest = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                             encoding=self.encoding, schema_registry=registry)
+            self.assertIsNot(con_guest.schema.schema, con_1.schema.schema)
+            con_guest.close()
+
+            try:
+                self.assertIs(con_1.schema.schema, con_2.schema.schema)
+                self.assertSequenceEqual(con_2.select('tester', 1, index='primary_index'),
+                                         [[1, None]])
+
+                # Flush does not affect other connections.
+                con_1.schema.flush()
+                self.assertEqual(con_2.schema.get_space('tester').name, 'tester')
+
+                # Schema version from the response is used, no extra ping.
+                with mock.patch('tarantool.connection.RequestPing',
+                                wraps=tarantool.request.RequestPing) as ping:
+                    self.srv.admin("box.schema.create_space('registry_tester')")
+                    try:
+                        con_2.select('tester', 1)
+                        ping.assert_not_called()
+                        self.assertEqual(con_2.schema.get_space('registry_tester').name,
+                                         'registry_tester')
+                    finally:
+                        self.srv.admin("box.space.registry_tester:drop()")
+            finally:
+                con_2.close()
+        finally:
+            con_1.close()
+
+    def test_15_schema_incremental_refresh(self):
+        tester = self.sch.get_space('tester')
+        schema_version = self.con.schema_version
+
+        self.srv.admin("box.schema.create_space('refresh_tester')")
+        try:
+            # Any response with a newer schema version triggers refresh.
+            self.con.ping()
+            self.assertGreater(self.con.schema_version, schema_version)
+            self.assertEqual(self.con.schema.get_space('refresh_tester').name,
+                             'refresh_tester')
+            # Unchanged spaces are not rebuilt, and objects of the
+            # previous schema data (which may be shared) are intact.
+            new_tester = self.con.schema.get_space('tester')
+            self.assertIs(new_tester.format, tester.format)
+            self.assertIsNot(new_tester, tester)
+            self.assertIs(new_tester.indexes['primary_index'].space, new_tester)
+            self.assertIsNot(tester.schema, self.con.schema.schema)
+            self.assertIs(tester.indexes['primary_index'].space, tester)
+            self.assertEqual(self.fetch_count, 0)
+        finally:
+            self.srv.admin("box.space.refresh_tester:drop()")
+
+    def test_16_dict_tuple_and_key(self):
+        self.assertSequenceEqual(self.con.replace('tester', {'name': 'two', 'id': 2}),
+                                 [[2, 'two']])
+        self.assertSequenceEqual(self.con.insert('tester', {'id': 3}), [[3]])
+        self.assertSequenceEqual(self.con.select('tester', {'id': 2}), [[2, 'two']])
+        self.assertSequenceEqual(self.con.update('tester', {'id': 3}, [('=', 'name', 'three')]),
+                                 [[3, 'three']])
+        self.assertSequenceEqual(self.con.delete('tester', {'id': 2}), [[2, 'two']])
+        self.assertSequenceEqual(self.con.delete('tester', {'id': 3}), [[3, 'three']])
+
+        with self.assertRaisesRegex(tarantool.SchemaError,
+                                    "There's no field with name 'unknown' in space 'tester'"):
+            self.con.insert('tester', {'id': 4, 'unknown': 4})
+        with self.assertRaisesRegex(tarantool.SchemaError,
+                                    "Field 'id' is required in space 'tester'"):
+            self.con.insert('tester', {'name': 'four'})
+        self.con.schema.get_index('tester', 'primary_index')
+        with self.assertRaisesRegex(tarantool.SchemaError,
+                                    "Field 'id' is required by index 'primary_index' "
+                                    "in space 'tester'"):
+            self.con.insert('tester', {'id': None, 'name': 'four'})
+        with self.assertRaisesRegex(tarantool.SchemaError,
+                                    "are not a prefix of index 'primary_index'"):
+            self.con.select('tester', {'name': 'four'})
+
+    @skip_or_run_space_and_index_names_test
+    def test_17_schemaless_names(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   encoding=self.encoding, fetch_schema=False,
+                                   user='test', password='test')
+        try:
+            self.assertSequenceEqual(con.insert('tester', (5, 'five')), [[5, 'five']])
+            self.assertSequenceEqual(con.select('tester', 5, index='primary_index'),
+                                     [[5, 'five']])
+            self.assertSequenceEqual(con.update('tester', 5, [('=', 'name', 'FIVE')],
+                                                index='primary_index'),
+                                     [[5, 'FIVE']])
+            self.assertSequenceEqual(con.delete('tester', 5), [[5, 'FIVE']])
+            with self.assertRaises(NotSupportedError):
+                con.insert('tester', {'id': 5})
+            self.assertIsNone(con.schema)
+        finally:
+            con.close()
+
+    def test_18_compile_ops(self):
+        self.con.insert('tester', (7, 'seven'))
+        ops = self.con.compile_ops('tester', [('=', 'name', 'SEVEN')])
+        self.assertIs(ops.space, self.con.schema.get_space('tester'))
+        self.assertSequenceEqual(self.con.update('tester', 7, ops), [[7, 'SEVEN']])
+        self.assertSequenceEqual(self.con.upsert('tester', (7, 'seven'), ops), [])
+
+        # Operations are compiled again after schema reload, the
+        # compiled object itself is not changed.
+        space = ops.space
+        data = ops.data
+        self.con.flush_schema()
+        self.assertSequenceEqual(self.con.update('tester', 7, ops), [[7, 'SEVEN']])
+        self.assertIs(ops.space, space)
+        self.assertEqual(ops.data, data)
+        with mock.patch.object(self.con, 'compile_ops') as compile_ops:
+            self.assertSequenceEqual(self.con.update('tester', 7, ops), [[7, 'SEVEN']])
+            compile_ops.assert_not_called()
+
+        with self.assertRaisesRegex(tarantool.SchemaError,
+                                    "There's no field with name 'unknown' in space 'tester'"):
+            self.con.compile_ops('tester', [('=', 'unknown', 1)])
+
+        self.con.delete('tester', 7)
+
+    def test_19_key_check(self):
+        with mock.patch.object(self.con, '_send_request') as send_request:
+            with self.assertRaisesRegex(tarantool.DatabaseError, '(18, .*expected unsigned)'):
+                self.con.select('tester', 'one')
+            with self.assertRaisesRegex(tarantool.DatabaseError, '(31, .*)'):
+                self.con.select('tester', [1, 2])
+            with self.assertRaisesRegex(tarantool.DatabaseError, '(19, .*)'):
+                self.con.delete('tester', [])
+            with self.assertRaisesRegex(tarantool.DatabaseError, '(18, .*)'):
+                self.con.update('tester', -1, [])
+            send_request.assert_not_called()
+
+        self.assertSequenceEqual(self.con.select('tester', 1), [[1, None]])
+
+    def test_19_key_check_index_types(self):
+        self.srv.admin("""
+            local space = box.schema.create_space('key_check', {if_not_exists = true})
+            space:create_index('pk', {if_not_exists = true})
+            space:create_index('point', {type = 'rtree', unique = false,
+                                         parts = {{field = 2, type = 'array'}},
+                                         if_not_exists = true})
+            space:create_index('tag', {unique = false, parts = {{field = 3, type = 'string'},
+                                                                {field = 4, type = 'string'}},
+                                       if_not_exists = true})
+            space:replace({1, {1, 1}, 'a', 'b'})
+        """)
+        self.con.flush_schema()
+
+        # RTREE keys are flat coordinates lists.
+        self.assertSequenceEqual(
+            self.con.select('key_check', [0, 0, 5, 5], index='point', iterator='LE'),
+            [[1, [1, 1], 'a', 'b']])
+        self.assertSequenceEqual(self.con.select('key_check', [1, 1], index='point'),
+                                 [[1, [1, 1], 'a', 'b']])
+        # Partial keys are fine for non-unique indexes.
+        self.assertSequenceEqual(self.con.select('key_check', ['a'], index='tag'),
+                                 [[1, [1, 1], 'a', 'b']])
+        index = self.con.schema.get_index('key_check', 'tag')
+        index.check_key(['a'], self.con.encoding, self.con.ext_types.encoders, exact=True)
+
     @classmethod
     def tearDownClass(cls):
         # We need to drop spaces with foreign keys with predetermined order,
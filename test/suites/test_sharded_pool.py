@@ -0,0 +1,193 @@
+"""
+This module tests work with vshard storages through
+ShardedConnectionPool.
+"""
+# pylint: disable=missing-class-docstring,missing-function-docstring,duplicate-code
+
+import sys
+import time
+import unittest
+from unittest import mock
+
+import tarantool
+from tarantool.const import POOL_BUCKETS_MISSING_DELAY
+from tarantool.error import DatabaseError, PoolTolopogyError
+from tarantool.sharded_pool import VSHARD_WRONG_BUCKET, bucket_id_strcrc32
+
+from .lib.tarantool_server import TarantoolServer
+
+
+def create_server():
+    srv = TarantoolServer()
+    srv.script = 'test/suites/crud_server.lua'
+    srv.start()
+
+    return srv
+
+
+@unittest.skipIf(sys.platform.startswith("win"),
+                 "Sharded pool tests on windows platform are not supported: "
+                 "complexity of the vshard replicaset configuration")
+class TestSuiteShardedPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print(' SHARDED POOL '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        cls.srv = create_server()
+        cls.addrs = [{'host': cls.srv.host, 'port': cls.srv.args['primary']}]
+
+    def setUp(self):
+        # Time for vshard group configuration.
+        time.sleep(1)
+        self.pool = tarantool.ShardedConnectionPool(self.addrs, user='guest', password='',
+                                                    fetch_schema=False)
+        if self.pool.eval('return ROCKS_IMPORT_FAIL', mode=tarantool.Mode.ANY).data[0] is True:
+            raise unittest.SkipTest('The crud/vshard modules are not detected, '
+                                    'installation via rocks install is required '
+                                    'for sharded pool testing purposes. You can use '
+                                    '<tarantoolctl rocks install crud> or '
+                                    '<tt rocks install crud> to install modules')
+
+    def test_00_bucket_id(self):
+        self.assertEqual(self.pool.bucket_id(1), bucket_id_strcrc32(1, 300))
+
+        for key in [1, -1, 2**40, 2**60, 1.5, 'abc', '', True, [1, 'abc'], [2**60, 0.25]]:
+            with self.subTest(key=key):
+                self.assertEqual(
+                    self.pool.bucket_id(key),
+                    self.pool.eval('return vshard.router.bucket_id_strcrc32(...)', key,
+                                   mode=tarantool.Mode.ANY).data[0])
+
+    def test_01_dml(self):
+        bucket_id = self.pool.bucket_id(1001)
+
+        self.assertEqual(
+            self.pool.vshard_insert('tester', [1001, bucket_id, 'Alpha'], bucket_id=bucket_id),
+            [1001, bucket_id, 'Alpha'])
+        self.assertEqual(
+            self.pool.vshard_replace('tester', [1001, bucket_id, 'Bravo'], bucket_id=bucket_id),
+            [1001, bucket_id, 'Bravo'])
+        self.assertEqual(
+            self.pool.vshard_update('tester', 1001, [['=', 3, 'Charlie']], bucket_id=bucket_id),
+            [1001, bucket_id, 'Charlie'])
+        self.pool.vshard_upsert('tester', [1001, bucket_id, 'Delta'], [['=', 3, 'Echo']],
+                                bucket_id=bucket_id)
+        self.assertEqual(
+            self.pool.vshard_select('tester', 1001, bucket_id=bucket_id),
+            [[1001, bucket_id, 'Echo']])
+        self.assertEqual(
+            self.pool.vshard_select('tester', bucket_id, index='bucket_id',
+                                    bucket_id=bucket_id),
+            [[1001, bucket_id, 'Echo']])
+        self.assertEqual(
+            self.pool.vshard_delete('tester', 1001, bucket_id=bucket_id),
+            [1001, bucket_id, 'Echo'])
+        self.assertEqual(self.pool.vshard_select('tester', 1001, bucket_id=bucket_id), [])
+
+    def test_02_storage_error(self):
+        bucket_id = self.pool.bucket_id(1002)
+        self.pool.vshard_replace('tester', [1002, bucket_id, 'Alpha'], bucket_id=bucket_id)
+
+        with self.assertRaisesRegex(DatabaseError, 'Duplicate key exists'):
+            self.pool.vshard_insert('tester', [1002, bucket_id, 'Alpha'], bucket_id=bucket_id)
+
+    def test_03_stale_bucket_map(self):
+        bucket_id = self.pool.bucket_id(1003)
+        self.pool.vshard_replace('tester', [1003, bucket_id, 'Alpha'], bucket_id=bucket_id)
+
+        self.pool._buckets[bucket_id] = 'unknown replicaset'  # pylint: disable=protected-access
+        self.assertEqual(self.pool.vshard_select('tester', 1003, bucket_id=bucket_id),
+                         [[1003, bucket_id, 'Alpha']])
+
+    def test_04_invalid_index(self):
+        with self.assertRaisesRegex(ValueError, 'index must be an index name'):
+            self.pool.vshard_select('tester', 1, bucket_id=1, index=1)
+
+    def check_wrong_bucket(self, bucket_id, destination):
+        # pylint: disable=protected-access
+        send_to = self.pool._send_to
+        # The storage responds that the bucket has moved once.
+        responses = [mock.Mock(data=[None, {'type': 'ShardingError',
+                                            'code': VSHARD_WRONG_BUCKET,
+                                            'bucket_id': bucket_id,
+                                            'destination': destination}])]
+
+        def storage_response(*args):
+            if responses:
+                return responses.pop()
+            return send_to(*args)
+
+        with mock.patch.object(self.pool, '_send_to',
+                               side_effect=storage_response) as patched_send_to, \
+             mock.patch.object(self.pool, '_refresh_buckets',
+                               wraps=self.pool._refresh_buckets) as refresh:
+            self.assertEqual(self.pool.vshard_select('tester', 1005, bucket_id=bucket_id),
+                             [[1005, bucket_id, 'Alpha']])
+            self.assertEqual(patched_send_to.call_count, 2)
+            # The map is refreshed only if the destination is unknown.
+            self.assertEqual(refresh.call_count, 0 if destination else 1)
+
+    def test_05_wrong_bucket(self):
+        bucket_id = self.pool.bucket_id(1005)
+        self.pool.vshard_replace('tester', [1005, bucket_id, 'Alpha'], bucket_id=bucket_id)
+        uuid = self.pool._buckets[bucket_id]  # pylint: disable=protected-access
+
+        for destination in [uuid, None]:
+            with self.subTest(destination=destination):
+                self.check_wrong_bucket(bucket_id, destination)
+                self.assertEqual(self.pool._buckets[bucket_id], uuid)  # pylint: disable=protected-access
+
+    def test_05_box_error_not_retried(self):
+        bucket_id = self.pool.bucket_id(1005)
+        # ER_ILLEGAL_PARAMS has the same code as vshard WRONG_BUCKET.
+        response = mock.Mock(data=[None, {'type': 'ClientError',
+                                          'code': VSHARD_WRONG_BUCKET,
+                                          'message': 'Illegal parameters'}])
+
+        # pylint: disable=protected-access
+        with mock.patch.object(self.pool, '_send_to', return_value=response) as send_to, \
+             mock.patch.object(self.pool, '_bucket_moved') as bucket_moved:
+            with self.assertRaisesRegex(DatabaseError, 'Illegal parameters'):
+                self.pool.vshard_replace('tester', [1005, bucket_id, 'Alpha'],
+                                         bucket_id=bucket_id)
+            self.assertEqual(send_to.call_count, 1)
+            bucket_moved.assert_not_called()
+
+    def test_06_invalid_bucket_id(self):
+        self.pool.refresh_buckets()
+        for bucket_id in [0, self.pool.bucket_count + 1, '1', True]:
+            with self.subTest(bucket_id=bucket_id):
+                with self.assertRaisesRegex(ValueError, 'bucket_id must be an integer'):
+                    self.pool.vshard_select('tester', 1, bucket_id=bucket_id)
+
+    def test_07_missing_bucket(self):
+        # pylint: disable=protected-access
+        bucket_id = self.pool.bucket_id(1007)
+        self.pool.refresh_buckets()
+        refresh = self.pool._refresh_buckets
+
+        def refresh_without_bucket():
+            # The bucket is being moved: no storage reports it.
+            refresh()
+            del self.pool._buckets[bucket_id]
+
+        del self.pool._buckets[bucket_id]
+        with mock.patch.object(self.pool, '_refresh_buckets',
+                               side_effect=refresh_without_bucket) as patched:
+            for _ in range(3):
+                with self.assertRaisesRegex(PoolTolopogyError, "Can't find replicaset"):
+                    self.pool.vshard_select('tester', 1007, bucket_id=bucket_id)
+            self.assertEqual(patched.call_count, 1)
+
+        # The bucket is looked up again after a while.
+        time.sleep(POOL_BUCKETS_MISSING_DELAY)
+        self.assertEqual(self.pool.vshard_select('tester', 1007, bucket_id=bucket_id), [])
+
+    def tearDown(self):
+        self.pool.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.srv.stop()
+        cls.srv.clean()
@@ -50,6 +50,9 @@ class TestSuiteUUID(unittest.TestCase):
 
         cls.con = tarantool.Connection(cls.srv.host, cls.srv.args['primary'],
                                        user='test', password='test')
+        cls.con_raw = tarantool.Connection(cls.srv.host, cls.srv.args['primary'],
+                                           user='test', password='test',
+                                           raw_uuid=True)
 
     def setUp(self):
         # prevent a remote tarantool from clean our session
@@ -92,6 +95,17 @@ class TestSuiteUUID(unittest.TestCase):
                 self.assertEqual(unpacker_ext_hook(2, case['msgpack']),
                                  case['python'])
 
+    def test_msgpack_decode_raw(self):
+        for name, case in self.cases.items():
+            with self.subTest(msg=name):
+                res = unpacker_ext_hook(2, case['msgpack'], None,
+                                        self.con_raw.ext_types.decoders)
+                self.assertIsInstance(res, tarantool.RawUUID)
+                self.assertEqual(res.bytes, case['msgpack'])
+                self.assertEqual(res.uuid, case['python'])
+                self.assertEqual(res, case['python'])
+                self.assertEqual(hash(res), hash(case['python']))
+
     @skip_or_run_uuid_test
     def test_tarantool_decode(self):
         for name, case in self.cases.items():
@@ -107,6 +121,22 @@ class TestSuiteUUID(unittest.TestCase):
                 self.assertEqual(packer_default(case['python']),
                                  msgpack.ExtType(code=2, data=case['msgpack']))
 
+    def test_msgpack_encode_raw(self):
+        for name, case in self.cases.items():
+            with self.subTest(msg=name):
+                self.assertEqual(packer_default(tarantool.RawUUID(case['msgpack'])),
+                                 msgpack.ExtType(code=2, data=case['msgpack']))
+
+    @skip_or_run_uuid_test
+    def test_tarantool_decode_raw(self):
+        for name, case in self.cases.items():
+            with self.subTest(msg=name):
+                self.adm(f"box.space['test']:replace{{'{name}', {case['tarantool']}}}")
+
+                res = self.con_raw.select('test', name)
+                self.assertIsInstance(res[0][1], tarantool.RawUUID)
+                self.assertSequenceEqual(res, [[name, tarantool.RawUUID(case['msgpack'])]])
+
     @skip_or_run_uuid_test
     def test_tarantool_encode(self):
         for name, case in self.cases.items():
@@ -138,5 +168,6 @@ class TestSuiteUUID(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         cls.con.close()
+        cls.con_raw.close()
         cls.srv.stop()
         cls.srv.clean()